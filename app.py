@@ -10,10 +10,16 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 
 from hex_game.core.engine import HexEngine, GameState, Player
+from hex_game.core.backends import ENGINE_BACKENDS
 from hex_game.players.computer_player import ComputerPlayer
 from hex_game.storage.game_storage import MemoryStorage, FileStorage
 from hex_game.api.game_manager import GameManager
 from hex_game.api.config_manager import ConfigManager
+from hex_game.ai.parallel import configure_workers
+from hex_game.ai.ponder import configure_pondering
+from hex_game.ai.tablebase import configure_tablebase
+from hex_game.ai.book import configure_opening_book
+from hex_game.ai.cache import configure_ai_cache
 
 
 def create_app(config_name: str = 'development') -> Flask:
@@ -32,8 +38,29 @@ def create_app(config_name: str = 'development') -> Flask:
     else:
         storage = MemoryStorage()
     
+    # Liczba procesów przeszukiwania AI (pula tworzona raz, przy pierwszym ruchu)
+    configure_workers(app.config.get('AI_WORKERS', 1))
+    
+    # Myślenie AI w czasie ruchu człowieka (limit dla wszystkich sesji)
+    configure_pondering(app.config.get('AI_PONDER_WORKERS', 0),
+                        app.config.get('AI_PONDER_SECONDS', 10))
+    
+    # Tablice końcówek małych plansz (pliki mapowane w pamięci, otwierane leniwie)
+    configure_tablebase(app.config.get('TABLEBASE_DIR', 'tablebases'))
+    
+    # Książki otwarć (wczytywane przy pierwszej partii danego rozmiaru)
+    configure_opening_book(app.config.get('OPENING_BOOK_DIR', 'books'))
+    
+    # Wspólna pamięć wyników AI (ruchy współdzielone przez wszystkie sesje)
+    configure_ai_cache(app.config.get('AI_CACHE_SIZE', 10000))
+    
     # Inicjalizacja game managera
-    game_manager = GameManager(storage)
+    game_manager = GameManager(
+        storage,
+        app.config.get('ENGINE_BACKEND', 'standard'),
+        move_timeout=app.config.get('MOVE_TIMEOUT_SECONDS', 30),
+        ai_idle_seconds=app.config.get('AI_IDLE_SECONDS', 300),
+    )
     
     # Konfiguracja logowania
     if not app.debug:
@@ -67,7 +94,11 @@ def create_app(config_name: str = 'development') -> Flask:
         {
             "board_size": 11,
             "player1": {"type": "human", "name": "Gracz 1"},
-            "player2": {"type": "computer", "name": "AI", "difficulty": "medium"}
+            "player2": {"type": "computer", "name": "AI", "difficulty": "medium"},
+                        // difficulty: easy | medium | hard | advanced (alfa-beta)
+                        //   | expert (MCTS); opcjonalnie "time_limit" [s]
+                        //   lub "playouts" (expert) - budżet na ruch
+            "engine_backend": "bitboard"  // opcjonalne - domyślnie ENGINE_BACKEND
         }
         """
         try:
@@ -77,14 +108,21 @@ def create_app(config_name: str = 'development') -> Flask:
             
             # Walidacja danych
             board_size = data.get('board_size', 11)
-            if board_size < 3 or board_size > 25:
-                return jsonify({'error': 'Rozmiar planszy musi być między 3 a 25'}), 400
+            min_size = app.config.get('MIN_BOARD_SIZE', 3)
+            max_size = app.config.get('MAX_BOARD_SIZE', 25)
+            if not isinstance(board_size, int) or board_size < min_size or board_size > max_size:
+                return jsonify({'error': f'Rozmiar planszy musi być między {min_size} a {max_size}'}), 400
             
             player1_data = data.get('player1', {'type': 'human', 'name': 'Gracz 1'})
             player2_data = data.get('player2', {'type': 'computer', 'name': 'AI'})
             
+            engine_backend = data.get('engine_backend')
+            if engine_backend is not None and engine_backend not in ENGINE_BACKENDS:
+                return jsonify({'error': f'Nieznany backend silnika: {engine_backend}'}), 400
+            
             # Tworzenie gry
-            game_id = game_manager.create_game(board_size, player1_data, player2_data)
+            game_id = game_manager.create_game(board_size, player1_data, player2_data,
+                                               engine_backend)
             
             return jsonify({
                 'game_id': game_id,
@@ -111,9 +149,17 @@ def create_app(config_name: str = 'development') -> Flask:
     
     @app.route('/api/games/<game_id>', methods=['GET'])
     def get_game(game_id: str):
-        """Pobiera stan konkretnej gry"""
+        """
+        Pobiera stan konkretnej gry
+        
+        Query: ?connections=1 dołącza najkrótsze połączenia obu graczy,
+               ?evaluation=1 - ocenę pozycji (prawdopodobieństwo wygranej, pola gorsze)
+        """
         try:
-            game_state = game_manager.get_game_state(game_id)
+            include_connections = request.args.get('connections', '0') in ('1', 'true')
+            include_evaluation = request.args.get('evaluation', '0') in ('1', 'true')
+            game_state = game_manager.get_game_state(game_id, include_connections,
+                                                     include_evaluation)
             if not game_state:
                 return jsonify({'error': 'Gra nie została znaleziona'}), 404
             
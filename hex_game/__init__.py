@@ -4,15 +4,18 @@ Pakiet gry HEX
 Struktura:
 - core/: Główna logika gry (silnik)
 - players/: Implementacje różnych typów graczy
+- ai/: Algorytmy przeszukiwania (MCTS, alfa-beta) i ocena pozycji
 - ui/: Interfejsy użytkownika
 - storage/: Mechanizmy zapisu/odczytu
 - api/: Flask REST API (nowe)
+- benchmarks.py: Pomiary wydajności (python -m hex_game.benchmarks)
 """
 
 __version__ = "2.0.0"
 __author__ = "Student"
 
 from .core.engine import HexEngine, Player, GameState
+from .core.bitboard import BitboardEngine
 from .players import BasePlayer, HumanPlayer, ComputerPlayer
 from .ui import ConsoleUI
 from .storage import GameStorage, MemoryStorage, FileStorage
@@ -21,7 +24,7 @@ from .storage import GameStorage, MemoryStorage, FileStorage
 try:
     from .api import GameManager, ConfigManager
     __all__ = [
-        'HexEngine', 'Player', 'GameState',
+        'HexEngine', 'Player', 'GameState', 'BitboardEngine',
         'BasePlayer', 'HumanPlayer', 'ComputerPlayer',
         'ConsoleUI',
         'GameStorage', 'MemoryStorage', 'FileStorage',
@@ -30,7 +33,7 @@ try:
 except ImportError:
     # Flask dependencies nie są zainstalowane
     __all__ = [
-        'HexEngine', 'Player', 'GameState',
+        'HexEngine', 'Player', 'GameState', 'BitboardEngine',
         'BasePlayer', 'HumanPlayer', 'ComputerPlayer',
         'ConsoleUI',
         'GameStorage', 'MemoryStorage', 'FileStorage'
@@ -0,0 +1,30 @@
+"""
+Moduł algorytmów przeszukiwania AI
+"""
+
+from .mcts import MCTSSearch, MCTSNode, random_playout, filled_board_winner
+from .batch import NUMPY_AVAILABLE, batch_win_count, first_move_statistics
+from .scoring import best_cell, score_cells
+from .parallel import ParallelMCTSSearch, configure_workers, create_search, shutdown_executor
+from .ponder import configure_pondering, start_pondering
+from .alphabeta import AlphaBetaSearch
+from .connections import VirtualConnections
+from .inferior import analyse_cells, candidate_cells
+from .solver import ProofNumberSolver
+from .tablebase import Tablebase, configure_tablebase, get_tablebase
+from .book import OpeningBook, build_opening_book, configure_opening_book, get_opening_book
+from .cache import AIResultCache, configure_ai_cache, get_ai_cache
+from .evaluation import TwoDistanceEvaluator, connection_distance, evaluate
+
+__all__ = [
+    'MCTSSearch', 'MCTSNode', 'random_playout', 'filled_board_winner',
+    'NUMPY_AVAILABLE', 'batch_win_count', 'first_move_statistics',
+    'best_cell', 'score_cells',
+    'ParallelMCTSSearch', 'configure_workers', 'create_search', 'shutdown_executor',
+    'configure_pondering', 'start_pondering',
+    'analyse_cells', 'candidate_cells', 'ProofNumberSolver',
+    'Tablebase', 'configure_tablebase', 'get_tablebase',
+    'OpeningBook', 'build_opening_book', 'configure_opening_book', 'get_opening_book',
+    'AIResultCache', 'configure_ai_cache', 'get_ai_cache',
+    'AlphaBetaSearch', 'VirtualConnections', 'TwoDistanceEvaluator', 'connection_distance', 'evaluate'
+]
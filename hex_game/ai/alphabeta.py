@@ -0,0 +1,350 @@
+"""
+Deterministyczne przeszukiwanie alfa-beta dla gry HEX
+
+Negamax z cięciami alfa-beta i iteracyjnym pogłębianiem, tablicą transpozycji
+indeksowaną haszem Zobrista pozycji oraz porządkowaniem ruchów (ruch z tablicy
+transpozycji, ruchy "killer", heurystyka historii). Liście oceniane są
+odległością dwukrokową lub odległością połączenia (hex_game.ai.evaluation),
+a ruchy ograniczone do pól leżących blisko najkrótszych ścieżek obu graczy.
+Połączenia wirtualne (hex_game.ai.connections) dodatkowo zawężają ruchy:
+odpowiedzi na wtargnięcia w mostki idą pierwsze, nośniki własnych połączeń
+są pomijane, a gdy przeciwnik jest wirtualnie połączony - rozważany jest
+tylko obszar must_play. Pola martwe i przechwycone (hex_game.ai.inferior)
+są pomijane w całym drzewie, a zdominowane - w korzeniu.
+
+Przy braku terminu wynik zależy wyłącznie od pozycji (brak losowości), co
+pozwala odtwarzać partie w testach regresji i turniejach.
+"""
+
+import time
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from ..core.engine import HexEngine, Player
+from .connections import VirtualConnections
+from .evaluation import TwoDistanceEvaluator, evaluate, path_slack
+from .inferior import analyse_cells
+
+
+DEFAULT_DEPTH = 3  # Domyślna maksymalna głębokość (w półruchach)
+DEFAULT_BRANCHING = 10  # Liczba rozważanych ruchów w węźle
+TT_MAX_ENTRIES = 200000  # Limit rozmiaru tablicy transpozycji
+
+WIN_SCORE = 100000  # Ocena wygranej (pomniejszana o odległość w półruchach)
+
+# Ocena liści: odległość połączenia (0-1 BFS) lub odległość dwukrokowa
+# (silniejsza przy tym samym czasie: głębokość 3 z 'two_distance' wygrywa
+# z głębokością 4 z 'distance' - patrz hex_game.benchmarks)
+EVALUATORS = ('distance', 'two_distance')
+DEFAULT_EVALUATOR = 'two_distance'
+
+# Rodzaje wpisów tablicy transpozycji
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+# Co ile węzłów sprawdzany jest termin
+_DEADLINE_CHECK_MASK = 63
+
+
+class _SearchTimeout(Exception):
+    """Przerwanie iteracji po upływie terminu"""
+
+
+class AlphaBetaSearch:
+    """
+    Przeszukiwanie alfa-beta z iteracyjnym pogłębianiem
+    
+    Tablica transpozycji i heurystyka historii są zachowywane pomiędzy
+    ruchami, więc kolejne przeszukiwania w tej samej partii są tańsze
+    (reset_tables zwalnia je, np. gdy sesja gry jest bezczynna).
+    """
+    
+    def __init__(self, max_depth: int = DEFAULT_DEPTH, time_limit: Optional[float] = None,
+                 branching: int = DEFAULT_BRANCHING, evaluator: str = DEFAULT_EVALUATOR,
+                 virtual_connections: bool = True, inferior_cells: bool = True):
+        """
+        Args:
+            max_depth: Maksymalna głębokość iteracyjnego pogłębiania
+            time_limit: Limit czasu na ruch w sekundach (None = bez limitu)
+            branching: Liczba rozważanych ruchów w węźle
+            evaluator: Ocena liści i porządkowanie ruchów ('distance' lub
+                'two_distance' - TwoDistanceEvaluator aktualizowany przyrostowo)
+            virtual_connections: Czy zawężać ruchy połączeniami wirtualnymi
+            inferior_cells: Czy pomijać pola martwe, przechwycone i zdominowane
+        """
+        if max_depth < 1:
+            raise ValueError("Głębokość musi być co najmniej 1")
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError("Limit czasu musi być dodatni")
+        if branching < 1:
+            raise ValueError("Liczba rozważanych ruchów musi być co najmniej 1")
+        if evaluator not in EVALUATORS:
+            raise ValueError(f"Dostępne oceny pozycji: {', '.join(EVALUATORS)}")
+        
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.branching = branching
+        self.evaluator = evaluator
+        self.virtual_connections = virtual_connections
+        self.inferior_cells = inferior_cells
+        self._two_distance: Optional[TwoDistanceEvaluator] = None
+        self._connections: Optional[VirtualConnections] = None
+        self._excluded: FrozenSet[int] = frozenset()
+        
+        # Wpisy: hasz -> (głębokość, ocena, rodzaj, najlepszy ruch)
+        self.transpositions: Dict[int, Tuple[int, int, int, Optional[int]]] = {}
+        self.history: Dict[int, int] = {}
+        self._killers: List[List[int]] = []
+        self._deadline: Optional[float] = None
+        self._nodes = 0
+        
+        # Statystyki ostatniego wyszukiwania
+        self.last_nodes = 0
+        self.last_depth = 0
+        self.last_score = 0
+        self.last_elapsed = 0.0
+    
+    def search(self, engine: HexEngine, deadline: Optional[float] = None) -> int:
+        """
+        Wyszukuje najlepszy ruch dla gracza na ruchu
+        
+        Zwracany jest najlepszy ruch ostatniej ukończonej iteracji (anytime).
+        
+        Args:
+            engine: Silnik gry (nie jest modyfikowany)
+            deadline: Zewnętrzny termin jako czas time.perf_counter()
+                (obowiązuje wcześniejszy z terminu i time_limit)
+        
+        Returns:
+            Płaski indeks wybranego pola
+        """
+        if engine.get_empty_count() == 0:
+            raise ValueError("Brak dostępnych ruchów")
+        
+        start = time.perf_counter()
+        if self.time_limit is not None:
+            own_deadline = start + self.time_limit
+            deadline = own_deadline if deadline is None else min(deadline, own_deadline)
+        self._deadline = deadline
+        self._nodes = 0
+        if len(self.transpositions) > TT_MAX_ENTRIES:
+            self.transpositions.clear()
+        
+        simulation = engine.fork()
+        if self.evaluator == 'two_distance':
+            self._two_distance = TwoDistanceEvaluator(simulation)
+        if self.virtual_connections:
+            self._connections = VirtualConnections(simulation)
+        if self.inferior_cells:
+            inferior = analyse_cells(simulation)
+            self._excluded = inferior.pruned()
+            root_moves = self._candidate_moves(simulation)
+            self._excluded = inferior.settled()
+        else:
+            self._excluded = frozenset()
+            root_moves = self._candidate_moves(simulation)
+        best_move, best_score = root_moves[0], 0
+        completed_depth = 0
+        
+        for depth in range(1, self.max_depth + 1):
+            self._killers = [[] for _ in range(depth + 1)]
+            try:
+                move, score = self._search_root(simulation, root_moves, depth)
+            except _SearchTimeout:
+                break
+            best_move, best_score = move, score
+            completed_depth = depth
+            
+            # Najlepszy ruch jako pierwszy w kolejnej iteracji
+            root_moves.remove(move)
+            root_moves.insert(0, move)
+            if abs(score) >= WIN_SCORE - self.max_depth:
+                break  # Wynik rozstrzygnięty
+        
+        # Stan pomocniczy pozycji nie jest potrzebny do kolejnego ruchu
+        self._two_distance = None
+        self._connections = None
+        self._killers = []
+        
+        self.last_nodes = self._nodes
+        self.last_depth = completed_depth
+        self.last_score = best_score
+        self.last_elapsed = time.perf_counter() - start
+        return best_move
+    
+    def reset_tables(self) -> None:
+        """Porzuca tablicę transpozycji i heurystykę historii"""
+        self.transpositions = {}
+        self.history = {}
+    
+    def _search_root(self, simulation: HexEngine, root_moves: List[int],
+                     depth: int) -> Tuple[int, int]:
+        """Przeszukuje ruchy korzenia na zadaną głębokość"""
+        alpha, beta = -WIN_SCORE - 1, WIN_SCORE + 1
+        best_move, best_score = root_moves[0], -WIN_SCORE - 1
+        for cell in root_moves:
+            self._push(simulation, cell)
+            if simulation.winner is not None:
+                score = WIN_SCORE
+            else:
+                score = -self._negamax(simulation, depth - 1, -beta, -alpha, 1)
+            self._pop(simulation)
+            if score > best_score:
+                best_move, best_score = cell, score
+                alpha = max(alpha, score)
+        self._store(simulation.get_position_hash(), depth, best_score, EXACT, best_move)
+        return best_move, best_score
+    
+    def _negamax(self, simulation: HexEngine, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """
+        Negamax z cięciami alfa-beta
+        
+        Returns:
+            Ocena pozycji z perspektywy gracza na ruchu
+        """
+        self._nodes += 1
+        if (not self._nodes & _DEADLINE_CHECK_MASK and self._deadline is not None
+                and time.perf_counter() >= self._deadline):
+            raise _SearchTimeout()
+        
+        if depth == 0:
+            if self._two_distance is not None:
+                return self._two_distance.score(simulation.current_player)
+            return evaluate(simulation)
+        
+        key = simulation.get_position_hash()
+        entry = self.transpositions.get(key)
+        tt_move = None
+        if entry is not None:
+            entry_depth, entry_score, entry_kind, tt_move = entry
+            if entry_depth >= depth:
+                if entry_kind == EXACT:
+                    return entry_score
+                if entry_kind == LOWER_BOUND:
+                    alpha = max(alpha, entry_score)
+                else:
+                    beta = min(beta, entry_score)
+                if alpha >= beta:
+                    return entry_score
+        
+        original_alpha = alpha
+        best_score, best_move = -WIN_SCORE - 1, None
+        for cell in self._ordered_moves(simulation, ply, tt_move):
+            self._push(simulation, cell)
+            if simulation.winner is not None:
+                score = WIN_SCORE - ply
+            else:
+                score = -self._negamax(simulation, depth - 1, -beta, -alpha, ply + 1)
+            self._pop(simulation)
+            
+            if score > best_score:
+                best_score, best_move = score, cell
+            if best_score > alpha:
+                alpha = best_score
+            if alpha >= beta:
+                self._record_cutoff(cell, depth, ply)
+                break
+        
+        if best_score <= original_alpha:
+            kind = UPPER_BOUND
+        elif best_score >= beta:
+            kind = LOWER_BOUND
+        else:
+            kind = EXACT
+        self._store(key, depth, best_score, kind, best_move)
+        return best_score
+    
+    def _push(self, simulation: HexEngine, cell: int) -> None:
+        """Wykonuje ruch na silniku i (opcjonalnie) w strukturach przyrostowych"""
+        if self._two_distance is not None:
+            self._two_distance.play(cell, simulation.current_player.value)
+        if self._connections is not None:
+            self._connections.play(cell, simulation.current_player.value)
+        simulation.push_cell(cell)
+    
+    def _pop(self, simulation: HexEngine) -> None:
+        """Cofa ostatni ruch na silniku i w strukturach przyrostowych"""
+        simulation.pop_move()
+        if self._two_distance is not None:
+            self._two_distance.undo()
+        if self._connections is not None:
+            self._connections.undo()
+    
+    def _store(self, key: int, depth: int, score: int, kind: int, move: Optional[int]) -> None:
+        """Zapisuje wynik w tablicy transpozycji (głębszy wpis ma pierwszeństwo)"""
+        entry = self.transpositions.get(key)
+        if entry is None or entry[0] <= depth:
+            self.transpositions[key] = (depth, score, kind, move)
+    
+    def _record_cutoff(self, cell: int, depth: int, ply: int) -> None:
+        """Aktualizuje ruchy "killer" i heurystykę historii po cięciu"""
+        killers = self._killers[ply]
+        if cell not in killers:
+            killers.insert(0, cell)
+            del killers[2:]
+        self.history[cell] = self.history.get(cell, 0) + depth * depth
+    
+    def _candidate_moves(self, simulation: HexEngine) -> List[int]:
+        """
+        Wybiera ruchy leżące najbliżej najkrótszych ścieżek obu graczy
+        
+        Pola wykluczone analizą pól gorszych są pomijane. Przy połączeniach
+        wirtualnych odpowiedzi na wtargnięcia są pierwsze, nośniki własnych
+        połączeń pomijane, a ruchy ograniczone do must_play.
+        
+        Returns:
+            Co najwyżej `branching` pól, od najbardziej obiecującego
+        """
+        mover = simulation.current_player
+        opponent = Player.PLAYER2 if mover == Player.PLAYER1 else Player.PLAYER1
+        moves = simulation.get_empty_indices()
+        if self._excluded:
+            moves = [cell for cell in moves if cell not in self._excluded] or moves
+        responses: List[int] = []
+        if self._connections is not None:
+            connections = self._connections
+            must_play = connections.must_play(mover)
+            if must_play:
+                moves = [cell for cell in moves if cell in must_play] or moves
+            own_carriers = connections.carrier_cells(mover)
+            useful = [cell for cell in moves if cell not in own_carriers]
+            if useful:
+                moves = useful
+            allowed = set(moves) if must_play else None
+            responses = [cell for cell in connections.intrusion_responses(mover)
+                         if (allowed is None or cell in allowed)
+                         and cell not in self._excluded]
+        
+        if self._two_distance is not None:
+            own_slack = self._two_distance.cell_slack(mover)
+            opponent_slack = self._two_distance.cell_slack(opponent)
+        else:
+            _, own_slack = path_slack(simulation, mover)
+            _, opponent_slack = path_slack(simulation, opponent)
+        ranked = sorted(
+            moves,
+            key=lambda cell: (min(own_slack[cell], opponent_slack[cell]),
+                              own_slack[cell] + opponent_slack[cell], cell),
+        )
+        if responses:
+            ranked = responses + [cell for cell in ranked if cell not in responses]
+        return ranked[:self.branching]
+    
+    def _ordered_moves(self, simulation: HexEngine, ply: int,
+                       tt_move: Optional[int]) -> List[int]:
+        """Porządkuje kandydatów: ruch z tablicy transpozycji, "killer", historia"""
+        moves = self._candidate_moves(simulation)
+        killers = self._killers[ply] if ply < len(self._killers) else []
+        history = self.history
+        rank = {cell: index for index, cell in enumerate(moves)}
+        
+        def priority(cell: int) -> Tuple[int, int, int]:
+            if cell == tt_move:
+                return (0, 0, 0)
+            if cell in killers:
+                return (1, killers.index(cell), 0)
+            return (2, -history.get(cell, 0), rank[cell])
+        
+        moves.sort(key=priority)
+        if tt_move is not None and tt_move not in rank and simulation.is_empty_cell(
+                *simulation.topology.coords[tt_move]):
+            moves.insert(0, tt_move)
+        return moves
@@ -0,0 +1,169 @@
+"""
+Wsadowe (wektorowe) rozgrywki losowe z użyciem NumPy
+
+Jedno wywołanie wypełnia K plansz naraz losowymi permutacjami pustych pól
+i wyznacza K zwycięzców propagacją etykiet po tablicach sąsiedztwa (zasięg
+gracza 1 od górnej krawędzi rozszerzany jest o sąsiadów aż do zbieżności).
+Zastępuje to tysiące rozgrywek w czystym Pythonie. Działa wyłącznie na CPU;
+jeśli NumPy nie jest zainstalowany, te same funkcje wykonują rozgrywki
+pojedynczo (wolniej, ale z identycznym API).
+"""
+
+import random
+from typing import Dict, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy jest opcjonalny
+    np = None
+
+from ..core.engine import HexEngine
+from ..core.topology import HexTopology
+from .mcts import filled_board_winner
+
+
+NUMPY_AVAILABLE = np is not None
+DEFAULT_BATCH_SIZE = 256  # Liczba plansz w jednym wywołaniu
+DEFAULT_LEAF_BATCH = 32  # Liczba rozgrywek na liść MCTS (poziom 'expert')
+
+
+class BatchPlayouts:
+    """Tablice NumPy jednego rozmiaru planszy dla rozgrywek wsadowych"""
+    
+    def __init__(self, topology: HexTopology):
+        """
+        Args:
+            topology: Topologia planszy
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("Rozgrywki wsadowe wymagają pakietu numpy")
+        cells = topology.cells
+        self.topology = topology
+        # Sąsiedzi jako tablica (cells + 1, 6); brakujący sąsiad wskazuje
+        # na dodatkowy wiersz `cells`, który nigdy nie należy do gracza
+        self.neighbors = np.full((cells + 1, 6), cells, dtype=np.intp)
+        for cell, cell_neighbors in enumerate(topology.neighbors):
+            self.neighbors[cell, :len(cell_neighbors)] = cell_neighbors
+        self.top = np.zeros((cells + 1, 1), dtype=bool)
+        self.top[list(topology.top_cells)] = True
+        self.bottom = np.zeros((cells + 1, 1), dtype=bool)
+        self.bottom[list(topology.bottom_cells)] = True
+    
+    def run(self, engine: HexEngine, count: int, rng: random.Random):
+        """
+        Rozgrywa `count` losowych wypełnień pozycji
+        
+        Puste pola są losowo permutowane; pierwsza połowa (zaokrąglona w górę)
+        należy do gracza na ruchu, a pierwsze pole permutacji to jego
+        "pierwszy ruch".
+        
+        Returns:
+            Krotka (pierwsze ruchy [count], czy wygrał gracz na ruchu [count])
+        """
+        cells = self.topology.cells
+        empty = np.array(engine.get_empty_indices(), dtype=np.intp)
+        mover = engine.current_player.value
+        generator = np.random.default_rng(rng.getrandbits(64))
+        
+        # Kolumny to plansze: kopiowanie całych wierszy przy zbieraniu sąsiadów
+        order = generator.random((len(empty), count)).argsort(axis=0)
+        half = (len(empty) + 1) // 2
+        board = np.frombuffer(bytes(engine.cells), dtype=np.uint8)
+        player1 = np.zeros((cells + 1, count), dtype=bool)
+        player1[:cells] = (board == 1)[:, None]
+        player1[empty[order[:half]], np.arange(count)] = mover == 1
+        player1[empty[order[half:]], np.arange(count)] = mover != 1
+        
+        # Propagacja zasięgu gracza 1 od górnej krawędzi
+        reach = player1 & self.top
+        neighbors = self.neighbors
+        while True:
+            grown = reach | reach[neighbors[:, 0]]
+            for column in range(1, 6):
+                grown |= reach[neighbors[:, column]]
+            grown &= player1
+            if np.array_equal(grown, reach):
+                break
+            reach = grown
+        
+        player1_wins = (reach & self.bottom).any(axis=0)
+        mover_wins = player1_wins if mover == 1 else ~player1_wins
+        return empty[order[0]], mover_wins
+
+
+_BATCHES: Dict[int, 'BatchPlayouts'] = {}
+
+
+def get_batch_playouts(topology: HexTopology) -> BatchPlayouts:
+    """Zwraca (wspólne) tablice rozgrywek wsadowych dla rozmiaru planszy"""
+    batch = _BATCHES.get(topology.board_size)
+    if batch is None:
+        batch = BatchPlayouts(topology)
+        _BATCHES[topology.board_size] = batch
+    return batch
+
+
+def batch_win_count(engine: HexEngine, count: int, rng: random.Random) -> int:
+    """
+    Zwraca liczbę wygranych gracza na ruchu w `count` losowych rozgrywkach
+    
+    Args:
+        engine: Silnik w pozycji początkowej (nie jest modyfikowany)
+        count: Liczba rozgrywek
+        rng: Generator liczb losowych
+    
+    Returns:
+        Liczba wygranych gracza na ruchu
+    """
+    if NUMPY_AVAILABLE:
+        _, mover_wins = get_batch_playouts(engine.topology).run(engine, count, rng)
+        return int(mover_wins.sum())
+    
+    mover = engine.current_player.value
+    return sum(_python_playout(engine, rng)[1] == mover for _ in range(count))
+
+
+def first_move_statistics(engine: HexEngine, count: int = DEFAULT_BATCH_SIZE,
+                          rng: Optional[random.Random] = None) -> Dict[int, Tuple[int, int]]:
+    """
+    Zwraca statystyki wygranych według pierwszego ruchu gracza na ruchu
+    
+    Args:
+        engine: Silnik w pozycji początkowej (nie jest modyfikowany)
+        count: Liczba rozgrywek
+        rng: Generator liczb losowych
+    
+    Returns:
+        Słownik {pole: (rozgrywki, wygrane gracza na ruchu)}
+    """
+    rng = rng or random.Random()
+    statistics: Dict[int, Tuple[int, int]] = {}
+    if NUMPY_AVAILABLE:
+        first_moves, mover_wins = get_batch_playouts(engine.topology).run(engine, count, rng)
+        cells = engine.topology.cells
+        visits = np.bincount(first_moves, minlength=cells)
+        wins = np.bincount(first_moves, weights=mover_wins, minlength=cells)
+        for cell in np.flatnonzero(visits):
+            statistics[int(cell)] = (int(visits[cell]), int(wins[cell]))
+        return statistics
+    
+    mover = engine.current_player.value
+    for _ in range(count):
+        first_move, winner = _python_playout(engine, rng)
+        visits, wins = statistics.get(first_move, (0, 0))
+        statistics[first_move] = (visits + 1, wins + (winner == mover))
+    return statistics
+
+
+def _python_playout(engine: HexEngine, rng: random.Random) -> Tuple[int, int]:
+    """Pojedyncza rozgrywka bez NumPy: (pierwszy ruch, zwycięzca)"""
+    board = bytearray(engine.cells)
+    empty = engine.get_empty_indices()
+    rng.shuffle(empty)
+    mover = engine.current_player.value
+    half = (len(empty) + 1) // 2
+    for cell in empty[:half]:
+        board[cell] = mover
+    for cell in empty[half:]:
+        board[cell] = 3 - mover
+    return empty[0], filled_board_winner(board, engine.topology)
@@ -0,0 +1,230 @@
+"""
+Książki otwarć (osobne dla każdego rozmiaru planszy)
+
+Książka to plik JSON przypisujący haszowi kanonicznemu pozycji ruch
+wybrany przez przeszukiwanie. Książki budowane są offline z partii
+samogrania: każda pozycja z pierwszych `plies` półruchów jest raz
+przeszukiwana, a partie rozgałęziają się losowymi ruchami spośród pól
+nie gorszych (hex_game.ai.inferior), by objąć typowe odpowiedzi.
+W grze pozycja z książki dostaje ruch bez przeszukiwania.
+
+Plik jest wczytywany leniwie - przy pierwszym ruchu AI na danym rozmiarze
+planszy. Ruchy zapisane są w orientacji haszu kanonicznego
+(HexEngine.to_canonical_cell).
+
+Format pliku book<N>.json:
+    {"board_size": N, "positions": {"<hasz szesnastkowo>": {"move": pole, "visits": liczba}}}
+
+Budowanie (offline):
+    python -m hex_game.ai.book --sizes 11 13 --plies 4 --games 100 --output books
+"""
+
+import json
+import os
+import random
+import threading
+from typing import Dict, List, Optional
+
+from ..core.engine import HexEngine
+from .alphabeta import AlphaBetaSearch
+from .inferior import candidate_cells
+
+
+DEFAULT_PLIES = 4  # Liczba półruchów objętych książką
+DEFAULT_GAMES = 100  # Liczba partii samogrania przy budowie
+DEFAULT_EXPLORATION = 0.3  # Prawdopodobieństwo losowego ruchu w samograniu
+DEFAULT_SEARCH_SECONDS = 2.0  # Czas przeszukiwania jednej pozycji przy budowie [s]
+
+# Katalog książek (Config.OPENING_BOOK_DIR; None = wyłączone) i wczytane książki
+_BOOK_DIR: Optional[str] = None
+_BOOKS: Dict[int, Optional['OpeningBook']] = {}
+_BOOKS_LOCK = threading.Lock()
+
+
+def book_path(directory: str, board_size: int) -> str:
+    """Zwraca ścieżkę pliku książki dla rozmiaru planszy"""
+    return os.path.join(directory, f"book{board_size}.json")
+
+
+class OpeningBook:
+    """Książka otwarć jednego rozmiaru planszy"""
+    
+    def __init__(self, board_size: int, positions: Optional[Dict[int, Dict[str, int]]] = None):
+        """
+        Args:
+            board_size: Rozmiar planszy
+            positions: Hasz kanoniczny -> {'move': pole, 'visits': liczba wystąpień}
+        """
+        self.board_size = board_size
+        self.positions: Dict[int, Dict[str, int]] = positions or {}
+    
+    def __len__(self) -> int:
+        return len(self.positions)
+    
+    @classmethod
+    def load(cls, path: str) -> 'OpeningBook':
+        """Wczytuje książkę z pliku JSON"""
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        try:
+            positions = {int(key, 16): {'move': int(entry['move']), 'visits': int(entry['visits'])}
+                         for key, entry in data['positions'].items()}
+            return cls(int(data['board_size']), positions)
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Nieprawidłowy plik książki otwarć: {path}") from e
+    
+    def save(self, path: str) -> None:
+        """Zapisuje książkę do pliku JSON (zapis atomowy)"""
+        data = {
+            'board_size': self.board_size,
+            'positions': {f"{key:016x}": entry for key, entry in sorted(self.positions.items())},
+        }
+        temporary = path + '.tmp'
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=1)
+        os.replace(temporary, path)
+    
+    def lookup(self, engine: HexEngine) -> Optional[int]:
+        """
+        Zwraca ruch z książki dla pozycji
+        
+        Args:
+            engine: Silnik gry
+        
+        Returns:
+            Płaski indeks pola lub None, jeśli pozycji nie ma w książce
+        """
+        if engine.board_size != self.board_size:
+            return None
+        entry = self.positions.get(engine.get_canonical_hash())
+        if entry is None:
+            return None
+        cell = engine.to_canonical_cell(entry['move'])
+        return cell if engine.cells[cell] == 0 else None  # Ochrona przed kolizją haszy
+    
+    def add(self, engine: HexEngine, cell: int) -> None:
+        """Zapisuje ruch dla pozycji (lub zlicza kolejne wystąpienie znanej pozycji)"""
+        key = engine.get_canonical_hash()
+        entry = self.positions.get(key)
+        if entry is None:
+            self.positions[key] = {'move': engine.to_canonical_cell(cell), 'visits': 1}
+        else:
+            entry['visits'] += 1
+
+
+def configure_opening_book(directory: Optional[str]) -> None:
+    """
+    Ustawia katalog książek otwarć dla całego procesu
+    
+    Args:
+        directory: Katalog z plikami book<N>.json (None = wyłączone)
+    """
+    global _BOOK_DIR
+    with _BOOKS_LOCK:
+        _BOOKS.clear()
+        _BOOK_DIR = directory
+
+
+def get_opening_book(board_size: int) -> Optional[OpeningBook]:
+    """
+    Zwraca książkę dla rozmiaru planszy (wczytywaną przy pierwszym użyciu)
+    
+    Returns:
+        Książka lub None, jeśli książki są wyłączone albo brak pliku
+    """
+    if _BOOK_DIR is None:
+        return None
+    book = _BOOKS.get(board_size)
+    if book is None and board_size not in _BOOKS:
+        with _BOOKS_LOCK:
+            if board_size not in _BOOKS:
+                path = book_path(_BOOK_DIR, board_size)
+                _BOOKS[board_size] = OpeningBook.load(path) if os.path.exists(path) else None
+            book = _BOOKS[board_size]
+    return book
+
+
+def build_opening_book(board_size: int, plies: int = DEFAULT_PLIES, games: int = DEFAULT_GAMES,
+                       search=None, exploration: float = DEFAULT_EXPLORATION,
+                       seed: Optional[int] = None,
+                       book: Optional[OpeningBook] = None) -> OpeningBook:
+    """
+    Buduje (lub rozszerza) książkę otwarć z partii samogrania
+    
+    Args:
+        board_size: Rozmiar planszy
+        plies: Liczba półruchów objętych książką
+        games: Liczba partii samogrania
+        search: Przeszukiwanie z metodą search(engine) (domyślnie alfa-beta
+            z limitem DEFAULT_SEARCH_SECONDS na pozycję)
+        exploration: Prawdopodobieństwo zagrania losowego pola nie gorszego
+            zamiast ruchu z książki (rozgałęzienie partii)
+        seed: Ziarno losowania ruchów
+        book: Istniejąca książka do rozszerzenia
+    
+    Returns:
+        Książka otwarć
+    """
+    if plies < 1:
+        raise ValueError("Książka musi obejmować co najmniej 1 półruch")
+    if games < 1:
+        raise ValueError("Liczba partii musi być co najmniej 1")
+    if not 0 <= exploration <= 1:
+        raise ValueError("Prawdopodobieństwo musi być w przedziale [0, 1]")
+    
+    rng = random.Random(seed)
+    search = search or AlphaBetaSearch(time_limit=DEFAULT_SEARCH_SECONDS)
+    if book is None:
+        book = OpeningBook(board_size)
+    if book.board_size != board_size:
+        raise ValueError("Rozmiar planszy nie pasuje do książki")
+    
+    for _ in range(games):
+        engine = HexEngine(board_size)
+        for _ in range(plies):
+            if engine.winner is not None:
+                break
+            cell = book.lookup(engine)
+            if cell is None:
+                cell = search.search(engine)
+            book.add(engine, cell)
+            if rng.random() < exploration:
+                cell = rng.choice(candidate_cells(engine))
+            engine.push_cell(cell)
+    return book
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Budowa książek otwarć (wiersz poleceń)"""
+    import argparse
+    import time
+    from .mcts import MCTSSearch
+    
+    parser = argparse.ArgumentParser(description='Budowa książek otwarć HEX')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[11, 13], help='Rozmiary planszy')
+    parser.add_argument('--plies', type=int, default=DEFAULT_PLIES, help='Liczba półruchów')
+    parser.add_argument('--games', type=int, default=DEFAULT_GAMES, help='Liczba partii samogrania')
+    parser.add_argument('--search', default='alphabeta', choices=['alphabeta', 'mcts'],
+                        help='Przeszukiwanie wyznaczające ruchy')
+    parser.add_argument('--seconds', type=float, default=DEFAULT_SEARCH_SECONDS,
+                        help='Czas przeszukiwania jednej pozycji [s]')
+    parser.add_argument('--seed', type=int, default=None, help='Ziarno losowania')
+    parser.add_argument('--output', default='books', help='Katalog docelowy')
+    args = parser.parse_args(argv)
+    
+    os.makedirs(args.output, exist_ok=True)
+    for size in args.sizes:
+        path = book_path(args.output, size)
+        book = OpeningBook.load(path) if os.path.exists(path) else None
+        if args.search == 'mcts':
+            search = MCTSSearch(playouts=None, time_limit=args.seconds, seed=args.seed)
+        else:
+            search = AlphaBetaSearch(time_limit=args.seconds)
+        start = time.perf_counter()
+        book = build_opening_book(size, args.plies, args.games, search, seed=args.seed, book=book)
+        book.save(path)
+        print(f"{size}x{size}: {len(book)} pozycji, {time.perf_counter() - start:.1f} s -> {path}")
+
+
+if __name__ == '__main__':
+    main()
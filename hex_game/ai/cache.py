@@ -0,0 +1,164 @@
+"""
+Wspólna pamięć wyników AI (dla wszystkich sesji procesu)
+
+Wynik ruchu komputera - wybrane pole i jego ocena - zapamiętywany jest pod
+kluczem (rozmiar planszy, hasz kanoniczny pozycji, poziom trudności,
+budżet). Pozycja i jej obrót o 180° mają wspólny wpis, więc pole zapisane
+jest w orientacji haszu kanonicznego (HexEngine.to_canonical_cell) i obracane
+przy odczycie. Wpisy są niezmiennymi krotkami - bezpieczne do współdzielenia
+pomiędzy sesjami i wątkami.
+
+Po przekroczeniu limitu wpisów usuwany jest najdawniej używany (LRU).
+Poziom 'easy' nie korzysta z pamięci - jego ruchy mają pozostać losowe.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from ..core.engine import HexEngine
+
+
+DEFAULT_MAX_ENTRIES = 10000  # Domyślny limit wpisów pamięci wyników
+
+# Klucz wpisu: (rozmiar planszy, hasz kanoniczny, poziom trudności, budżet)
+CacheKey = Tuple[int, int, str, Hashable]
+
+
+class AIResultCache:
+    """Pamięć wyników AI z usuwaniem najdawniej używanych wpisów"""
+    
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            max_entries: Maksymalna liczba wpisów (0 = pamięć wyłączona)
+        """
+        if max_entries < 0:
+            raise ValueError("Limit wpisów nie może być ujemny")
+        
+        self.max_entries = max_entries
+        # Wpisy: klucz -> (pole w orientacji haszu kanonicznego, ocena)
+        self._entries: 'OrderedDict[CacheKey, Tuple[int, Optional[float]]]' = OrderedDict()
+        self._entry_bytes = 0  # Przybliżony rozmiar kluczy i wartości wpisów
+        self._lock = threading.Lock()
+        
+        # Statystyki
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @property
+    def enabled(self) -> bool:
+        """Czy pamięć przechowuje wpisy"""
+        return self.max_entries > 0
+    
+    @staticmethod
+    def _key(engine: HexEngine, difficulty: str, budget: Hashable) -> CacheKey:
+        """Wyznacza klucz wpisu dla pozycji"""
+        return (engine.board_size, engine.get_canonical_hash(), difficulty, budget)
+    
+    @staticmethod
+    def _size_of(key: CacheKey, value: Tuple[int, Optional[float]]) -> int:
+        """Przybliżony rozmiar wpisu w bajtach (krotki i ich elementy)"""
+        return (sys.getsizeof(key) + sum(sys.getsizeof(item) for item in key)
+                + sys.getsizeof(value) + sum(sys.getsizeof(item) for item in value))
+    
+    def lookup(self, engine: HexEngine, difficulty: str,
+               budget: Hashable = None) -> Optional[Tuple[int, Optional[float]]]:
+        """
+        Zwraca zapamiętany wynik dla pozycji
+        
+        Args:
+            engine: Silnik gry
+            difficulty: Poziom trudności
+            budget: Budżet przeszukiwania (np. ComputerPlayer.budget)
+        
+        Returns:
+            Krotka (płaski indeks pola, ocena) lub None, jeśli wyniku nie ma
+        """
+        if not self.enabled:
+            return None
+        key = self._key(engine, difficulty, budget)
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                cell = engine.to_canonical_cell(value[0])
+                if engine.cells[cell] == 0:  # Ochrona przed kolizją haszy
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return cell, value[1]
+            self.misses += 1
+        return None
+    
+    def store(self, engine: HexEngine, difficulty: str, budget: Hashable,
+              cell: int, score: Optional[float] = None) -> None:
+        """
+        Zapamiętuje wynik dla pozycji
+        
+        Args:
+            engine: Silnik gry w pozycji przed ruchem
+            difficulty: Poziom trudności
+            budget: Budżet przeszukiwania
+            cell: Płaski indeks wybranego pola
+            score: Ocena ruchu (skala zależna od poziomu; None = brak)
+        """
+        if not self.enabled:
+            return
+        key = self._key(engine, difficulty, budget)
+        value = (engine.to_canonical_cell(cell), score)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._entry_bytes -= self._size_of(key, previous)
+            self._entries[key] = value
+            self._entry_bytes += self._size_of(key, value)
+            while len(self._entries) > self.max_entries:
+                old_key, old_value = self._entries.popitem(last=False)
+                self._entry_bytes -= self._size_of(old_key, old_value)
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """Usuwa wszystkie wpisy i zeruje statystyki"""
+        with self._lock:
+            self._entries.clear()
+            self._entry_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Zwraca statystyki pamięci (trafienia, chybienia, rozmiar)"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'miss_rate': self.misses / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'memory_bytes': sys.getsizeof(self._entries) + self._entry_bytes,
+            }
+
+
+# Pamięć wyników procesu (Config.AI_CACHE_SIZE)
+_CACHE = AIResultCache()
+
+
+def configure_ai_cache(max_entries: int) -> None:
+    """
+    Ustawia pamięć wyników AI dla całego procesu (poprzednie wpisy są usuwane)
+    
+    Args:
+        max_entries: Maksymalna liczba wpisów (0 = pamięć wyłączona)
+    """
+    global _CACHE
+    _CACHE = AIResultCache(max_entries)
+
+
+def get_ai_cache() -> AIResultCache:
+    """Zwraca pamięć wyników AI procesu"""
+    return _CACHE
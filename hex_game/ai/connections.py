@@ -0,0 +1,202 @@
+"""
+Połączenia wirtualne (mostki i szablony krawędzi) aktualizowane przyrostowo
+
+Połączenie wirtualne to para "nośników" - pustych pól, z których gracz
+potrzebuje tylko jednego: mostek łączy dwa kamienie mające dwóch wspólnych
+pustych sąsiadów, a szablon krawędzi łączy kamień z drugiego rzędu z własną
+krawędzią przez dwa pola krawędzi. Zajęcie jednego nośnika przez
+przeciwnika (wtargnięcie) wymaga natychmiastowej odpowiedzi na drugim.
+
+Z połączeń wyznaczane są:
+- odpowiedzi na wtargnięcia (ruchy do rozważenia w pierwszej kolejności),
+- nośniki własnych połączeń (wypełnianie ich niczego nie zmienia),
+- obszar must_play: jeśli przeciwnik jest wirtualnie połączony z obiema
+  krawędziami, każdy ruch poza nośnikami tego połączenia przegrywa.
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from ..core.engine import HexEngine, Player
+from ..core.topology import EDGE_TOP, EDGE_BOTTOM, EDGE_LEFT, EDGE_RIGHT
+
+
+# Krawędzie graczy (wartość gracza -> flagi EDGE_*)
+PLAYER_EDGES = {
+    Player.PLAYER1.value: (EDGE_TOP, EDGE_BOTTOM),
+    Player.PLAYER2.value: (EDGE_LEFT, EDGE_RIGHT),
+}
+
+# Klucz połączenia: mostek (kamień_a, kamień_b), a < b; szablon (kamień, -EDGE_*)
+ConnectionKey = Tuple[int, int]
+
+
+class VirtualConnections:
+    """
+    Mostki i szablony krawędzi obu graczy z aktualizacją przyrostową
+    
+    Po ruchu (play) sprawdzane są tylko połączenia, których nośnikiem jest
+    zajęte pole, oraz mostki i szablony nowego kamienia. undo() przywraca
+    stan sprzed ostatniego play() w kolejności LIFO, tak jak pop_move
+    w silniku.
+    """
+    
+    def __init__(self, engine: HexEngine):
+        """
+        Args:
+            engine: Silnik w pozycji początkowej (plansza jest kopiowana)
+        """
+        self.topology = engine.topology
+        self.board = bytearray(engine.cells)
+        players = (Player.PLAYER1.value, Player.PLAYER2.value)
+        # Dla każdego gracza: połączenia (klucz -> nośniki) i nośnik -> klucze
+        self._connections: Dict[int, Dict[ConnectionKey, Tuple[int, int]]] = {p: {} for p in players}
+        self._carriers: Dict[int, Dict[int, Set[ConnectionKey]]] = {p: {} for p in players}
+        # Dla każdego play(): pole i log zmian (rodzaj, gracz, klucz, dane)
+        self._undo_stack: List[Tuple[int, list]] = []
+        
+        log: list = []
+        for cell in range(self.topology.cells):
+            if self.board[cell]:
+                self._add_stone_connections(cell, self.board[cell], log)
+    
+    def _add(self, value: int, key: ConnectionKey, carriers: Tuple[int, int], log: list) -> None:
+        """Dodaje połączenie gracza"""
+        self._connections[value][key] = carriers
+        for carrier in carriers:
+            self._carriers[value].setdefault(carrier, set()).add(key)
+        log.append((0, value, key, carriers))
+    
+    def _remove(self, value: int, key: ConnectionKey, log: list) -> Tuple[int, int]:
+        """Usuwa połączenie gracza i zwraca jego nośniki"""
+        carriers = self._connections[value].pop(key)
+        for carrier in carriers:
+            keys = self._carriers[value][carrier]
+            keys.discard(key)
+            if not keys:
+                del self._carriers[value][carrier]
+        log.append((1, value, key, carriers))
+        return carriers
+    
+    def _add_stone_connections(self, cell: int, value: int, log: list) -> None:
+        """Dodaje mostki i szablony krawędzi nowego kamienia"""
+        board = self.board
+        for target, carrier_a, carrier_b in self.topology.bridges[cell]:
+            if board[target] == value and not board[carrier_a] and not board[carrier_b]:
+                key = (cell, target) if cell < target else (target, cell)
+                self._add(value, key, (min(carrier_a, carrier_b), max(carrier_a, carrier_b)), log)
+        own_edges = PLAYER_EDGES[value]
+        for edge, carrier_a, carrier_b in self.topology.edge_templates[cell]:
+            if edge in own_edges and not board[carrier_a] and not board[carrier_b]:
+                self._add(value, (cell, -edge), (carrier_a, carrier_b), log)
+    
+    def play(self, cell: int, player_value: int) -> None:
+        """
+        Aktualizuje połączenia po postawieniu kamienia
+        
+        Args:
+            cell: Płaski indeks pustego pola
+            player_value: Wartość gracza stawiającego kamień
+        """
+        log: list = []
+        self.board[cell] = player_value
+        for value, carriers in self._carriers.items():
+            for key in list(carriers.get(cell, ())):
+                carrier_a, carrier_b = self._remove(value, key, log)
+                other = carrier_b if carrier_a == cell else carrier_a
+                if value != player_value and not self.board[other]:
+                    log.append((2, value, key, other))  # Wtargnięcie przeciwnika
+        self._add_stone_connections(cell, player_value, log)
+        self._undo_stack.append((cell, log))
+    
+    def undo(self) -> None:
+        """Cofa ostatnie play()"""
+        cell, log = self._undo_stack.pop()
+        self.board[cell] = 0
+        for kind, value, key, data in reversed(log):
+            if kind == 0:
+                self._remove(value, key, [])
+            elif kind == 1:
+                self._add(value, key, data, [])
+    
+    def connections(self, player: Player) -> Dict[ConnectionKey, Tuple[int, int]]:
+        """Zwraca nienaruszone połączenia gracza (klucz -> nośniki) - nie modyfikować"""
+        return self._connections[player.value]
+    
+    def intrusion_responses(self, player: Player) -> List[int]:
+        """
+        Zwraca pola przywracające połączenia gracza naruszone ostatnim ruchem
+        
+        Starsze, pozostawione bez odpowiedzi wtargnięcia nie są zwracane -
+        gracz wybrał wtedy inny ruch i pole nie wymaga już pierwszeństwa.
+        """
+        if not self._undo_stack:
+            return []
+        return list(dict.fromkeys(data for kind, value, _, data in self._undo_stack[-1][1]
+                                  if kind == 2 and value == player.value))
+    
+    def carrier_cells(self, player: Player) -> FrozenSet[int]:
+        """Zwraca nośniki nienaruszonych połączeń gracza"""
+        return frozenset(self._carriers[player.value])
+    
+    def must_play(self, player: Player) -> Optional[FrozenSet[int]]:
+        """
+        Zwraca obszar, w którym gracz musi zagrać, by nie przegrać
+        
+        Przeciwnik jest wirtualnie połączony, jeśli jego kamienie, połączone
+        bezpośrednio, mostkami lub szablonami, łączą obie jego krawędzie.
+        Brane są tylko połączenia o nośnikach niewspółdzielonych z innymi
+        połączeniami (jedno wtargnięcie narusza wtedy co najwyżej jedno
+        połączenie), więc ruch poza obszarem na pewno przegrywa.
+        
+        Args:
+            player: Gracz na ruchu
+        
+        Returns:
+            Nośniki połączeń łączących krawędzie przeciwnika lub None, jeśli
+            przeciwnik nie jest wirtualnie połączony
+        """
+        opponent = 3 - player.value
+        topology = self.topology
+        board = self.board
+        cells = topology.cells
+        start_edge, end_edge = PLAYER_EDGES[opponent]
+        start, end = cells, cells + 1
+        parent = list(range(cells + 2))
+        
+        def find(node: int) -> int:
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+        
+        def union(a: int, b: int) -> None:
+            parent[find(a)] = find(b)
+        
+        for cell in range(cells):
+            if board[cell] != opponent:
+                continue
+            flags = topology.edge_flags[cell]
+            if flags & start_edge:
+                union(cell, start)
+            if flags & end_edge:
+                union(cell, end)
+            for neighbor in topology.neighbors[cell]:
+                if neighbor > cell and board[neighbor] == opponent:
+                    union(cell, neighbor)
+        
+        carrier_use = self._carriers[opponent]
+        safe = []
+        for (stone, other), carriers in self._connections[opponent].items():
+            if any(len(carrier_use[carrier]) > 1 for carrier in carriers):
+                continue
+            if other >= 0:
+                union(stone, other)
+            else:
+                union(stone, start if -other == start_edge else end)
+            safe.append((stone, carriers))
+        
+        root = find(start)
+        if root != find(end):
+            return None
+        return frozenset(carrier for stone, carriers in safe
+                         if find(stone) == root for carrier in carriers)
@@ -0,0 +1,356 @@
+"""
+Ocena pozycji HEX na podstawie odległości połączenia
+
+Odległość połączenia gracza to najmniejsza liczba kamieni, które musi on
+jeszcze postawić, aby połączyć swoje krawędzie: ścieżka przez własne kamienie
+kosztuje 0, przez puste pole 1, a pola przeciwnika są zablokowane. Liczona
+jest przeszukiwaniem 0-1 BFS po płaskiej planszy.
+"""
+
+import math
+from collections import deque
+from typing import Dict, List, Tuple
+
+from ..core.engine import HexEngine, Player
+from ..core.topology import HexTopology, EDGE_TOP, EDGE_BOTTOM, EDGE_LEFT, EDGE_RIGHT
+
+
+def edge_distances(board: bytearray, topology: HexTopology, player_value: int,
+                   from_start: bool = True) -> List[int]:
+    """
+    Oblicza odległość połączenia każdego pola z krawędzią gracza
+    
+    Odległość pola obejmuje jego własny koszt (0 dla kamienia gracza, 1 dla
+    pustego pola); pola nieosiągalne mają wartość topology.cells + 1.
+    
+    Args:
+        board: Płaska plansza (wartości graczy)
+        topology: Topologia planszy
+        player_value: Wartość gracza (1 lub 2)
+        from_start: True - od krawędzi startowej (góra/lewo),
+            False - od końcowej (dół/prawo)
+    
+    Returns:
+        Lista odległości dla każdego pola
+    """
+    if player_value == Player.PLAYER1.value:
+        sources = topology.top_cells if from_start else topology.bottom_cells
+    else:
+        sources = topology.left_cells if from_start else topology.right_cells
+    
+    unreachable = topology.cells + 1
+    distance = [unreachable] * topology.cells
+    neighbors = topology.neighbors
+    queue = deque()
+    for cell in sources:
+        owner = board[cell]
+        if owner == player_value:
+            distance[cell] = 0
+            queue.appendleft(cell)
+        elif owner == 0:
+            distance[cell] = 1
+            queue.append(cell)
+    
+    while queue:
+        cell = queue.popleft()
+        base = distance[cell]
+        for neighbor in neighbors[cell]:
+            owner = board[neighbor]
+            if owner == player_value:
+                cost = base
+            elif owner == 0:
+                cost = base + 1
+            else:
+                continue
+            if cost < distance[neighbor]:
+                distance[neighbor] = cost
+                if cost == base:
+                    queue.appendleft(neighbor)
+                else:
+                    queue.append(neighbor)
+    
+    return distance
+
+
+def connection_distance(engine: HexEngine, player: Player) -> int:
+    """
+    Zwraca liczbę kamieni potrzebnych graczowi do połączenia krawędzi
+    
+    Returns:
+        Odległość połączenia (0 = połączone, topology.cells + 1 = niemożliwe)
+    """
+    topology = engine.topology
+    distance = edge_distances(engine.cells, topology, player.value)
+    targets = topology.bottom_cells if player == Player.PLAYER1 else topology.right_cells
+    return min(distance[cell] for cell in targets)
+
+
+def evaluate(engine: HexEngine) -> int:
+    """
+    Ocenia pozycję z perspektywy gracza na ruchu
+    
+    Returns:
+        Odległość przeciwnika minus odległość gracza na ruchu (wyższa = lepsza)
+    """
+    player = engine.current_player
+    opponent = Player.PLAYER2 if player == Player.PLAYER1 else Player.PLAYER1
+    return connection_distance(engine, opponent) - connection_distance(engine, player)
+
+
+def path_slack(engine: HexEngine, player: Player) -> Tuple[int, List[int]]:
+    """
+    Oblicza, o ile najkrótsza ścieżka gracza przez każde pole jest dłuższa od optymalnej
+    
+    Pola o zerowym zapasie leżą na jednej z najkrótszych ścieżek gracza -
+    to naturalni kandydaci na ruch (własny lub blokujący).
+    
+    Returns:
+        Krotka (odległość połączenia, zapas dla każdego pola)
+    """
+    topology = engine.topology
+    board = engine.cells
+    value = player.value
+    from_start = edge_distances(board, topology, value, True)
+    from_end = edge_distances(board, topology, value, False)
+    best = min(from_start[cell] + from_end[cell] - (board[cell] != value)
+               for cell in range(topology.cells))
+    slack = [from_start[cell] + from_end[cell] - (board[cell] != value) - best
+             for cell in range(topology.cells)]
+    return best, slack
+
+
+UNREACHABLE = 1 << 20  # Odległość pól, z których nie da się połączyć krawędzi
+WIN_PROBABILITY_SCALE = 2.0  # Skala funkcji logistycznej dla prawdopodobieństwa wygranej
+
+
+class TwoDistanceEvaluator:
+    """
+    Ocena pozycji odległością dwukrokową (two-distance) z aktualizacją przyrostową
+    
+    Odległość dwukrokowa pustego pola od krawędzi to 1 dla pól przylegających
+    do krawędzi (bezpośrednio lub przez grupę własnych kamieni), a w pozostałych
+    przypadkach 1 + druga najmniejsza odległość spośród sąsiadów - przeciwnik
+    zawsze może zablokować najlepszego z nich. Sąsiadami są puste pola
+    przyległe bezpośrednio lub przez wspólną grupę własnych kamieni.
+    
+    Potencjał gracza to minimum sumy odległości od obu jego krawędzi po
+    pustych polach (mniej = lepiej). Po ruchu (play) przeliczane są tylko pola,
+    których odległość była nie mniejsza niż odległość zajętego pola - wartości
+    mniejsze nie mogły zależeć od tego pola. undo() przywraca stan sprzed
+    ostatniego play() w kolejności LIFO, tak jak pop_move w silniku.
+    """
+    
+    def __init__(self, engine: HexEngine):
+        """
+        Args:
+            engine: Silnik w pozycji początkowej (plansza jest kopiowana)
+        """
+        self.topology = engine.topology
+        self.board = bytearray(engine.cells)
+        topology = self.topology
+        self._edges = {
+            Player.PLAYER1.value: (EDGE_TOP, EDGE_BOTTOM),
+            Player.PLAYER2.value: (EDGE_LEFT, EDGE_RIGHT),
+        }
+        # Dla każdego gracza: sąsiedzi rozszerzeni (przez własne grupy) i krawędzie w zasięgu
+        self._links = {}
+        self._touch = {}
+        for value in (Player.PLAYER1.value, Player.PLAYER2.value):
+            self._links[value], self._touch[value] = self._build_links(value)
+        # Odległości: (gracz, krawędź) -> lista odległości pól
+        self._distances = {}
+        for value, edges in self._edges.items():
+            for edge in edges:
+                distance = [UNREACHABLE] * topology.cells
+                self._relax(value, edge, distance, [
+                    cell for cell in range(topology.cells) if self.board[cell] == 0
+                ])
+                self._distances[value, edge] = distance
+        self._undo_stack = []
+    
+    def _build_links(self, value: int):
+        """Buduje sąsiedztwo rozszerzone pustych pól przez grupy kamieni gracza"""
+        topology = self.topology
+        board = self.board
+        neighbors = topology.neighbors
+        links = [None] * topology.cells
+        touch = bytearray(topology.cells)
+        for cell in range(topology.cells):
+            if board[cell] == 0:
+                links[cell] = {neighbor for neighbor in neighbors[cell] if board[neighbor] == 0}
+                touch[cell] = topology.edge_flags[cell]
+        
+        visited = bytearray(topology.cells)
+        for start in range(topology.cells):
+            if board[start] != value or visited[start]:
+                continue
+            _, liberties, flags = self._collect_group(start, value, visited)
+            self._merge_liberties(links, touch, liberties, flags)
+        return links, touch
+    
+    def _collect_group(self, start: int, value: int, visited: bytearray):
+        """Zwraca grupę kamieni gracza, jej puste sąsiednie pola i dotykane krawędzie"""
+        topology = self.topology
+        board = self.board
+        group = [start]
+        visited[start] = 1
+        liberties = set()
+        flags = 0
+        for cell in group:
+            flags |= topology.edge_flags[cell]
+            for neighbor in topology.neighbors[cell]:
+                owner = board[neighbor]
+                if owner == value and not visited[neighbor]:
+                    visited[neighbor] = 1
+                    group.append(neighbor)
+                elif owner == 0:
+                    liberties.add(neighbor)
+        return group, liberties, flags
+    
+    @staticmethod
+    def _merge_liberties(links, touch, liberties, flags: int) -> None:
+        """Łączy puste pola wokół jednej grupy w sąsiedztwo rozszerzone"""
+        for cell in liberties:
+            links[cell] |= liberties
+            links[cell].discard(cell)
+            touch[cell] |= flags
+    
+    def _relax(self, value: int, edge: int, distance: List[int], pending: List[int]) -> None:
+        """
+        Wyznacza odległości dwukrokowe pól `pending` (pozostałe pola są ustalone)
+        
+        Uogólniony algorytm Dijkstry: wartość pola to 1 + druga najmniejsza
+        ustalona odległość sąsiada, pola ustalane są w kolejności rosnącej.
+        """
+        board = self.board
+        links = self._links[value]
+        touch = self._touch[value]
+        pending_set = set(pending)
+        best = {}  # Pole -> dwie najmniejsze odległości ustalonych sąsiadów
+        buckets: Dict[int, List[int]] = {}
+        
+        def offer(cell: int, value_from: int) -> None:
+            first, second = best.get(cell, (UNREACHABLE, UNREACHABLE))
+            if value_from < first:
+                first, second = value_from, first
+            elif value_from < second:
+                second = value_from
+            else:
+                return
+            best[cell] = (first, second)
+            if second < UNREACHABLE:
+                buckets.setdefault(second + 1, []).append(cell)
+        
+        for cell in pending:
+            distance[cell] = UNREACHABLE
+        for cell in pending:
+            if touch[cell] & edge:
+                buckets.setdefault(1, []).append(cell)
+            for neighbor in links[cell]:
+                if neighbor not in pending_set and board[neighbor] == 0:
+                    offer(cell, distance[neighbor])
+        
+        while buckets:
+            level = min(buckets)
+            for cell in buckets.pop(level):
+                if distance[cell] <= level:
+                    continue
+                distance[cell] = level
+                for neighbor in links[cell]:
+                    if neighbor in pending_set and distance[neighbor] > level and board[neighbor] == 0:
+                        offer(neighbor, level)
+    
+    def play(self, cell: int, player_value: int) -> None:
+        """
+        Aktualizuje ocenę po postawieniu kamienia
+        
+        Args:
+            cell: Płaski indeks pola
+            player_value: Wartość gracza (1 lub 2)
+        """
+        board = self.board
+        links = self._links[player_value]
+        touch = self._touch[player_value]
+        
+        # Nowa grupa gracza łączy puste pola wokół siebie
+        board[cell] = player_value
+        _, liberties, flags = self._collect_group(cell, player_value, bytearray(self.topology.cells))
+        saved_links = [(liberty, set(links[liberty]), touch[liberty]) for liberty in liberties]
+        self._merge_liberties(links, touch, liberties, flags)
+        
+        # Przeliczenie pól o odległości nie mniejszej niż próg: dla przeciwnika
+        # odległości tylko rosną i zależą od pola `cell` jedynie powyżej jego
+        # odległości; dla gracza maleją, ale nie poniżej dolnego ograniczenia
+        # nowych wartości pól wokół grupy
+        saved_distances = []
+        for (value, edge), distance in self._distances.items():
+            threshold = distance[cell]
+            if value == player_value:
+                for liberty in liberties:
+                    if touch[liberty] & edge:
+                        threshold = 1
+                        break
+                    closest = min((distance[other] for other in links[liberty]
+                                   if board[other] == 0), default=UNREACHABLE)
+                    threshold = min(threshold, closest + 1)
+            pending = [other for other in range(self.topology.cells)
+                       if board[other] == 0 and distance[other] >= threshold]
+            saved_distances.append((distance, [(other, distance[other]) for other in pending],
+                                    cell, distance[cell]))
+            distance[cell] = UNREACHABLE
+            if pending:
+                self._relax(value, edge, distance, pending)
+        
+        self._undo_stack.append((cell, player_value, saved_links, saved_distances))
+    
+    def undo(self) -> None:
+        """Cofa ostatnie wywołanie play()"""
+        cell, player_value, saved_links, saved_distances = self._undo_stack.pop()
+        self.board[cell] = 0
+        links = self._links[player_value]
+        touch = self._touch[player_value]
+        for liberty, old_links, old_touch in saved_links:
+            links[liberty] = old_links
+            touch[liberty] = old_touch
+        for distance, values, played, played_distance in saved_distances:
+            for other, old in values:
+                distance[other] = old
+            distance[played] = played_distance
+    
+    def cell_potentials(self, player: Player) -> List[int]:
+        """
+        Zwraca potencjał gracza przez każde pole (suma odległości od obu krawędzi)
+        
+        Pola zajęte mają wartość UNREACHABLE. Małe wartości wskazują pola
+        ważne dla gracza - nadają się do porządkowania ruchów.
+        """
+        start, end = self._edges[player.value]
+        from_start = self._distances[player.value, start]
+        from_end = self._distances[player.value, end]
+        board = self.board
+        return [from_start[cell] + from_end[cell] if board[cell] == 0 else UNREACHABLE
+                for cell in range(self.topology.cells)]
+    
+    def cell_slack(self, player: Player) -> List[int]:
+        """Zwraca nadwyżkę potencjału gracza przez każde pole ponad jego potencjał"""
+        potentials = self.cell_potentials(player)
+        best = min(potentials) if potentials else UNREACHABLE
+        return [value - best for value in potentials]
+    
+    def potential(self, player: Player) -> int:
+        """Zwraca potencjał gracza (mniej = bliżej połączenia krawędzi)"""
+        potentials = self.cell_potentials(player)
+        return min(potentials) if potentials else UNREACHABLE
+    
+    def score(self, player: Player) -> int:
+        """Zwraca ocenę z perspektywy gracza: potencjał przeciwnika minus własny"""
+        opponent = Player.PLAYER2 if player == Player.PLAYER1 else Player.PLAYER1
+        return min(self.potential(opponent), self.topology.cells) - min(self.potential(player), self.topology.cells)
+    
+    def win_probability(self, player: Player) -> float:
+        """
+        Zwraca szacowane prawdopodobieństwo wygranej gracza (np. dla paska w UI)
+        
+        Funkcja logistyczna różnicy potencjałów; nie uwzględnia strony na ruchu.
+        """
+        return 1.0 / (1.0 + math.exp(-self.score(player) / WIN_PROBABILITY_SCALE))
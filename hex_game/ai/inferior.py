@@ -0,0 +1,199 @@
+"""
+Analiza pól martwych, przechwyconych i zdominowanych (wzorce lokalne)
+
+Pole jest martwe, jeśli jego kolor nie może zmienić wyniku żadnego
+dokończenia partii. Rozstrzyga o tym sam obwód sześciu sąsiadów (krawędź
+planszy liczy się jako kamień jej właściciela): pole jest bezużyteczne dla
+gracza, jeśli każde dwa dostępne dla niego pola obwodu łączy łuk obwodu,
+którego wnętrze zajmują jego kamienie - ścieżka przez pole zawsze ma wtedy
+objazd. Pole martwe dla obu graczy jest martwe.
+
+Para sąsiednich pustych pól jest przechwycona przez gracza, jeśli wejście
+przeciwnika w jedno z nich, po odpowiedzi na drugim, zostawia kamień
+przeciwnika martwy. Pola martwe i przechwycone są wypełniane (martwe
+dowolnym kolorem, przechwycone kolorem właściciela) i analiza jest
+powtarzana, bo wypełnienie odsłania kolejne takie pola. Ruch w nie jest
+równoważny pasowi, a w HEX pas nigdy nie jest lepszy od innego ruchu.
+
+Ruch gracza jest zdominowany, jeśli przeciwnik ma odpowiedź na sąsiednim
+polu ("zabójcę") czyniącą go martwym - ruch na polu zabójcy jest wtedy co
+najmniej tak dobry.
+"""
+
+from typing import Dict, FrozenSet, List, Optional
+
+from ..core.engine import HexEngine, Player
+from ..core.topology import EDGE_TOP, EDGE_BOTTOM, EDGE_LEFT, EDGE_RIGHT
+
+
+# Właściciele krawędzi na obwodzie (-EDGE_* -> wartość gracza)
+_EDGE_OWNER = {EDGE_TOP: 1, EDGE_BOTTOM: 1, EDGE_LEFT: 2, EDGE_RIGHT: 2}
+
+
+def _useless_for(player: int, colors) -> bool:
+    """Sprawdza czy pole o danym obwodzie nie może pomóc graczowi w połączeniu"""
+    relevant = [index for index in range(6) if colors[index] != 3 - player]
+    for first in range(len(relevant)):
+        for second in range(first + 1, len(relevant)):
+            a, b = relevant[first], relevant[second]
+            # Łuk zgodnie z ruchem wskazówek zegara lub przeciwnie
+            forward = all(colors[(a + step) % 6] == player for step in range(1, (b - a) % 6))
+            backward = all(colors[(b + step) % 6] == player for step in range(1, (a - b) % 6))
+            if not forward and not backward:
+                return False
+    return True
+
+
+def _build_dead_patterns() -> bytearray:
+    """Buduje tablicę martwych wzorców obwodu (kod: suma kolor_i * 3^i)"""
+    table = bytearray(3 ** 6)
+    for code in range(3 ** 6):
+        colors = [code // 3 ** index % 3 for index in range(6)]
+        table[code] = _useless_for(1, colors) and _useless_for(2, colors)
+    return table
+
+
+_DEAD_PATTERNS = _build_dead_patterns()
+
+
+class InferiorCells:
+    """Wynik analizy: pola martwe, przechwycone i zdominowane"""
+    
+    __slots__ = ('player', 'dead', 'captured', 'dominated')
+    
+    def __init__(self, player: Player, dead: List[int], captured: Dict[int, List[int]],
+                 dominated: Dict[int, int]):
+        """
+        Args:
+            player: Gracz, dla którego wyznaczono ruchy zdominowane
+            dead: Pola martwe
+            captured: Wartość gracza -> pola przez niego przechwycone
+            dominated: Pole zdominowane -> pole zabójcy (ruch co najmniej tak dobry)
+        """
+        self.player = player
+        self.dead = dead
+        self.captured = captured
+        self.dominated = dominated
+    
+    def settled(self) -> FrozenSet[int]:
+        """
+        Zwraca pola martwe i przechwycone
+        
+        Pozostają takie po dowolnych ruchach poza nimi, więc mogą być
+        pomijane w całym drzewie przeszukiwania (nie tylko w korzeniu).
+        """
+        cells = set(self.dead)
+        for captured in self.captured.values():
+            cells.update(captured)
+        return frozenset(cells)
+    
+    def pruned(self) -> FrozenSet[int]:
+        """Zwraca wszystkie pola, których gracz na ruchu nie musi rozważać"""
+        return self.settled() | frozenset(self.dominated)
+    
+    def to_dict(self, engine: HexEngine) -> Dict[str, object]:
+        """Zwraca wynik ze współrzędnymi (row, col) - np. dla odpowiedzi API"""
+        coords = engine.topology.coords
+        return {
+            'dead': [coords[cell] for cell in self.dead],
+            'captured': {str(value): [coords[cell] for cell in cells]
+                         for value, cells in self.captured.items()},
+            'dominated': [coords[cell] for cell in self.dominated],
+        }
+
+
+def analyse_cells(engine: HexEngine, player: Optional[Player] = None) -> InferiorCells:
+    """
+    Wyznacza pola martwe, przechwycone i zdominowane
+    
+    Args:
+        engine: Silnik gry (nie jest modyfikowany)
+        player: Gracz na ruchu (domyślnie z silnika) - dla ruchów zdominowanych
+    
+    Returns:
+        Wynik analizy
+    """
+    player = player or engine.current_player
+    topology = engine.topology
+    rings = topology.ring
+    neighbors = topology.neighbors
+    board = bytearray(engine.cells)
+    dead_patterns = _DEAD_PATTERNS
+    
+    def is_dead(cell: int) -> bool:
+        code = 0
+        for position in reversed(rings[cell]):
+            code = code * 3 + (board[position] if position >= 0 else _EDGE_OWNER[-position])
+        return dead_patterns[code]
+    
+    mover = player.value
+    other = 3 - mover
+    dead: List[int] = []
+    captured: Dict[int, List[int]] = {1: [], 2: []}
+    empty = [cell for cell in engine.get_empty_indices()]
+    
+    changed = True
+    while changed:
+        changed = False
+        for cell in empty:
+            if not board[cell] and is_dead(cell):
+                dead.append(cell)
+                board[cell] = other  # Kolor martwego pola jest bez znaczenia
+                changed = True
+        for cell in empty:
+            if board[cell]:
+                continue
+            for neighbor in neighbors[cell]:
+                if neighbor < cell or board[neighbor]:
+                    continue
+                for owner in (mover, other):
+                    intruder = 3 - owner
+                    board[cell], board[neighbor] = intruder, owner
+                    first = is_dead(cell)
+                    board[cell], board[neighbor] = owner, intruder
+                    second = first and is_dead(neighbor)
+                    if second:
+                        captured[owner] += [cell, neighbor]
+                        board[neighbor] = owner
+                        changed = True
+                        break
+                    board[cell] = board[neighbor] = 0
+                if board[cell]:
+                    break
+    
+    # Ruchy zdominowane przez zabójcę (sam zabójca nie może być pominięty)
+    dominated: Dict[int, int] = {}
+    for cell in empty:
+        if board[cell]:
+            continue
+        board[cell] = mover
+        for neighbor in neighbors[cell]:
+            if board[neighbor] or neighbor in dominated:
+                continue
+            board[neighbor] = other
+            killed = is_dead(cell)
+            board[neighbor] = 0
+            if killed:
+                dominated[cell] = neighbor
+                break
+        board[cell] = 0
+    
+    return InferiorCells(player, dead, captured, dominated)
+
+
+def candidate_cells(engine: HexEngine, player: Optional[Player] = None) -> List[int]:
+    """
+    Zwraca puste pola bez pól martwych, przechwyconych i zdominowanych
+    
+    Args:
+        engine: Silnik gry
+        player: Gracz na ruchu (domyślnie z silnika)
+    
+    Returns:
+        Płaskie indeksy pól w kolejności get_empty_indices (wszystkie puste
+        pola, jeśli analiza odrzuciłaby każde)
+    """
+    empty = engine.get_empty_indices()
+    pruned = analyse_cells(engine, player).pruned()
+    candidates = [cell for cell in empty if cell not in pruned]
+    return candidates or empty
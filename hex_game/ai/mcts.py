@@ -0,0 +1,396 @@
+"""
+Przeszukiwanie drzewa Monte Carlo (MCTS/UCT) dla gry HEX
+
+Wykorzystuje własność HEX: całkowicie wypełniona plansza ma zawsze dokładnie
+jednego zwycięzcę. Rozgrywka losowa (playout) nie sprawdza więc wygranej po
+każdym ruchu - wypełnia wszystkie puste pola naraz i wykonuje jedno
+sprawdzenie spójności na końcu. Drzewo nie rozwija ruchów w pola martwe
+i przechwycone (hex_game.ai.inferior), a w korzeniu także w zdominowane.
+"""
+
+import math
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from ..core.engine import HexEngine, Player
+from ..core.topology import HexTopology, EDGE_BOTTOM
+from .connections import VirtualConnections
+from .inferior import analyse_cells
+
+
+DEFAULT_TIME_LIMIT = 1.0  # Domyślny budżet czasu na ruch [s]
+DEFAULT_EXPLORATION = 0.7  # Stała eksploracji UCT
+MAX_TREE_NODES = 20000  # Domyślny limit węzłów drzewa (także zachowanego pomiędzy ruchami)
+
+
+def filled_board_winner(board: bytearray, topology: HexTopology) -> int:
+    """
+    Zwraca zwycięzcę całkowicie wypełnionej planszy
+    
+    Na pełnej planszy gracz 2 wygrywa dokładnie wtedy, gdy gracz 1 nie
+    połączył góry z dołem, więc wystarczy jedno przeszukanie.
+    
+    Args:
+        board: Płaska plansza (wartości graczy)
+        topology: Topologia planszy
+    
+    Returns:
+        Wartość gracza, który wygrał (1 lub 2)
+    """
+    player = Player.PLAYER1.value
+    neighbors = topology.neighbors
+    edge_flags = topology.edge_flags
+    visited = bytearray(topology.cells)
+    stack = [cell for cell in topology.top_cells if board[cell] == player]
+    for cell in stack:
+        visited[cell] = 1
+    
+    while stack:
+        cell = stack.pop()
+        if edge_flags[cell] & EDGE_BOTTOM:
+            return player
+        for neighbor in neighbors[cell]:
+            if not visited[neighbor] and board[neighbor] == player:
+                visited[neighbor] = 1
+                stack.append(neighbor)
+    
+    return Player.PLAYER2.value
+
+
+def random_playout(engine: HexEngine, rng: random.Random) -> int:
+    """
+    Rozgrywa pozycję losowo do końca i zwraca zwycięzcę
+    
+    Puste pola są tasowane i przydzielane na przemian, zaczynając od gracza
+    na ruchu - bez wykonywania pojedynczych ruchów na silniku.
+    
+    Args:
+        engine: Silnik w pozycji początkowej (nie jest modyfikowany)
+        rng: Generator liczb losowych
+    
+    Returns:
+        Wartość gracza, który wygrał (1 lub 2)
+    """
+    board = bytearray(engine.cells)
+    empty = engine.get_empty_indices()
+    rng.shuffle(empty)
+    
+    mover = engine.current_player.value
+    other = 3 - mover
+    half = (len(empty) + 1) // 2
+    for cell in empty[:half]:
+        board[cell] = mover
+    for cell in empty[half:]:
+        board[cell] = other
+    
+    return filled_board_winner(board, engine.topology)
+
+
+class MCTSNode:
+    """Węzeł drzewa przeszukiwania"""
+    
+    __slots__ = ('cell', 'parent', 'player', 'children', 'untried', 'wins', 'visits')
+    
+    def __init__(self, cell: Optional[int], parent: Optional['MCTSNode'],
+                 player: int, untried: Optional[List[int]]):
+        """
+        Args:
+            cell: Ruch prowadzący do węzła (None dla korzenia)
+            parent: Węzeł rodzica
+            player: Wartość gracza, który wykonał ruch `cell`
+            untried: Nierozwinięte ruchy w losowej kolejności (None = jeszcze
+                nie wyznaczone, pusta lista = pozycja końcowa)
+        """
+        self.cell = cell
+        self.parent = parent
+        self.player = player
+        self.children: List['MCTSNode'] = []
+        self.untried = untried
+        self.wins = 0  # Wygrane z perspektywy gracza `player`
+        self.visits = 0
+    
+    def select_child(self, exploration: float) -> 'MCTSNode':
+        """Wybiera dziecko maksymalizujące UCB1"""
+        log_visits = math.log(self.visits)
+        best, best_value = None, -1.0
+        for child in self.children:
+            value = (child.wins / child.visits
+                     + exploration * math.sqrt(log_visits / child.visits))
+            if value > best_value:
+                best, best_value = child, value
+        return best
+
+
+def _count_nodes(root: MCTSNode) -> int:
+    """Zwraca liczbę węzłów poddrzewa"""
+    count = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.children)
+    return count
+
+
+class MCTSSearch:
+    """
+    Przeszukiwanie UCT z budżetem czasu i/lub liczby rozgrywek
+    
+    Drzewo schodzi po kopii silnika (fork) przy użyciu push_cell/pop_move,
+    a liście oceniane są jedną losową rozgrywką lub - przy batch_size > 1 -
+    wsadem rozgrywek NumPy (hex_game.ai.batch).
+    
+    Przy reuse_tree drzewo jest zachowywane pomiędzy wywołaniami: jeśli nowa
+    pozycja powstała z poprzedniej przez kolejne ruchy (np. własny ruch AI i
+    odpowiedź przeciwnika), korzeniem staje się odpowiednie poddrzewo wraz
+    z jego statystykami. Pozwala to też przeszukiwać w czasie ruchu
+    przeciwnika (ponder, patrz hex_game.ai.ponder). Po wyborze ruchu
+    zachowywane jest tylko jego poddrzewo, a po osiągnięciu max_nodes
+    węzłów drzewo przestaje rosnąć (liście nadal oceniane są rozgrywkami).
+    """
+    
+    def __init__(self, playouts: Optional[int] = None, time_limit: Optional[float] = None,
+                 exploration: float = DEFAULT_EXPLORATION, seed: Optional[int] = None,
+                 batch_size: int = 1, reuse_tree: bool = True,
+                 max_nodes: int = MAX_TREE_NODES):
+        """
+        Args:
+            playouts: Limit liczby rozgrywek na ruch
+            time_limit: Limit czasu na ruch w sekundach (domyślnie
+                DEFAULT_TIME_LIMIT, jeśli nie podano żadnego limitu)
+            exploration: Stała eksploracji UCT
+            seed: Ziarno generatora (dla powtarzalności)
+            batch_size: Liczba rozgrywek na liść (ignorowana bez NumPy)
+            reuse_tree: Czy zachowywać drzewo pomiędzy wywołaniami
+            max_nodes: Maksymalna liczba węzłów drzewa
+        """
+        if playouts is not None and playouts <= 0:
+            raise ValueError("Liczba rozgrywek musi być dodatnia")
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError("Limit czasu musi być dodatni")
+        if batch_size < 1:
+            raise ValueError("Rozmiar wsadu musi być co najmniej 1")
+        if max_nodes < 2:
+            raise ValueError("Limit węzłów musi być co najmniej 2")
+        if playouts is None and time_limit is None:
+            time_limit = DEFAULT_TIME_LIMIT
+        
+        self.playouts = playouts
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.batch_size = batch_size
+        self.reuse_tree = reuse_tree
+        self.max_nodes = max_nodes
+        self.rng = random.Random(seed)
+        
+        # Zachowane drzewo: korzeń, historia ruchów jego pozycji i liczba węzłów
+        self._root: Optional[MCTSNode] = None
+        self._root_size = 0
+        self._root_moves: List[Tuple[int, int, int]] = []
+        self._tree_nodes = 0
+        
+        # Statystyki ostatniego wyszukiwania
+        self.last_playouts = 0
+        self.last_reused = 0  # Rozgrywki przejęte z zachowanego drzewa
+        self.last_elapsed = 0.0
+        self.last_score = 0.0  # Odsetek wygranych wybranego ruchu
+    
+    def search(self, engine: HexEngine, deadline: Optional[float] = None) -> int:
+        """
+        Wyszukuje najlepszy ruch dla gracza na ruchu
+        
+        Przeszukiwanie jest typu anytime - po upływie budżetu lub terminu
+        zwracany jest najczęściej odwiedzany dotąd ruch (zawsze wykonywana
+        jest co najmniej jedna rozgrywka).
+        
+        Args:
+            engine: Silnik gry (nie jest modyfikowany)
+            deadline: Zewnętrzny termin jako czas time.perf_counter()
+                (obowiązuje wcześniejszy z terminu i time_limit)
+        
+        Returns:
+            Płaski indeks wybranego pola
+        """
+        root = self._run(engine, deadline)
+        best = max(root.children, key=lambda child: child.visits)
+        self.last_score = best.wins / best.visits if best.visits else 0.0
+        if self.reuse_tree:
+            # Kolejna pozycja powstanie z wybranego ruchu - reszta drzewa jest zbędna
+            best.parent = None
+            self._root = best
+            self._root_moves = self._root_moves + [
+                divmod(best.cell, self._root_size) + (best.player,)]
+            self._tree_nodes = _count_nodes(best)
+        return best.cell
+    
+    def root_statistics(self, engine: HexEngine,
+                        deadline: Optional[float] = None) -> Dict[int, Tuple[int, int]]:
+        """
+        Przeszukuje pozycję i zwraca statystyki ruchów korzenia
+        
+        Statystyki z niezależnych przeszukiwań (np. w różnych procesach)
+        można sumować - patrz hex_game.ai.parallel.
+        
+        Returns:
+            Słownik {pole: (odwiedziny, wygrane gracza na ruchu)}
+        """
+        root = self._run(engine, deadline)
+        return {child.cell: (child.visits, child.wins) for child in root.children}
+    
+    def ponder(self, engine: HexEngine, stop: threading.Event,
+               deadline: Optional[float] = None) -> None:
+        """
+        Rozbudowuje zachowane drzewo pozycji aż do zatrzymania lub terminu
+        
+        Limity playouts i time_limit nie obowiązują; przeszukiwanie kończy
+        ustawienie `stop` (np. nadejście ruchu przeciwnika) lub `deadline`.
+        
+        Args:
+            engine: Silnik w pozycji po ruchu AI (nie jest modyfikowany)
+            stop: Zdarzenie przerywające przeszukiwanie
+            deadline: Termin jako czas time.perf_counter() (None = bez limitu)
+        """
+        if engine.get_empty_count() == 0:
+            return
+        self._run(engine, deadline, stop, limited=False)
+    
+    def reset_tree(self) -> None:
+        """Porzuca zachowane drzewo (np. gdy sesja gry jest bezczynna)"""
+        self._root = None
+        self._root_moves = []
+        self._tree_nodes = 0
+    
+    def _reuse_root(self, engine: HexEngine) -> Optional[MCTSNode]:
+        """
+        Zwraca poddrzewo zachowanego drzewa odpowiadające pozycji silnika
+        
+        Returns:
+            Węzeł (odłączony od rodzica) lub None, jeśli pozycja nie powstała
+            z pozycji korzenia albo poddrzewo nie było rozwinięte
+        """
+        node = self._root
+        known = self._root_moves
+        moves = engine.moves
+        if (node is None or engine.board_size != self._root_size
+                or len(moves) < len(known) or moves[:len(known)] != known):
+            return None
+        
+        size = engine.board_size
+        for row, col, player in moves[len(known):]:
+            cell = row * size + col
+            node = next((child for child in node.children
+                         if child.cell == cell and child.player == player), None)
+            if node is None:
+                return None
+        node.parent = None
+        return node
+    
+    def _run(self, engine: HexEngine, deadline: Optional[float],
+             stop: Optional[threading.Event] = None, limited: bool = True) -> MCTSNode:
+        """Wykonuje przeszukiwanie w budżecie i zwraca korzeń drzewa"""
+        # Import lokalny - hex_game.ai.batch korzysta z funkcji tego modułu
+        from .batch import NUMPY_AVAILABLE, batch_win_count
+        
+        rng = self.rng
+        exploration = self.exploration
+        max_nodes = self.max_nodes
+        batch_size = self.batch_size if NUMPY_AVAILABLE else 1
+        simulation = engine.fork()
+        
+        if not simulation.get_empty_count():
+            raise ValueError("Brak dostępnych ruchów")
+        root = self._reuse_root(simulation) if self.reuse_tree else None
+        nodes = 1
+        # Pola martwe i przechwycone pomijane są w całym drzewie, zdominowane - w korzeniu
+        inferior = analyse_cells(simulation)
+        settled = inferior.settled()
+        if root is None:
+            pruned = inferior.pruned()
+            root_moves = [cell for cell in simulation.get_empty_indices()
+                          if cell not in pruned] or simulation.get_empty_indices()
+            # Wirtualnie połączony przeciwnik - tylko ruchy w jego nośnikach nie przegrywają
+            must_play = VirtualConnections(simulation).must_play(simulation.current_player)
+            if must_play:
+                root_moves = [cell for cell in root_moves if cell in must_play] or root_moves
+            rng.shuffle(root_moves)
+            root = MCTSNode(None, None, 3 - simulation.current_player.value, root_moves)
+        elif root is not self._root:
+            nodes = _count_nodes(root)
+        else:
+            nodes = self._tree_nodes
+        self.last_reused = root.visits
+        if self.reuse_tree:
+            self._root = root
+            self._root_size = simulation.board_size
+            self._root_moves = simulation.moves
+        
+        start = time.perf_counter()
+        if limited and self.time_limit is not None:
+            own_deadline = start + self.time_limit
+            deadline = own_deadline if deadline is None else min(deadline, own_deadline)
+        limit = self.playouts if limited else None
+        playouts = 0
+        
+        while True:
+            node = root
+            depth = 0
+            
+            # Selekcja
+            while not node.untried and node.children:
+                node = node.select_child(exploration)
+                simulation.push_cell(node.cell)
+                depth += 1
+            
+            # Rozwinięcie (do limitu węzłów); ruchy liścia wyznaczane są
+            # dopiero przy jego pierwszym rozwinięciu
+            if node.untried is None and nodes < max_nodes:
+                empty = simulation.get_empty_indices()
+                node.untried = [cell for cell in empty if cell not in settled] or empty
+                rng.shuffle(node.untried)
+            if node.untried and nodes < max_nodes:
+                cell = node.untried.pop()
+                mover = simulation.current_player.value
+                simulation.push_cell(cell)
+                depth += 1
+                untried = None if simulation.winner is None else []
+                child = MCTSNode(cell, node, mover, untried)
+                node.children.append(child)
+                node = child
+                nodes += 1
+            
+            # Rozgrywka losowa (lub wsad rozgrywek); `wins` liczone są
+            # z perspektywy gracza, który wykonał ruch prowadzący do liścia
+            winner = simulation.winner
+            count = 1
+            if winner is not None:
+                wins = int(winner == node.player)
+            elif batch_size > 1:
+                count = batch_size
+                wins = count - batch_win_count(simulation, count, rng)
+            else:
+                wins = int(random_playout(simulation, rng) == node.player)
+            
+            # Propagacja wyniku (z perspektywy gracza w każdym węźle)
+            leaf_player = node.player
+            while node is not None:
+                node.visits += count
+                node.wins += wins if node.player == leaf_player else count - wins
+                node = node.parent
+            for _ in range(depth):
+                simulation.pop_move()
+            
+            playouts += count
+            if limit is not None and playouts >= limit:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            if stop is not None and stop.is_set():
+                break
+        
+        if self.reuse_tree:
+            self._tree_nodes = nodes
+        self.last_playouts = playouts
+        self.last_elapsed = time.perf_counter() - start
+        return root
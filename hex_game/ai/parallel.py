@@ -0,0 +1,313 @@
+"""
+Równoległe przeszukiwanie MCTS (zrównoleglenie korzenia) w puli procesów
+
+Proces Flask jest ograniczony przez GIL, więc każdy proces roboczy puli
+prowadzi niezależne przeszukiwanie tej samej pozycji (z innym ziarnem),
+a statystyki ruchów korzenia są sumowane w terminie. Pula tworzona jest
+raz na proces serwera (leniwie, przy pierwszym użyciu) i współdzielona
+przez wszystkie żądania; silnik przesyłany jest kompaktowo (pickle stanu,
+patrz HexEngine.fork/snapshot).
+"""
+
+import atexit
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, Tuple
+
+from ..core.engine import HexEngine
+from .batch import DEFAULT_LEAF_BATCH
+from .mcts import MCTSSearch, DEFAULT_EXPLORATION, DEFAULT_TIME_LIMIT
+
+
+_EXECUTOR: Optional[ProcessPoolExecutor] = None
+_EXECUTOR_WORKERS = 0
+_EXECUTOR_LOCK = threading.Lock()
+
+# Domyślna liczba procesów dla poziomu 'expert' (Config.AI_WORKERS)
+_DEFAULT_WORKERS = 1
+
+# Zapas czasu na przesłanie wyników z procesów roboczych [s]
+RESULT_GRACE_SECONDS = 0.05
+
+# Minimalny czas przeszukiwania lokalnego, gdy żaden proces nie odpowiedział
+# w terminie [s]
+FALLBACK_MIN_SECONDS = 0.1
+
+
+def configure_workers(workers: int) -> None:
+    """
+    Ustawia domyślną liczbę procesów przeszukiwania dla całego procesu
+    
+    Args:
+        workers: Liczba procesów (1 = przeszukiwanie w bieżącym procesie)
+    """
+    global _DEFAULT_WORKERS
+    if workers < 1:
+        raise ValueError("Liczba procesów musi być co najmniej 1")
+    _DEFAULT_WORKERS = workers
+
+
+def default_workers() -> int:
+    """Zwraca domyślną liczbę procesów przeszukiwania"""
+    return _DEFAULT_WORKERS
+
+
+def get_executor(workers: int) -> ProcessPoolExecutor:
+    """
+    Zwraca wspólną pulę procesów (tworzoną raz i ponownie używaną)
+    
+    Pula jest odtwarzana, gdy potrzeba więcej procesów niż ma istniejąca
+    (zadania innych sesji w starej puli są dokańczane) lub gdy została
+    uszkodzona (reset_executor).
+    
+    Args:
+        workers: Wymagana liczba procesów
+    
+    Returns:
+        Pula procesów
+    """
+    global _EXECUTOR, _EXECUTOR_WORKERS
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None or _EXECUTOR_WORKERS < workers:
+            if _EXECUTOR is not None:
+                _EXECUTOR.shutdown(wait=False)
+            _EXECUTOR = ProcessPoolExecutor(max_workers=workers)
+            _EXECUTOR_WORKERS = workers
+        return _EXECUTOR
+
+
+def reset_executor(executor: ProcessPoolExecutor) -> None:
+    """
+    Porzuca uszkodzoną pulę (np. po zakończeniu procesu roboczego) - kolejne
+    get_executor utworzy nową
+    
+    Args:
+        executor: Pula, której dotyczy błąd (pula już odtworzona przez inny
+            wątek nie jest porzucana)
+    """
+    global _EXECUTOR, _EXECUTOR_WORKERS
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is executor:
+            _EXECUTOR = None
+            _EXECUTOR_WORKERS = 0
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_executor() -> None:
+    """Zamyka wspólną pulę procesów"""
+    global _EXECUTOR, _EXECUTOR_WORKERS
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is not None:
+            _EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        _EXECUTOR = None
+        _EXECUTOR_WORKERS = 0
+
+
+atexit.register(shutdown_executor)
+
+
+def _search_worker(engine: HexEngine, playouts: Optional[int], seconds: Optional[float],
+                   exploration: float, seed: int,
+                   batch_size: int) -> Tuple[Dict[int, Tuple[int, int]], int]:
+    """
+    Zadanie procesu roboczego - niezależne przeszukiwanie pozycji
+    
+    Budżet czasu przekazywany jest jako liczba sekund (zegary procesów nie
+    muszą być porównywalne).
+    
+    Returns:
+        Krotka (statystyki ruchów korzenia, liczba rozgrywek)
+    """
+    search = MCTSSearch(playouts=playouts, time_limit=seconds,
+                        exploration=exploration, seed=seed, batch_size=batch_size)
+    statistics = search.root_statistics(engine)
+    return statistics, search.last_playouts
+
+
+def merge_statistics(results) -> Dict[int, Tuple[int, int]]:
+    """
+    Sumuje statystyki ruchów korzenia z niezależnych przeszukiwań
+    
+    Args:
+        results: Iterowalne słowniki {pole: (odwiedziny, wygrane)}
+    
+    Returns:
+        Połączony słownik {pole: (odwiedziny, wygrane)}
+    """
+    merged: Dict[int, Tuple[int, int]] = {}
+    for statistics in results:
+        for cell, (visits, wins) in statistics.items():
+            total_visits, total_wins = merged.get(cell, (0, 0))
+            merged[cell] = (total_visits + visits, total_wins + wins)
+    return merged
+
+
+class ParallelMCTSSearch:
+    """
+    MCTS ze zrównolegleniem korzenia w puli procesów
+    
+    Ma ten sam interfejs co MCTSSearch (search, last_playouts, last_elapsed).
+    Budżet rozgrywek dzielony jest równo pomiędzy procesy, a budżet czasu
+    obowiązuje każdy proces w całości.
+    """
+    
+    def __init__(self, workers: int, playouts: Optional[int] = None,
+                 time_limit: Optional[float] = None,
+                 exploration: float = DEFAULT_EXPLORATION, seed: Optional[int] = None,
+                 batch_size: int = 1):
+        """
+        Args:
+            workers: Liczba procesów
+            playouts: Łączny limit rozgrywek na ruch
+            time_limit: Limit czasu na ruch w sekundach
+            exploration: Stała eksploracji UCT
+            seed: Ziarno generatora ziaren procesów
+            batch_size: Liczba rozgrywek na liść (patrz MCTSSearch)
+        """
+        if workers < 1:
+            raise ValueError("Liczba procesów musi być co najmniej 1")
+        if playouts is not None and playouts <= 0:
+            raise ValueError("Liczba rozgrywek musi być dodatnia")
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError("Limit czasu musi być dodatni")
+        if batch_size < 1:
+            raise ValueError("Rozmiar wsadu musi być co najmniej 1")
+        if playouts is None and time_limit is None:
+            time_limit = DEFAULT_TIME_LIMIT
+        
+        self.workers = workers
+        self.playouts = playouts
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.batch_size = batch_size
+        self.rng = random.Random(seed)
+        
+        # Statystyki ostatniego wyszukiwania
+        self.last_playouts = 0
+        self.last_elapsed = 0.0
+        self.last_score = 0.0  # Odsetek wygranych wybranego ruchu
+    
+    def search(self, engine: HexEngine, deadline: Optional[float] = None) -> int:
+        """
+        Wyszukuje najlepszy ruch w puli procesów
+        
+        W terminie sumowane są statystyki procesów, które zdążyły odpowiedzieć.
+        Jeśli pula jest uszkodzona, przeszukiwanie wykonywane jest lokalnie
+        w pozostałym czasie (pula odtwarzana jest przy kolejnym ruchu); jeśli
+        żaden proces nie odpowiedział w terminie - lokalnie, przez
+        FALLBACK_MIN_SECONDS.
+        
+        Args:
+            engine: Silnik gry (nie jest modyfikowany)
+            deadline: Zewnętrzny termin jako czas time.perf_counter()
+        
+        Returns:
+            Płaski indeks wybranego pola
+        """
+        if engine.get_empty_count() == 0:
+            raise ValueError("Brak dostępnych ruchów")
+        
+        start = time.perf_counter()
+        if self.time_limit is not None:
+            own_deadline = start + self.time_limit
+            deadline = own_deadline if deadline is None else min(deadline, own_deadline)
+        seconds = max(deadline - start, 0.001) if deadline is not None else None
+        playouts = None
+        if self.playouts is not None:
+            playouts = max(1, -(-self.playouts // self.workers))
+        
+        executor = get_executor(self.workers)
+        results = []
+        total_playouts = 0
+        broken = False
+        try:
+            futures = [
+                executor.submit(_search_worker, engine, playouts, seconds,
+                                self.exploration, self.rng.getrandbits(32), self.batch_size)
+                for _ in range(self.workers)
+            ]
+        except BrokenProcessPool:
+            futures, broken = [], True
+        except RuntimeError:
+            futures = []  # Pula zamknięta w międzyczasie przez inny wątek
+        
+        # Czekanie do terminu, przerywane pierwszym błędem (uszkodzona pula
+        # zgłaszana jest od razu we wszystkich zadaniach)
+        timeout_at = start + seconds + RESULT_GRACE_SECONDS if seconds is not None else None
+        pending = set(futures)
+        while pending:
+            timeout = max(timeout_at - time.perf_counter(), 0) if timeout_at is not None else None
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_EXCEPTION)
+            if not done:
+                break
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    statistics, count = future.result()
+                    results.append(statistics)
+                    total_playouts += count
+                elif isinstance(error, BrokenProcessPool):
+                    broken = True
+            if broken:
+                break
+        for future in pending:
+            future.cancel()
+        if broken:
+            reset_executor(executor)
+        
+        if not results:
+            # Pula niedostępna - przeszukiwanie w bieżącym procesie (w pozostałym
+            # czasie, a po upływie terminu - przez FALLBACK_MIN_SECONDS)
+            now = time.perf_counter()
+            if deadline is not None and deadline - now < FALLBACK_MIN_SECONDS:
+                deadline = now + FALLBACK_MIN_SECONDS
+            fallback = MCTSSearch(playouts=self.playouts, exploration=self.exploration,
+                                  time_limit=None if deadline is None else deadline - now,
+                                  seed=self.rng.getrandbits(32), batch_size=self.batch_size)
+            cell = fallback.search(engine, deadline)
+            self.last_playouts = fallback.last_playouts
+            self.last_elapsed = time.perf_counter() - start
+            self.last_score = fallback.last_score
+            return cell
+        
+        merged = merge_statistics(results)
+        best = max(merged, key=lambda cell: merged[cell][0])
+        visits, wins = merged[best]
+        self.last_playouts = total_playouts
+        self.last_elapsed = time.perf_counter() - start
+        self.last_score = wins / visits if visits else 0.0
+        return best
+
+
+def create_search(workers: Optional[int] = None, playouts: Optional[int] = None,
+                  time_limit: Optional[float] = None, batch_size: int = DEFAULT_LEAF_BATCH):
+    """
+    Tworzy przeszukiwanie MCTS - równoległe, jeśli dostępny jest więcej niż 1 proces
+    
+    Args:
+        workers: Liczba procesów (domyślnie default_workers())
+        playouts: Limit rozgrywek na ruch
+        time_limit: Limit czasu na ruch w sekundach
+        batch_size: Liczba rozgrywek na liść (bez NumPy zawsze 1)
+    
+    Returns:
+        MCTSSearch lub ParallelMCTSSearch
+    """
+    if workers is None:
+        workers = default_workers()
+    if workers > 1:
+        return ParallelMCTSSearch(workers, playouts=playouts, time_limit=time_limit,
+                                  batch_size=batch_size)
+    return MCTSSearch(playouts=playouts, time_limit=time_limit, batch_size=batch_size)
+
+
+def available_cpus() -> int:
+    """Zwraca liczbę rdzeni dostępnych dla procesu"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
@@ -0,0 +1,108 @@
+"""
+Przeszukiwanie w czasie ruchu przeciwnika (pondering)
+
+Po ruchu AI jej drzewo MCTS jest dalej rozbudowywane w wątku tła, aż do
+nadejścia kolejnego żądania gry; przy następnym ruchu drzewo przechodzi do
+poddrzewa faktycznej odpowiedzi przeciwnika (MCTSSearch.reuse_tree).
+
+Łączny czas CPU przeznaczony na pondering jest ograniczony dla całego
+procesu: jednocześnie myśli co najwyżej `workers` sesji (nadmiarowe sesje
+po prostu nie myślą), a każda co najwyżej `max_seconds` na turę. Wątki
+współdzielą GIL z obsługą żądań, więc domyślnie pondering jest wyłączony.
+"""
+
+import threading
+import time
+from typing import Optional
+
+from ..core.engine import HexEngine
+
+
+DEFAULT_PONDER_SECONDS = 10.0  # Domyślny limit myślenia na turę przeciwnika [s]
+
+# Limity procesu (Config.AI_PONDER_WORKERS / AI_PONDER_SECONDS); 0 = wyłączone
+_PONDER_WORKERS = 0
+_PONDER_SECONDS = DEFAULT_PONDER_SECONDS
+_PONDER_SLOTS = threading.BoundedSemaphore(1)
+
+
+def configure_pondering(workers: int, max_seconds: float = DEFAULT_PONDER_SECONDS) -> None:
+    """
+    Ustawia limity przeszukiwania w tle dla całego procesu
+    
+    Args:
+        workers: Maksymalna liczba jednocześnie myślących sesji (0 = wyłączone)
+        max_seconds: Limit myślenia jednej sesji na turę przeciwnika
+    """
+    global _PONDER_WORKERS, _PONDER_SECONDS, _PONDER_SLOTS
+    if workers < 0:
+        raise ValueError("Liczba wątków nie może być ujemna")
+    if max_seconds <= 0:
+        raise ValueError("Limit czasu musi być dodatni")
+    _PONDER_WORKERS = workers
+    _PONDER_SECONDS = max_seconds
+    _PONDER_SLOTS = threading.BoundedSemaphore(max(workers, 1))
+
+
+def pondering_enabled() -> bool:
+    """Sprawdza czy przeszukiwanie w tle jest włączone"""
+    return _PONDER_WORKERS > 0
+
+
+class PonderTask:
+    """
+    Przeszukiwanie w tle jednej sesji
+    
+    Wątek jest demonem - nie wstrzymuje zamknięcia procesu.
+    """
+    
+    def __init__(self, thread: threading.Thread, stop: threading.Event):
+        """
+        Args:
+            thread: Wątek przeszukiwania (już uruchomiony)
+            stop: Zdarzenie przerywające przeszukiwanie
+        """
+        self._thread = thread
+        self._stop = stop
+    
+    @property
+    def running(self) -> bool:
+        """Czy przeszukiwanie jeszcze trwa"""
+        return self._thread.is_alive()
+    
+    def stop(self) -> None:
+        """Przerywa przeszukiwanie i czeka na jego zakończenie (drzewo wolne do użycia)"""
+        self._stop.set()
+        self._thread.join()
+
+
+def start_pondering(search, engine: HexEngine) -> Optional[PonderTask]:
+    """
+    Uruchamia przeszukiwanie pozycji w tle, jeśli pozwalają limity procesu
+    
+    Args:
+        search: Przeszukiwanie z metodą ponder (np. MCTSSearch)
+        engine: Silnik w pozycji po ruchu AI (na własność zadania - np. fork)
+    
+    Returns:
+        Zadanie lub None, jeśli pondering jest wyłączony albo wszystkie
+        miejsca są zajęte
+    """
+    if not pondering_enabled() or not _PONDER_SLOTS.acquire(blocking=False):
+        return None
+    
+    slots = _PONDER_SLOTS
+    stop = threading.Event()
+    deadline = time.perf_counter() + _PONDER_SECONDS
+    
+    def run() -> None:
+        try:
+            search.ponder(engine, stop, deadline)
+        except Exception:
+            search.reset_tree()  # Błąd w tle nie może zepsuć kolejnego ruchu
+        finally:
+            slots.release()
+    
+    thread = threading.Thread(target=run, name='hex-ponder', daemon=True)
+    thread.start()
+    return PonderTask(thread, stop)
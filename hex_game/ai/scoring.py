@@ -0,0 +1,148 @@
+"""
+Ocena wszystkich pól planszy naraz (poziomy 'medium' i 'hard')
+
+Ocena pola to suma wagi pozycji (bliskość środkowej linii gracza, premia za
+jego krawędzie) i premii za sąsiednie własne kamienie. Mapy wag liczone są
+raz na rozmiar planszy i gracza, a liczby sąsiadów - splotem planszy z
+sześciokątnym sąsiedztwem (sześć przesuniętych wycinków tablicy NumPy).
+Bez NumPy te same oceny liczone są w czystym Pythonie, przechodząc tylko
+po własnych kamieniach.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+from ..core.engine import HexEngine, Player
+from ..core.topology import RING_OFFSETS
+from .batch import NUMPY_AVAILABLE, np
+
+
+CENTER_BONUS = 10  # Premia za środkową linię (malejąca o 1 na pole)
+EDGE_BONUS = 15  # Premia za własną krawędź
+NEIGHBOR_BONUS = 5  # Premia za każdy sąsiedni własny kamień
+
+_WEIGHT_MAPS: Dict[Tuple[int, int], Sequence[int]] = {}
+_CENTER_MAPS: Dict[int, Sequence[int]] = {}
+
+
+def _as_map(values: List[int]) -> Sequence[int]:
+    """Zamienia listę wag na tablicę NumPy (jeśli dostępny)"""
+    return np.array(values, dtype=np.int32) if NUMPY_AVAILABLE else values
+
+
+def weight_map(board_size: int, player: Player) -> Sequence[int]:
+    """
+    Zwraca (wspólną) mapę wag pozycji pól dla gracza
+    
+    Args:
+        board_size: Rozmiar planszy
+        player: Gracz
+    
+    Returns:
+        Wagi pól w kolejności płaskich indeksów
+    """
+    key = (board_size, player.value)
+    weights = _WEIGHT_MAPS.get(key)
+    if weights is None:
+        center = board_size // 2
+        last = board_size - 1
+        values = []
+        for row in range(board_size):
+            for col in range(board_size):
+                if player == Player.PLAYER1:
+                    # Gracz 1 łączy górę z dołem - środkowe kolumny
+                    value = CENTER_BONUS - abs(col - center)
+                    value += EDGE_BONUS if row in (0, last) else 0
+                else:
+                    # Gracz 2 łączy lewo z prawem - środkowe rzędy
+                    value = CENTER_BONUS - abs(row - center)
+                    value += EDGE_BONUS if col in (0, last) else 0
+                values.append(value)
+        weights = _as_map(values)
+        _WEIGHT_MAPS[key] = weights
+    return weights
+
+
+def center_map(board_size: int) -> Sequence[int]:
+    """Zwraca (wspólną) mapę bliskości środka: minus odległość w metryce miejskiej"""
+    closeness = _CENTER_MAPS.get(board_size)
+    if closeness is None:
+        center = board_size // 2
+        closeness = _as_map([
+            -abs(row - center) - abs(col - center)
+            for row in range(board_size) for col in range(board_size)
+        ])
+        _CENTER_MAPS[board_size] = closeness
+    return closeness
+
+
+def neighbor_counts(engine: HexEngine, player: Player) -> Sequence[int]:
+    """
+    Zwraca liczbę sąsiednich kamieni gracza dla każdego pola planszy
+    
+    Args:
+        engine: Silnik gry
+        player: Gracz
+    
+    Returns:
+        Liczby sąsiadów w kolejności płaskich indeksów
+    """
+    size = engine.board_size
+    value = player.value
+    if NUMPY_AVAILABLE:
+        board = np.frombuffer(bytes(engine.cells), dtype=np.uint8).reshape(size, size)
+        padded = np.zeros((size + 2, size + 2), dtype=np.int32)
+        padded[1:-1, 1:-1] = board == value
+        counts = np.zeros((size, size), dtype=np.int32)
+        for dr, dc in RING_OFFSETS:
+            counts += padded[1 + dr:1 + dr + size, 1 + dc:1 + dc + size]
+        return counts.reshape(-1)
+    
+    counts = [0] * engine.topology.cells
+    neighbors = engine.topology.neighbors
+    cells = engine.cells
+    for cell in range(engine.topology.cells):
+        if cells[cell] == value:
+            for neighbor in neighbors[cell]:
+                counts[neighbor] += 1
+    return counts
+
+
+def score_cells(engine: HexEngine, player: Player) -> Sequence[int]:
+    """
+    Ocenia wszystkie pola planszy jako ruch gracza
+    
+    Ocena pola: waga pozycji z weight_map i NEIGHBOR_BONUS za każdy sąsiedni
+    kamień gracza (oceny zajętych pól nie mają znaczenia).
+    
+    Args:
+        engine: Silnik gry
+        player: Gracz wykonujący ruch
+    
+    Returns:
+        Oceny pól w kolejności płaskich indeksów
+    """
+    weights = weight_map(engine.board_size, player)
+    counts = neighbor_counts(engine, player)
+    if NUMPY_AVAILABLE:
+        return weights + NEIGHBOR_BONUS * counts
+    return [weight + NEIGHBOR_BONUS * count for weight, count in zip(weights, counts)]
+
+
+def best_cell(cells: List[int], scores: Sequence[int]) -> int:
+    """
+    Zwraca pole o najwyższej ocenie (przy remisie - o najniższym indeksie, jak
+    przy przeglądaniu planszy wierszami)
+    
+    Args:
+        cells: Płaskie indeksy rozważanych pól (niepusta lista)
+        scores: Oceny wszystkich pól planszy
+    
+    Returns:
+        Płaski indeks wybranego pola
+    """
+    if NUMPY_AVAILABLE:
+        index = np.asarray(cells, dtype=np.intp)
+        masked = np.full(len(scores), -np.inf)
+        masked[index] = np.asarray(scores)[index]
+        return int(np.argmax(masked))
+    return max(cells, key=lambda cell: (scores[cell], -cell))
@@ -0,0 +1,329 @@
+"""
+Dokładne rozwiązywanie końcówek - przeszukiwanie liczb dowodu (DFPN)
+
+Depth-first proof-number search w wersji negamax: dla każdej pozycji
+pamiętane są liczby (phi, delta) - minimalna liczba liści do udowodnienia
+wygranej gracza na ruchu i do jej obalenia. phi pozycji to minimum delta
+następników, a delta - suma ich phi; rozwijany jest zawsze następnik
+o najmniejszym delta, w progach wyznaczonych przez drugi najlepszy.
+
+W HEX nie ma remisów ani powtórzeń pozycji (graf pozycji jest acykliczny),
+więc wynik każdej udowodnionej pozycji jest ostateczny. Ruchy zawężane są
+tak, by nie zmienić wyniku:
+- pole natychmiastowej wygranej kończy dowód,
+- dwie groźby przeciwnika oznaczają przegraną, jedna - wymuszony ruch,
+- pola martwe, przechwycone i zdominowane (hex_game.ai.inferior) są pomijane.
+
+Tablica transpozycji indeksowana jest haszem kanonicznym (pozycja i jej
+obrót o 180° mają ten sam wynik) i zachowywana pomiędzy ruchami - pozycje
+rozwiązane nie są usuwane przy jej czyszczeniu.
+
+Koszt dowodu rośnie wykładniczo z liczbą pustych pól, więc gracz
+komputerowy próbuje rozwiązywać tylko pozycje mieszczące się w jego
+limicie (ograniczanym dodatkowo na dużych planszach - scaled_max_empty).
+Pozycja nierozwiązana w limicie jest zapamiętywana, a kolejna próba
+odkładana o FAILURE_BACKOFF pustych pól, by nie tracić limitu co ruch.
+"""
+
+import math
+import time
+from typing import Dict, List, Optional, Tuple
+
+from ..core.engine import HexEngine, Player, GameState
+from .connections import VirtualConnections
+from .inferior import analyse_cells
+from .scoring import center_map
+
+
+DEFAULT_MAX_EMPTY = 25  # Rozwiązywane są pozycje z co najwyżej tyloma pustymi polami
+DEFAULT_NODE_LIMIT = 200000  # Limit węzłów jednego rozwiązywania
+DEFAULT_TIME_LIMIT = 0.5  # Limit czasu jednego rozwiązywania [s]
+TT_MAX_ENTRIES = 500000  # Limit rozmiaru tablicy transpozycji
+UNSOLVED_MAX_ENTRIES = 10000  # Limit zapamiętanych pozycji nierozwiązanych w limicie
+
+# Skalowanie max_empty z rozmiarem planszy: koszt węzła rośnie z liczbą pól,
+# a koszt dowodu - około SCALING_GROWTH razy na każde puste pole
+SCALING_BASE_CELLS = 49  # Plansze do 7x7 - bez zmniejszania limitu
+SCALING_GROWTH = 2.5
+
+# Po nieudanym rozwiązywaniu kolejna próba dopiero o tyle pustych pól później
+FAILURE_BACKOFF = 4
+
+INFINITY = 10 ** 9  # Liczba dowodu pozycji rozstrzygniętej
+
+# Co ile węzłów sprawdzany jest termin
+_DEADLINE_CHECK_MASK = 255
+
+
+class _SolverLimit(Exception):
+    """Przerwanie po przekroczeniu limitu węzłów lub czasu"""
+
+
+def scaled_max_empty(max_empty: int, board_size: int) -> int:
+    """
+    Zmniejsza limit pustych pól dla plansz większych niż 7x7
+    
+    Args:
+        max_empty: Limit dla plansz do 7x7
+        board_size: Rozmiar planszy
+    
+    Returns:
+        Limit pustych pól dla planszy (co najmniej 1)
+    """
+    cells = board_size * board_size
+    if cells <= SCALING_BASE_CELLS:
+        return max_empty
+    return max(1, max_empty - round(math.log(cells / SCALING_BASE_CELLS, SCALING_GROWTH)))
+
+
+class ProofNumberSolver:
+    """
+    Rozwiązywanie końcówek metodą DFPN z limitem węzłów i czasu
+    
+    Pozycja nierozwiązana w limicie zwraca None - gracz komputerowy wybiera
+    wtedy ruch swoim zwykłym sposobem.
+    """
+    
+    def __init__(self, max_empty: int = DEFAULT_MAX_EMPTY, node_limit: int = DEFAULT_NODE_LIMIT,
+                 time_limit: Optional[float] = DEFAULT_TIME_LIMIT, scale_with_board: bool = False):
+        """
+        Args:
+            max_empty: Maksymalna liczba pustych pól rozwiązywanej pozycji
+            node_limit: Limit węzłów jednego rozwiązywania
+            time_limit: Limit czasu jednego rozwiązywania w sekundach (None = bez limitu)
+            scale_with_board: Czy can_solve zmniejsza max_empty na dużych
+                planszach (scaled_max_empty)
+        """
+        if max_empty < 1:
+            raise ValueError("Liczba pustych pól musi być co najmniej 1")
+        if node_limit < 1:
+            raise ValueError("Limit węzłów musi być co najmniej 1")
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError("Limit czasu musi być dodatni")
+        
+        self.max_empty = max_empty
+        self.node_limit = node_limit
+        self.time_limit = time_limit
+        self.scale_with_board = scale_with_board
+        
+        # Wpisy: hasz kanoniczny -> (phi, delta) z perspektywy gracza na ruchu
+        self.table: Dict[int, Tuple[int, int]] = {}
+        # Ruchy pozycji w bieżącym rozwiązywaniu: hasz -> [(pole, hasz następnika)]
+        self._moves: Dict[int, List[Tuple[int, int]]] = {}
+        self._deadline: Optional[float] = None
+        self._nodes = 0
+        
+        # Pozycje nierozwiązane w limicie (hasze kanoniczne) i odłożenie
+        # kolejnej próby: liczba pustych pól ostatniej porażki i próg ponownej
+        self._unsolved = set()
+        self._failed_empty: Optional[int] = None
+        self._retry_empty: Optional[int] = None
+        
+        # Statystyki ostatniego rozwiązywania
+        self.last_nodes = 0
+        self.last_elapsed = 0.0
+        self.last_result: Optional[bool] = None
+    
+    def can_solve(self, engine: HexEngine) -> bool:
+        """
+        Sprawdza czy pozycja kwalifikuje się do rozwiązywania
+        
+        Pozycja musi mieścić się w limicie pustych pól, nie być wcześniej
+        nierozwiązana w limicie i - po porażce - mieć co najmniej
+        FAILURE_BACKOFF pustych pól mniej niż pozycja nierozwiązana (więcej
+        pustych pól niż przy porażce oznacza nową partię lub cofnięte ruchy).
+        """
+        if engine.game_state != GameState.IN_PROGRESS:
+            return False
+        empty = engine.get_empty_count()
+        limit = self.max_empty
+        if self.scale_with_board:
+            limit = scaled_max_empty(limit, engine.board_size)
+        if self._failed_empty is not None:
+            if empty > self._failed_empty:
+                self._failed_empty = self._retry_empty = None
+            else:
+                limit = min(limit, self._retry_empty)
+        return empty <= limit and engine.get_canonical_hash() not in self._unsolved
+    
+    def solve(self, engine: HexEngine, deadline: Optional[float] = None) -> Optional[bool]:
+        """
+        Rozwiązuje pozycję
+        
+        Args:
+            engine: Silnik gry (nie jest modyfikowany)
+            deadline: Zewnętrzny termin jako czas time.perf_counter()
+                (obowiązuje wcześniejszy z terminu i time_limit)
+        
+        Returns:
+            True - gracz na ruchu wygrywa, False - przegrywa, None - nie
+            rozstrzygnięto w limicie
+        """
+        if engine.game_state != GameState.IN_PROGRESS:
+            raise ValueError("Gra jest zakończona")
+        
+        start = time.perf_counter()
+        if self.time_limit is not None:
+            own_deadline = start + self.time_limit
+            deadline = own_deadline if deadline is None else min(deadline, own_deadline)
+        self._deadline = deadline
+        self._nodes = 0
+        if len(self.table) > TT_MAX_ENTRIES:
+            self.table = {key: entry for key, entry in self.table.items()
+                          if entry[0] == 0 or entry[1] == 0}
+        
+        simulation = engine.fork()
+        try:
+            self._mid(simulation, INFINITY, INFINITY)
+        except _SolverLimit:
+            pass
+        finally:
+            self._moves.clear()
+        
+        key = simulation.get_canonical_hash()
+        phi, delta = self.table.get(key, (1, 1))
+        result = True if phi == 0 else False if delta == 0 else None
+        if result is None:
+            if len(self._unsolved) >= UNSOLVED_MAX_ENTRIES:
+                self._unsolved.clear()
+            self._unsolved.add(key)
+            self._failed_empty = engine.get_empty_count()
+            self._retry_empty = self._failed_empty - FAILURE_BACKOFF
+        self.last_nodes = self._nodes
+        self.last_elapsed = time.perf_counter() - start
+        self.last_result = result
+        return result
+    
+    def best_move(self, engine: HexEngine, deadline: Optional[float] = None) -> Optional[int]:
+        """
+        Zwraca ruch wygrywający w pozycji udowodnionej jako wygrana
+        
+        Args:
+            engine: Silnik gry (nie jest modyfikowany)
+            deadline: Zewnętrzny termin jako czas time.perf_counter()
+        
+        Returns:
+            Płaski indeks pola lub None, jeśli pozycja jest przegrana albo
+            nierozstrzygnięta
+        """
+        if not self.solve(engine, deadline):
+            return None
+        
+        mover = engine.current_player
+        winning = engine.get_winning_indices(mover)
+        if winning:
+            return winning[0]
+        simulation = engine.fork()
+        for cell in simulation.get_empty_indices():
+            simulation.push_cell(cell)
+            _, delta = self.table.get(simulation.get_canonical_hash(), (1, 1))
+            simulation.pop_move()
+            if delta == 0:
+                return cell
+        
+        # Wygrana udowodniona połączeniem wirtualnym (bez rozwijania ruchów) -
+        # ruch w nośniku połączenia, dowodzony w pozostałym limicie
+        opponent = Player.PLAYER2 if mover == Player.PLAYER1 else Player.PLAYER1
+        carriers = VirtualConnections(simulation).must_play(opponent) or ()
+        closeness = center_map(simulation.board_size)
+        for cell in sorted(carriers, key=closeness.__getitem__, reverse=True):
+            simulation.push_cell(cell)
+            child = simulation.get_canonical_hash()
+            try:
+                self._mid(simulation, INFINITY, INFINITY)
+            except _SolverLimit:
+                return None
+            finally:
+                self._moves.clear()
+                simulation.pop_move()
+            if self.table[child][1] == 0:
+                return cell
+        return None
+    
+    def reset_table(self) -> None:
+        """Porzuca tablicę transpozycji i pamięć pozycji nierozwiązanych"""
+        self.table = {}
+        self._unsolved = set()
+        self._failed_empty = self._retry_empty = None
+    
+    def _expand(self, simulation: HexEngine) -> Optional[List[int]]:
+        """
+        Wyznacza ruchy pozycji
+        
+        Returns:
+            Ruchy do rozważenia (pusta lista - przegrana) lub None, jeśli
+            gracz na ruchu wygrywa natychmiast
+        """
+        mover = simulation.current_player
+        if simulation.get_winning_indices(mover):
+            return None
+        opponent = Player.PLAYER2 if mover == Player.PLAYER1 else Player.PLAYER1
+        threats = simulation.get_winning_indices(opponent)
+        if threats:
+            return threats if len(threats) == 1 else []  # Dwóch gróźb nie da się zablokować
+        
+        connections = VirtualConnections(simulation)
+        if connections.must_play(opponent) is not None:
+            return None  # Gracz na ruchu jest już wirtualnie połączony
+        empty = simulation.get_empty_indices()
+        pruned = analyse_cells(simulation, mover).pruned()
+        moves = [cell for cell in empty if cell not in pruned] or empty
+        must_play = connections.must_play(mover)
+        if must_play is not None:
+            moves = [cell for cell in moves if cell in must_play]
+        moves.sort(key=center_map(simulation.board_size).__getitem__, reverse=True)
+        return moves
+    
+    def _mid(self, simulation: HexEngine, phi_threshold: int, delta_threshold: int) -> None:
+        """Rozwija pozycję, aż jej (phi, delta) przekroczy progi"""
+        self._nodes += 1
+        if self._nodes > self.node_limit or (
+                not self._nodes & _DEADLINE_CHECK_MASK and self._deadline is not None
+                and time.perf_counter() >= self._deadline):
+            raise _SolverLimit()
+        
+        key = simulation.get_canonical_hash()
+        # Ruchy zależą od orientacji pozycji - pamiętane pod zwykłym haszem
+        # razem z haszami kanonicznymi następników
+        position = simulation.get_position_hash()
+        children = self._moves.get(position)
+        if children is None:
+            moves = self._expand(simulation)
+            if moves is None:
+                self.table[key] = (0, INFINITY)
+                return
+            if not moves:
+                self.table[key] = (INFINITY, 0)
+                return
+            children = []
+            for cell in moves:
+                simulation.push_cell(cell)
+                children.append((cell, simulation.get_canonical_hash()))
+                simulation.pop_move()
+            self._moves[position] = children
+        
+        table = self.table
+        while True:
+            # phi = min delta następników, delta = suma ich phi
+            phi, delta = INFINITY, 0
+            best, best_phi, second_delta = children[0][0], 1, INFINITY
+            for cell, child_key in children:
+                child_phi, child_delta = table.get(child_key, (1, 1))
+                delta = min(delta + child_phi, INFINITY)
+                if child_delta < phi:
+                    second_delta = phi
+                    phi, best, best_phi = child_delta, cell, child_phi
+                elif child_delta < second_delta:
+                    second_delta = child_delta
+            
+            table[key] = (phi, delta)
+            if phi >= phi_threshold or delta >= delta_threshold:
+                return
+            
+            simulation.push_cell(best)
+            try:
+                self._mid(simulation,
+                          min(delta_threshold - delta + best_phi, INFINITY),
+                          min(phi_threshold, second_delta + 1))
+            finally:
+                simulation.pop_move()
@@ -0,0 +1,379 @@
+"""
+Tablice końcówek dla małych plansz (3x3-5x5) mapowane z dysku
+
+Plik tablicy zawiera posortowane hasze kanoniczne pozycji (gracz na ruchu
+wynika z haszu) z wynikiem i najlepszym ruchem. Wyszukiwanie to przeszukanie
+binarne pliku zmapowanego w pamięci (mmap): strony pliku trafiają do pamięci
+podręcznej systemu, wspólnej dla wszystkich procesów serwera, zamiast do
+sterty każdego z nich.
+
+Plansze 3x3 i 4x4 rozwiązywane są w całości - każda pozycja osiągalna
+w partii, z liczbą półruchów do końca przy grze optymalnej (zwycięzca
+kończy najszybciej, przegrywający broni się najdłużej). Plansza 5x5 ma
+rzędu 10^11 pozycji, więc tablica obejmuje tylko pozycje do `max_stones`
+kamieni (rozwiązywane przez hex_game.ai.solver); późniejsze pozycje
+rozwiązuje solver w trakcie gry.
+
+Format pliku (little-endian):
+    nagłówek: MAGIC, rozmiar planszy (uint8), bajt zarezerwowany, liczba wpisów (uint64)
+    klucze: hasze kanoniczne, rosnąco (uint64)
+    ruchy: pole w orientacji haszu kanonicznego (uint8, NO_MOVE - brak)
+    wyniki: WIN_FLAG dla wygranej gracza na ruchu | liczba półruchów do
+        końca partii (0 - nieznana)
+
+Generowanie (offline):
+    python -m hex_game.ai.tablebase --sizes 3 4 5 --output tablebases
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from ..core.engine import HexEngine, MIN_BOARD_SIZE
+from ..core.zobrist import get_zobrist_table
+from ..core.topology import get_topology
+from .scoring import center_map
+from .solver import ProofNumberSolver
+
+
+MAGIC = b'HEXTB1'
+_HEADER = struct.Struct('<6sBBQ')
+_KEY = struct.Struct('<Q')
+
+NO_MOVE = 255  # Brak zapisanego ruchu (przegrana bez znanej obrony)
+WIN_FLAG = 0x80  # Bit wygranej gracza na ruchu w bajcie wyniku
+PLIES_MASK = 0x7F  # Liczba półruchów do końca partii w bajcie wyniku
+
+TABLEBASE_SIZES = (3, 4, 5)  # Rozmiary planszy obsługiwane przez generator
+FULL_SOLVE_MAX_SIZE = 4  # Największa plansza rozwiązywana w całości
+DEFAULT_MAX_STONES = 2  # Większe plansze: pozycje do tylu kamieni
+
+# Katalog tablic (Config.TABLEBASE_DIR; None = wyłączone) i otwarte tablice
+_TABLEBASE_DIR: Optional[str] = None
+_TABLEBASES: Dict[int, Optional['Tablebase']] = {}
+
+
+def tablebase_path(directory: str, board_size: int) -> str:
+    """Zwraca ścieżkę pliku tablicy dla rozmiaru planszy"""
+    return os.path.join(directory, f"hex{board_size}.tb")
+
+
+class Tablebase:
+    """
+    Tablica końcówek jednego rozmiaru planszy (plik zmapowany w pamięci)
+    
+    Odczyty nie modyfikują stanu, więc jedna instancja może obsługiwać
+    wiele wątków.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Ścieżka pliku wygenerowanego przez generate_tablebase
+        """
+        with open(path, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, board_size, _, count = _HEADER.unpack_from(self._map, 0)
+        self._keys = _HEADER.size
+        self._moves = self._keys + _KEY.size * count
+        self._results = self._moves + count
+        if magic != MAGIC or len(self._map) != self._results + count:
+            self._map.close()
+            raise ValueError(f"Nieprawidłowy plik tablicy końcówek: {path}")
+        self.board_size = board_size
+        self.count = count
+    
+    def _find(self, key: int) -> int:
+        """Zwraca indeks wpisu o danym kluczu lub -1 (przeszukiwanie binarne)"""
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            probe = _KEY.unpack_from(self._map, self._keys + _KEY.size * middle)[0]
+            if probe < key:
+                low = middle + 1
+            elif probe > key:
+                high = middle
+            else:
+                return middle
+        return -1
+    
+    def probe(self, engine: HexEngine) -> Optional[Tuple[bool, Optional[int]]]:
+        """
+        Odczytuje wynik pozycji
+        
+        Args:
+            engine: Silnik gry w pozycji w toku gry
+        
+        Returns:
+            Krotka (czy gracz na ruchu wygrywa, płaski indeks najlepszego
+            ruchu lub None) albo None, jeśli pozycji nie ma w tablicy
+        """
+        if engine.board_size != self.board_size:
+            raise ValueError("Rozmiar planszy nie pasuje do tablicy końcówek")
+        key = engine.get_canonical_hash()
+        index = self._find(key)
+        if index < 0:
+            return None
+        
+        move = self._map[self._moves + index]
+        result = self._map[self._results + index]
+        cell = None
+        if move != NO_MOVE:
+            # Ruch zapisany jest w orientacji haszu kanonicznego
+            cell = engine.to_canonical_cell(move)
+        return bool(result & WIN_FLAG), cell
+    
+    def close(self) -> None:
+        """Zamyka mapowanie pliku"""
+        self._map.close()
+
+
+def configure_tablebase(directory: Optional[str]) -> None:
+    """
+    Ustawia katalog tablic końcówek dla całego procesu
+    
+    Args:
+        directory: Katalog z plikami hex<N>.tb (None = wyłączone)
+    """
+    global _TABLEBASE_DIR
+    for tablebase in _TABLEBASES.values():
+        if tablebase is not None:
+            tablebase.close()
+    _TABLEBASES.clear()
+    _TABLEBASE_DIR = directory
+
+
+def get_tablebase(board_size: int) -> Optional[Tablebase]:
+    """
+    Zwraca (otwieraną przy pierwszym użyciu) tablicę dla rozmiaru planszy
+    
+    Returns:
+        Tablica lub None, jeśli tablice są wyłączone albo brak pliku
+    """
+    if _TABLEBASE_DIR is None or board_size not in TABLEBASE_SIZES:
+        return None
+    if board_size not in _TABLEBASES:
+        path = tablebase_path(_TABLEBASE_DIR, board_size)
+        _TABLEBASES[board_size] = Tablebase(path) if os.path.exists(path) else None
+    return _TABLEBASES[board_size]
+
+
+def _solve_all(board_size: int) -> Tuple[array, bytearray, bytearray]:
+    """
+    Rozwiązuje wszystkie osiągalne pozycje planszy (pełne przeszukiwanie)
+    
+    Plansza reprezentowana jest maskami bitowymi kamieni, a rozwiązane
+    pozycje - w tablicy indeksowanej zapisem trójkowym planszy (3^(n²)
+    bajtów, stąd ograniczenie do FULL_SOLVE_MAX_SIZE).
+    
+    Returns:
+        Klucze (hasze kanoniczne), ruchy i wyniki wszystkich pozycji
+    """
+    size = board_size
+    cells = size * size
+    full = (1 << cells) - 1
+    first_col = sum(1 << (row * size) for row in range(size))
+    last_col = first_col << (size - 1)
+    top_row = (1 << size) - 1
+    # Krawędzie graczy: 1 - góra i dół, 2 - lewo i prawo
+    goals = {1: (top_row, top_row << (cells - size)), 2: (first_col, last_col)}
+    zobrist = get_zobrist_table(size)
+    rotate = get_topology(size).rotate
+    closeness = center_map(size)
+    order = sorted(range(cells), key=closeness.__getitem__, reverse=True)
+    powers = [3 ** cell for cell in range(cells)]
+    
+    codes = bytearray(3 ** cells)  # 0 - pozycja jeszcze nie rozwiązana
+    moves = bytearray(3 ** cells)
+    keys = array('Q')
+    out_moves = bytearray()
+    out_results = bytearray()
+    
+    def expand(mask: int) -> int:
+        """Dodaje do maski wszystkich sąsiadów jej pól"""
+        right = mask & ~last_col
+        left = mask & ~first_col
+        return (mask | mask >> size | mask << size | right << 1 | left >> 1
+                | right >> (size - 1) | left << (size - 1)) & full
+    
+    def connects(stones: int, cell: int, value: int) -> bool:
+        """Sprawdza czy grupa kamienia na polu `cell` łączy krawędzie gracza"""
+        group = 1 << cell
+        while True:
+            grown = expand(group) & stones
+            if grown == group:
+                break
+            group = grown
+        start, end = goals[value]
+        return bool(group & start) and bool(group & end)
+    
+    def solve(own: int, other: int, index: int, rotated: int, key: int, rotated_key: int,
+              value: int) -> Tuple[int, int]:
+        """Zwraca (bajt wyniku, ruch) pozycji z perspektywy gracza `value` na ruchu"""
+        # Pozycja i jej obrót dzielą wpis w orientacji mniejszego haszu
+        # (reguła HexEngine.to_canonical_cell na haszach liczonych tutaj)
+        flipped = rotated_key < key
+        slot = rotated if flipped else index
+        code = codes[slot]
+        if code:
+            move = moves[slot]
+            return code, rotate(move) if flipped else move
+        
+        occupied = own | other
+        win_move = loss_move = -1
+        win_plies, loss_plies = cells + 1, 0
+        for cell in order:
+            bit = 1 << cell
+            if occupied & bit:
+                continue
+            stones = own | bit
+            if connects(stones, cell, value):
+                wins, plies = True, 1
+            else:
+                mirror = rotate(cell)
+                child, _ = solve(other, stones, index + value * powers[cell],
+                                 rotated + value * powers[mirror],
+                                 key ^ zobrist.key(value, cell),
+                                 rotated_key ^ zobrist.key(value, mirror), 3 - value)
+                wins, plies = not child & WIN_FLAG, (child & PLIES_MASK) + 1
+            # Zwycięzca kończy najszybciej, przegrywający broni się najdłużej
+            if wins and plies < win_plies:
+                win_move, win_plies = cell, plies
+            elif not wins and plies > loss_plies:
+                loss_move, loss_plies = cell, plies
+        
+        if win_move >= 0:
+            code, move = WIN_FLAG | win_plies, win_move
+        else:
+            code, move = loss_plies, loss_move
+        stored = rotate(move) if flipped else move
+        codes[slot] = code
+        moves[slot] = stored
+        side = zobrist.side_key if value == 2 else 0
+        keys.append(min(key, rotated_key) ^ side)
+        out_moves.append(stored)
+        out_results.append(code)
+        return code, move
+    
+    solve(0, 0, 0, 0, 0, 0, 1)
+    return keys, out_moves, out_results
+
+
+def _solve_opening(board_size: int, max_stones: int) -> Tuple[array, bytearray, bytearray]:
+    """
+    Rozwiązuje pozycje do `max_stones` kamieni przeszukiwaniem liczb dowodu
+    
+    Returns:
+        Klucze (hasze kanoniczne), ruchy i wyniki pozycji (liczba półruchów
+        nieznana; przegrane bez ruchu)
+    """
+    cells = board_size * board_size
+    solver = ProofNumberSolver(max_empty=cells, node_limit=sys.maxsize, time_limit=None)
+    keys = array('Q')
+    moves = bytearray()
+    results = bytearray()
+    seen = set()
+    
+    def visit(engine: HexEngine, stones: int) -> None:
+        key = engine.get_canonical_hash()
+        if key in seen:
+            return
+        seen.add(key)
+        move = solver.best_move(engine)
+        if move is None:
+            stored = NO_MOVE
+        else:
+            stored = engine.to_canonical_cell(move)
+        keys.append(key)
+        moves.append(stored)
+        results.append(WIN_FLAG if solver.last_result else 0)
+        if stones < max_stones:
+            for cell in engine.get_empty_indices():
+                engine.push_cell(cell)
+                if engine.winner is None:
+                    visit(engine, stones + 1)
+                engine.pop_move()
+    
+    visit(HexEngine(board_size), 0)
+    return keys, moves, results
+
+
+def write_tablebase(path: str, board_size: int, keys: array, moves: bytearray,
+                    results: bytearray) -> None:
+    """
+    Zapisuje wpisy do pliku tablicy (posortowane; zapis atomowy)
+    
+    Args:
+        path: Ścieżka pliku docelowego
+        board_size: Rozmiar planszy
+        keys: Hasze kanoniczne pozycji (bez powtórzeń)
+        moves: Ruchy w orientacji haszy kanonicznych
+        results: Bajty wyników
+    """
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    sorted_keys = array('Q', (keys[index] for index in order))
+    if sys.byteorder == 'big':
+        sorted_keys.byteswap()
+    temporary = path + '.tmp'
+    with open(temporary, 'wb') as file:
+        file.write(_HEADER.pack(MAGIC, board_size, 0, len(order)))
+        sorted_keys.tofile(file)
+        file.write(bytes(moves[index] for index in order))
+        file.write(bytes(results[index] for index in order))
+    os.replace(temporary, path)
+
+
+def generate_tablebase(board_size: int, directory: str,
+                       max_stones: int = DEFAULT_MAX_STONES) -> int:
+    """
+    Generuje plik tablicy końcówek dla rozmiaru planszy
+    
+    Args:
+        board_size: Rozmiar planszy (TABLEBASE_SIZES)
+        directory: Katalog docelowy (tworzony w razie potrzeby)
+        max_stones: Limit kamieni w pozycjach plansz większych niż
+            FULL_SOLVE_MAX_SIZE
+    
+    Returns:
+        Liczba zapisanych pozycji
+    """
+    if board_size not in TABLEBASE_SIZES:
+        raise ValueError(f"Dostępne rozmiary tablic: {', '.join(map(str, TABLEBASE_SIZES))}")
+    if max_stones < 0:
+        raise ValueError("Limit kamieni nie może być ujemny")
+    
+    if board_size <= FULL_SOLVE_MAX_SIZE:
+        keys, moves, results = _solve_all(board_size)
+    else:
+        keys, moves, results = _solve_opening(board_size, max_stones)
+    os.makedirs(directory, exist_ok=True)
+    write_tablebase(tablebase_path(directory, board_size), board_size, keys, moves, results)
+    return len(keys)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Generator tablic końcówek (wiersz poleceń)"""
+    import argparse
+    import time
+    
+    parser = argparse.ArgumentParser(description='Generator tablic końcówek HEX')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(TABLEBASE_SIZES),
+                        choices=[size for size in TABLEBASE_SIZES if size >= MIN_BOARD_SIZE],
+                        help='Rozmiary planszy')
+    parser.add_argument('--output', default='tablebases', help='Katalog docelowy')
+    parser.add_argument('--max-stones', type=int, default=DEFAULT_MAX_STONES,
+                        help=f'Limit kamieni dla plansz większych niż {FULL_SOLVE_MAX_SIZE}x{FULL_SOLVE_MAX_SIZE}')
+    args = parser.parse_args(argv)
+    
+    for size in args.sizes:
+        start = time.perf_counter()
+        count = generate_tablebase(size, args.output, args.max_stones)
+        print(f"{size}x{size}: {count} pozycji, {time.perf_counter() - start:.1f} s "
+              f"-> {tablebase_path(args.output, size)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -6,6 +6,9 @@ import os
 import json
 from typing import Dict, Any
 
+from ..core.backends import ENGINE_BACKENDS
+from ..core.engine import MIN_BOARD_SIZE, MAX_BOARD_SIZE
+
 
 class Config:
     """Bazowa konfiguracja"""
@@ -13,12 +16,37 @@ class Config:
     STORAGE_TYPE = os.environ.get('STORAGE_TYPE') or 'memory'
     STORAGE_DIR = os.environ.get('STORAGE_DIR') or 'saved_games'
     MAX_GAMES = int(os.environ.get('MAX_GAMES', 100))
-    MAX_BOARD_SIZE = int(os.environ.get('MAX_BOARD_SIZE', 25))
+    MAX_BOARD_SIZE = int(os.environ.get('MAX_BOARD_SIZE', 25))  # Do 50 (tryb dużych plansz)
     MIN_BOARD_SIZE = int(os.environ.get('MIN_BOARD_SIZE', 3))
     
+    # Backend silnika gry ('standard' lub 'bitboard')
+    ENGINE_BACKEND = os.environ.get('ENGINE_BACKEND', 'standard')
+    
     # Timeouts
     GAME_TIMEOUT_MINUTES = int(os.environ.get('GAME_TIMEOUT_MINUTES', 60))
-    MOVE_TIMEOUT_SECONDS = int(os.environ.get('MOVE_TIMEOUT_SECONDS', 30))
+    MOVE_TIMEOUT_SECONDS = int(os.environ.get('MOVE_TIMEOUT_SECONDS', 30))  # Ogranicza też czas ruchu AI
+    
+    # Liczba procesów przeszukiwania AI 'expert' (1 = bez puli procesów)
+    AI_WORKERS = int(os.environ.get('AI_WORKERS', 1))
+    
+    # Myślenie AI 'expert' w czasie ruchu człowieka: liczba jednocześnie
+    # myślących gier (0 = wyłączone) i limit na turę [s]
+    AI_PONDER_WORKERS = int(os.environ.get('AI_PONDER_WORKERS', 0))
+    AI_PONDER_SECONDS = int(os.environ.get('AI_PONDER_SECONDS', 10))
+    
+    # Po ilu sekundach bez ruchu gra zwalnia stan przeszukiwania AI
+    # (drzewo MCTS, tablice transpozycji i rozwiązywania końcówek)
+    AI_IDLE_SECONDS = int(os.environ.get('AI_IDLE_SECONDS', 300))
+    
+    # Katalog tablic końcówek plansz 3x3-5x5 (python -m hex_game.ai.tablebase);
+    # brak plików = AI bez tablic
+    TABLEBASE_DIR = os.environ.get('TABLEBASE_DIR') or 'tablebases'
+    
+    # Katalog książek otwarć (python -m hex_game.ai.book); brak plików = bez książek
+    OPENING_BOOK_DIR = os.environ.get('OPENING_BOOK_DIR') or 'books'
+    
+    # Limit wpisów wspólnej pamięci wyników AI (0 = wyłączona)
+    AI_CACHE_SIZE = int(os.environ.get('AI_CACHE_SIZE', 10000))
     
     # Rate limiting
     RATE_LIMIT_ENABLED = os.environ.get('RATE_LIMIT_ENABLED', 'false').lower() == 'true'
@@ -163,8 +191,8 @@ class ConfigManager:
         if 'MAX_BOARD_SIZE' in config:
             try:
                 max_size = int(config['MAX_BOARD_SIZE'])
-                if max_size < 3 or max_size > 50:
-                    errors['MAX_BOARD_SIZE'] = 'Musi być między 3 a 50'
+                if max_size < MIN_BOARD_SIZE or max_size > MAX_BOARD_SIZE:
+                    errors['MAX_BOARD_SIZE'] = f'Musi być między {MIN_BOARD_SIZE} a {MAX_BOARD_SIZE}'
             except (ValueError, TypeError):
                 errors['MAX_BOARD_SIZE'] = 'Musi być liczbą całkowitą'
         
@@ -172,11 +200,63 @@ class ConfigManager:
         if 'MIN_BOARD_SIZE' in config:
             try:
                 min_size = int(config['MIN_BOARD_SIZE'])
-                if min_size < 3:
-                    errors['MIN_BOARD_SIZE'] = 'Musi być co najmniej 3'
+                if min_size < MIN_BOARD_SIZE:
+                    errors['MIN_BOARD_SIZE'] = f'Musi być co najmniej {MIN_BOARD_SIZE}'
             except (ValueError, TypeError):
                 errors['MIN_BOARD_SIZE'] = 'Musi być liczbą całkowitą'
         
+        # Walidacja MOVE_TIMEOUT_SECONDS (budżet czasu ruchu AI)
+        if 'MOVE_TIMEOUT_SECONDS' in config:
+            try:
+                if int(config['MOVE_TIMEOUT_SECONDS']) < 1:
+                    errors['MOVE_TIMEOUT_SECONDS'] = 'Musi być co najmniej 1'
+            except (ValueError, TypeError):
+                errors['MOVE_TIMEOUT_SECONDS'] = 'Musi być liczbą całkowitą'
+        
+        # Walidacja AI_WORKERS
+        if 'AI_WORKERS' in config:
+            try:
+                if int(config['AI_WORKERS']) < 1:
+                    errors['AI_WORKERS'] = 'Musi być co najmniej 1'
+            except (ValueError, TypeError):
+                errors['AI_WORKERS'] = 'Musi być liczbą całkowitą'
+        
+        # Walidacja AI_PONDER_WORKERS i AI_PONDER_SECONDS
+        if 'AI_PONDER_WORKERS' in config:
+            try:
+                if int(config['AI_PONDER_WORKERS']) < 0:
+                    errors['AI_PONDER_WORKERS'] = 'Nie może być ujemna'
+            except (ValueError, TypeError):
+                errors['AI_PONDER_WORKERS'] = 'Musi być liczbą całkowitą'
+        
+        if 'AI_PONDER_SECONDS' in config:
+            try:
+                if int(config['AI_PONDER_SECONDS']) < 1:
+                    errors['AI_PONDER_SECONDS'] = 'Musi być co najmniej 1'
+            except (ValueError, TypeError):
+                errors['AI_PONDER_SECONDS'] = 'Musi być liczbą całkowitą'
+        
+        # Walidacja AI_IDLE_SECONDS
+        if 'AI_IDLE_SECONDS' in config:
+            try:
+                if int(config['AI_IDLE_SECONDS']) < 1:
+                    errors['AI_IDLE_SECONDS'] = 'Musi być co najmniej 1'
+            except (ValueError, TypeError):
+                errors['AI_IDLE_SECONDS'] = 'Musi być liczbą całkowitą'
+        
+        # Walidacja AI_CACHE_SIZE
+        if 'AI_CACHE_SIZE' in config:
+            try:
+                if int(config['AI_CACHE_SIZE']) < 0:
+                    errors['AI_CACHE_SIZE'] = 'Nie może być ujemny'
+            except (ValueError, TypeError):
+                errors['AI_CACHE_SIZE'] = 'Musi być liczbą całkowitą'
+        
+        # Walidacja ENGINE_BACKEND
+        if 'ENGINE_BACKEND' in config:
+            if config['ENGINE_BACKEND'] not in ENGINE_BACKENDS:
+                errors['ENGINE_BACKEND'] = f'Musi być jednym z: {", ".join(ENGINE_BACKENDS)}'
+        
         # Sprawdź czy MIN <= MAX
         if 'MIN_BOARD_SIZE' in config and 'MAX_BOARD_SIZE' in config:
             try:
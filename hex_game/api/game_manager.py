@@ -3,37 +3,102 @@ Game Manager - Zarządza grami w aplikacji Flask
 """
 
 import uuid
+import json
 import time
+from array import array
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 
 from ..core.engine import HexEngine, GameState, Player
+from ..core.backends import DEFAULT_BACKEND, create_engine, engine_from_dict
 from ..players.computer_player import ComputerPlayer
+from ..ai.evaluation import TwoDistanceEvaluator
+from ..ai.inferior import analyse_cells
+from ..ai.cache import get_ai_cache
 from ..storage.game_storage import GameStorage
 
 
+DEFAULT_MOVE_TIMEOUT = 30.0  # Domyślny limit czasu ruchu [s] (Config.MOVE_TIMEOUT_SECONDS)
+AI_BUDGET_FRACTION = 0.8  # Część limitu dostępna dla AI - reszta na wykonanie ruchu i odpowiedź
+DEFAULT_AI_IDLE_SECONDS = 300.0  # Domyślny czas bezczynności zwalniający stan AI [s] (Config.AI_IDLE_SECONDS)
+
+
 class GameSession:
     """Sesja gry z dodatkowymi metadanymi"""
     
+    # Kompaktowa reprezentacja - sesje bezczynnych gier trzymane są w pamięci
+    __slots__ = (
+        'game_id', 'engine', 'player1_data', 'player2_data',
+        '_created_ts', '_last_move_ts', 'move_times', 'total_moves', 'computer_players',
+        '_ai_state',
+    )
+    
     def __init__(self, game_id: str, engine: HexEngine, player1_data: Dict, player2_data: Dict):
         self.game_id = game_id
         self.engine = engine
         self.player1_data = player1_data
         self.player2_data = player2_data
-        self.created_at = datetime.now()
-        self.last_move_at = datetime.now()
-        self.move_times: List[float] = []  # Czasy wykonania ruchów
+        self._created_ts = time.time()  # Znaczniki czasu jako float zamiast datetime
+        self._last_move_ts = self._created_ts
+        self.move_times = array('d')  # Czasy wykonania ruchów
         self.total_moves = 0
         
         # Tworzenie AI graczy jeśli potrzeba
         self.computer_players = {}
-        if player1_data.get('type') == 'computer':
-            difficulty = player1_data.get('difficulty', 'medium')
-            self.computer_players[1] = ComputerPlayer(player1_data['name'], difficulty)
+        for number, player_data in ((1, player1_data), (2, player2_data)):
+            if player_data.get('type') == 'computer':
+                self.computer_players[number] = ComputerPlayer(
+                    player_data['name'],
+                    player_data.get('difficulty', 'medium'),
+                    time_limit=player_data.get('time_limit'),
+                    playouts=player_data.get('playouts'),
+                )
+        self._ai_state = False  # Czy gracze komputerowi zachowują stan przeszukiwania
+    
+    def start_pondering(self, player_number: int) -> bool:
+        """
+        Uruchamia myślenie komputera w czasie ruchu przeciwnika-człowieka
+        
+        Args:
+            player_number: Numer gracza komputerowego, który właśnie wykonał ruch
         
-        if player2_data.get('type') == 'computer':
-            difficulty = player2_data.get('difficulty', 'medium')
-            self.computer_players[2] = ComputerPlayer(player2_data['name'], difficulty)
+        Returns:
+            True jeśli przeszukiwanie w tle zostało uruchomione
+        """
+        computer_player = self.computer_players.get(player_number)
+        opponent = 3 - player_number
+        if computer_player is None or opponent in self.computer_players:
+            return False  # Ruch komputera-przeciwnika nastąpi od razu
+        return computer_player.start_pondering(self.engine)
+    
+    def stop_pondering(self) -> None:
+        """Zatrzymuje myślenie w tle wszystkich graczy komputerowych sesji"""
+        for computer_player in self.computer_players.values():
+            computer_player.stop_pondering()
+    
+    def release_ai_memory(self) -> None:
+        """Zwalnia stan przeszukiwania graczy komputerowych (gra zakończona lub bezczynna)"""
+        for computer_player in self.computer_players.values():
+            computer_player.release_memory()
+        self._ai_state = False
+    
+    @property
+    def created_at(self) -> datetime:
+        """Czas utworzenia sesji"""
+        return datetime.fromtimestamp(self._created_ts)
+    
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self._created_ts = value.timestamp()
+    
+    @property
+    def last_move_at(self) -> datetime:
+        """Czas ostatniego ruchu"""
+        return datetime.fromtimestamp(self._last_move_ts)
+    
+    @last_move_at.setter
+    def last_move_at(self, value: datetime) -> None:
+        self._last_move_ts = value.timestamp()
     
     def to_dict(self) -> Dict[str, Any]:
         """Konwertuje sesję do słownika"""
@@ -45,14 +110,13 @@ class GameSession:
             'created_at': self.created_at.isoformat(),
             'last_move_at': self.last_move_at.isoformat(),
             'total_moves': self.total_moves,
-            'move_times': self.move_times
+            'move_times': self.move_times.tolist()
         }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'GameSession':
         """Tworzy sesję ze słownika"""
-        engine = HexEngine()
-        engine.from_dict(data['engine_state'])
+        engine = engine_from_dict(data['engine_state'])
         
         session = cls(
             data['game_id'],
@@ -64,7 +128,7 @@ class GameSession:
         session.created_at = datetime.fromisoformat(data['created_at'])
         session.last_move_at = datetime.fromisoformat(data['last_move_at'])
         session.total_moves = data.get('total_moves', 0)
-        session.move_times = data.get('move_times', [])
+        session.move_times = array('d', data.get('move_times', []))
         
         return session
 
@@ -72,12 +136,18 @@ class GameSession:
 class GameManager:
     """Zarządza wszystkimi grami w aplikacji"""
     
-    def __init__(self, storage: GameStorage):
+    def __init__(self, storage: GameStorage, engine_backend: str = DEFAULT_BACKEND,
+                 move_timeout: float = DEFAULT_MOVE_TIMEOUT,
+                 ai_idle_seconds: float = DEFAULT_AI_IDLE_SECONDS):
         self.storage = storage
         self.active_sessions: Dict[str, GameSession] = {}
         self.max_games = 100  # Limit gier w pamięci
+        self.engine_backend = engine_backend  # Domyślny backend silnika
+        self.move_timeout = move_timeout  # Limit czasu ruchu komputera [s]
+        self.ai_idle_seconds = ai_idle_seconds  # Bezczynność zwalniająca stan AI gry [s]
     
-    def create_game(self, board_size: int, player1_data: Dict, player2_data: Dict) -> str:
+    def create_game(self, board_size: int, player1_data: Dict, player2_data: Dict,
+                    engine_backend: Optional[str] = None) -> str:
         """
         Tworzy nową grę
         
@@ -85,6 +155,7 @@ class GameManager:
             board_size: Rozmiar planszy
             player1_data: Dane pierwszego gracza
             player2_data: Dane drugiego gracza
+            engine_backend: Backend silnika (domyślnie z konfiguracji)
             
         Returns:
             ID utworzonej gry
@@ -93,14 +164,15 @@ class GameManager:
         if len(self.active_sessions) >= self.max_games:
             # Usuń najstarszą grę
             oldest_id = min(self.active_sessions.keys(), 
-                          key=lambda x: self.active_sessions[x].created_at)
-            del self.active_sessions[oldest_id]
+                          key=lambda x: self.active_sessions[x]._created_ts)
+            self.active_sessions.pop(oldest_id).release_ai_memory()
+        self.release_idle_sessions()
         
         # Generowanie unikalnego ID
         game_id = str(uuid.uuid4())
         
         # Tworzenie silnika gry
-        engine = HexEngine(board_size)
+        engine = create_engine(board_size, engine_backend or self.engine_backend)
         
         # Tworzenie sesji
         session = GameSession(game_id, engine, player1_data, player2_data)
@@ -111,15 +183,29 @@ class GameManager:
         
         return game_id
     
-    def get_game_state(self, game_id: str) -> Optional[Dict[str, Any]]:
-        """Pobiera pełny stan gry"""
+    def get_game_state(self, game_id: str, include_connections: bool = False,
+                       include_evaluation: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Pobiera pełny stan gry
+        
+        Args:
+            game_id: ID gry
+            include_connections: Czy dołączyć najkrótsze połączenia obu graczy
+            include_evaluation: Czy dołączyć ocenę pozycji (potencjały i
+                prawdopodobieństwo wygranej, np. dla paska w UI)
+            
+        Returns:
+            Słownik ze stanem gry (z 'winning_chain' po zakończeniu gry) lub None
+        """
         session = self._get_session(game_id)
         if not session:
             return None
         
-        engine_info = session.engine.get_game_info()
+        engine = session.engine
+        engine_info = engine.get_game_info()
+        is_finished = engine_info['game_state'] != GameState.IN_PROGRESS.value
         
-        return {
+        state = {
             'game_id': game_id,
             'board_size': session.engine.board_size,
             'board': session.engine.get_board_state(),
@@ -132,7 +218,42 @@ class GameManager:
             'player2': session.player2_data,
             'created_at': session.created_at.isoformat(),
             'last_move_at': session.last_move_at.isoformat(),
-            'is_finished': engine_info['game_state'] != GameState.IN_PROGRESS.value
+            'is_finished': is_finished
+        }
+        
+        if is_finished:
+            state['winning_chain'] = engine.get_winning_chain()
+        
+        if include_connections:
+            state['shortest_connections'] = {
+                str(player.value): engine.get_shortest_connection(player)
+                for player in (Player.PLAYER1, Player.PLAYER2)
+            }
+        
+        if include_evaluation:
+            state['evaluation'] = self._evaluate_position(engine)
+        
+        return state
+    
+    def _evaluate_position(self, engine: HexEngine) -> Dict[str, Any]:
+        """
+        Zwraca potencjały (odległość dwukrokowa), szacowane szanse graczy
+        i pola gorsze (martwe, przechwycone i zdominowane dla gracza na ruchu)
+        """
+        if engine.winner is not None:
+            probability = 1.0 if engine.winner == Player.PLAYER1.value else 0.0
+            potentials = {'1': None, '2': None}
+            inferior = None
+        else:
+            inferior = analyse_cells(engine).to_dict(engine)
+            evaluator = TwoDistanceEvaluator(engine)
+            probability = evaluator.win_probability(Player.PLAYER1)
+            potentials = {str(player.value): evaluator.potential(player)
+                          for player in (Player.PLAYER1, Player.PLAYER2)}
+        return {
+            'potentials': potentials,
+            'win_probability': {'1': probability, '2': 1.0 - probability},
+            'inferior_cells': inferior,
         }
     
     def make_move(self, game_id: str, row: int, col: int) -> Dict[str, Any]:
@@ -153,6 +274,9 @@ class GameManager:
         
         engine = session.engine
         
+        # Nowe żądanie kończy myślenie AI w tle (drzewo zostaje zachowane)
+        session.stop_pondering()
+        
         # Sprawdzenie czy gra jest w toku
         if engine.game_state != GameState.IN_PROGRESS:
             return {'error': 'Gra została już zakończona'}
@@ -189,11 +313,51 @@ class GameManager:
         if engine.game_state != GameState.IN_PROGRESS:
             result['game_finished'] = True
             result['winner'] = engine.winner
+            session.release_ai_memory()
+        self.release_idle_sessions()
         
         return result
     
+    def release_idle_sessions(self) -> int:
+        """
+        Zwalnia stan przeszukiwania AI gier bezczynnych dłużej niż ai_idle_seconds
+        
+        Gra pozostaje w pamięci - zwalniane są tylko drzewo MCTS i tablice
+        przeszukiwania, które odbudują się przy kolejnym ruchu komputera.
+        
+        Returns:
+            Liczba gier, których stan został zwolniony
+        """
+        cutoff = time.time() - self.ai_idle_seconds
+        idle = [session for session in self.active_sessions.values()
+                if session._ai_state and session._last_move_ts < cutoff]
+        for session in idle:
+            session.release_ai_memory()
+        return len(idle)
+    
+    def ai_deadline(self, start: Optional[float] = None) -> float:
+        """
+        Zwraca termin ruchu AI wyznaczony z limitu czasu ruchu
+        
+        Args:
+            start: Początek żądania jako czas time.perf_counter() (domyślnie teraz)
+            
+        Returns:
+            Termin jako czas time.perf_counter()
+        """
+        if start is None:
+            start = time.perf_counter()
+        return start + self.move_timeout * AI_BUDGET_FRACTION
+    
     def make_computer_move(self, game_id: str) -> Dict[str, Any]:
-        """Wykonuje automatyczny ruch komputera"""
+        """
+        Wykonuje automatyczny ruch komputera (w budżecie czasu z move_timeout)
+        
+        Po ruchu komputer grający z człowiekiem może dalej myśleć w tle
+        (hex_game.ai.ponder) - do następnego żądania dotyczącego tej gry.
+        Ruchy są współdzielone pomiędzy sesjami (hex_game.ai.cache) - wynik
+        zawiera ocenę ruchu i informację, czy pochodził z pamięci wyników.
+        """
         session = self._get_session(game_id)
         if not session:
             return {'error': 'Gra nie została znaleziona'}
@@ -213,12 +377,17 @@ class GameManager:
         computer_player = session.computer_players[current_player_num]
         
         try:
-            start_time = time.time()
-            row, col = computer_player.get_move(engine)
-            move_time = time.time() - start_time
+            row, col = computer_player.get_move(engine, self.ai_deadline())
             
             # Wykonanie ruchu
-            return self.make_move(game_id, row, col)
+            result = self.make_move(game_id, row, col)
+            if result.get('success'):
+                result['ai_score'] = computer_player.last_score
+                result['ai_cached'] = computer_player.last_cached
+                if engine.game_state == GameState.IN_PROGRESS:
+                    session._ai_state = True
+                    session.start_pondering(current_player_num)
+            return result
             
         except Exception as e:
             return {'error': f'Błąd AI: {str(e)}'}
@@ -278,7 +447,7 @@ class GameManager:
     def delete_game(self, game_id: str) -> bool:
         """Usuwa grę"""
         if game_id in self.active_sessions:
-            del self.active_sessions[game_id]
+            self.active_sessions.pop(game_id).release_ai_memory()
             self.storage.delete_game(game_id)
             return True
         return False
@@ -299,8 +468,8 @@ class GameManager:
         """Wczytuje grę z pliku"""
         try:
             # Tworzenie nowego silnika i wczytanie
-            engine = HexEngine()
-            engine.load_from_file(filename)
+            with open(filename, 'r', encoding='utf-8') as f:
+                engine = engine_from_dict(json.load(f))
             
             # Generowanie nowego ID
             game_id = str(uuid.uuid4())
@@ -357,7 +526,8 @@ class GameManager:
             'finished_games': finished_games,
             'total_moves': total_moves,
             'average_move_time': sum(all_move_times) / len(all_move_times) if all_move_times else 0,
-            'storage_type': type(self.storage).__name__
+            'storage_type': type(self.storage).__name__,
+            'ai_cache': get_ai_cache().stats()
         }
     
     def _get_session(self, game_id: str) -> Optional[GameSession]:
@@ -0,0 +1,584 @@
+"""
+Pomiary wydajności silnika i AI gry HEX
+
+Uruchomienie:
+    python -m hex_game.benchmarks
+
+Raport obejmuje m.in. liczbę rozgrywek MCTS na sekundę dla rozmiarów planszy,
+na podstawie której dobierany jest budżet poziomu 'expert', oraz skalowanie
+przeszukiwania równoległego (AI_WORKERS) od 1 do N dostępnych rdzeni. Przy
+zrównolegleniu korzenia liczba rozgrywek rośnie niemal liniowo z liczbą
+procesów, dopóki nie przekracza ona liczby rdzeni (narzut: przesłanie stanu
+silnika i statystyk korzenia, rzędu milisekund na ruch).
+
+Tryb dużych plansz (26x26-50x50) jest wspierany, jeśli pomiary mieszczą się
+w opublikowanych celach opóźnienia LARGE_BOARD_LATENCY_TARGETS_MS.
+"""
+
+import time
+import random
+import tracemalloc
+from typing import Dict, List, Tuple
+
+from .core.engine import Player, GameState, MAX_BOARD_SIZE
+from .core.backends import ENGINE_BACKENDS, create_engine
+from .ai.mcts import MCTSSearch, random_playout
+from .ai.batch import NUMPY_AVAILABLE, DEFAULT_BATCH_SIZE, batch_win_count
+from .ai.parallel import ParallelMCTSSearch, available_cpus
+from .ai.alphabeta import AlphaBetaSearch, EVALUATORS
+from .ai.inferior import analyse_cells
+from .ai.solver import ProofNumberSolver
+from .ai.cache import AIResultCache
+from .players.computer_player import ComputerPlayer
+
+
+# Cele opóźnienia pojedynczego ruchu (make_move) w milisekundach: p99 dla
+# losowych partii oraz czas wykrycia wygranej na najdłuższym możliwym łańcuchu
+# (wąż zajmujący połowę planszy). Rozmiary pośrednie używają celu następnego
+# większego rozmiaru z tabeli.
+LARGE_BOARD_LATENCY_TARGETS_MS: Dict[int, Dict[str, float]] = {
+    26: {'p99': 0.5, 'worst_chain': 2.0},
+    32: {'p99': 0.6, 'worst_chain': 3.0},
+    38: {'p99': 0.8, 'worst_chain': 5.0},
+    44: {'p99': 1.0, 'worst_chain': 7.0},
+    50: {'p99': 1.2, 'worst_chain': 10.0},
+}
+
+
+def latency_target(board_size: int) -> Dict[str, float]:
+    """Zwraca cel opóźnienia dla rozmiaru planszy z trybu dużych plansz"""
+    for size in sorted(LARGE_BOARD_LATENCY_TARGETS_MS):
+        if board_size <= size:
+            return LARGE_BOARD_LATENCY_TARGETS_MS[size]
+    raise ValueError(f"Rozmiar planszy może wynosić co najwyżej {MAX_BOARD_SIZE}")
+
+
+def snake_position(board_size: int) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    """
+    Buduje najdłuższy łańcuch gracza 1 (wąż) i wypełnienie gracza 2
+    
+    Parzyste wiersze należą w całości do gracza 1, a wiersze nieparzyste
+    mają jeden łącznik na przemian przy prawej i lewej krawędzi, więc jedyna
+    ścieżka góra-dół ma długość około n²/2.
+    
+    Returns:
+        Krotka (pola gracza 1 w kolejności ścieżki, pola gracza 2)
+    """
+    player1, player2 = [], []
+    for row in range(board_size):
+        if row % 2 == 0:
+            cols = range(board_size) if (row // 2) % 2 == 0 else reversed(range(board_size))
+            player1.extend((row, col) for col in cols)
+        else:
+            link = board_size - 1 if (row // 2) % 2 == 0 else 0
+            for col in range(board_size):
+                (player1 if col == link else player2).append((row, col))
+    return player1, player2
+
+
+def measure_worst_chain(board_size: int, backend: str = 'standard') -> float:
+    """
+    Mierzy czas ruchu domykającego najdłuższy łańcuch (w ms)
+    
+    Sprawdza również, że wygrana została wykryta i że pełne przeszukanie
+    (_check_win) zgadza się z wynikiem silnika.
+    """
+    engine = create_engine(board_size, backend)
+    player1, player2 = snake_position(board_size)
+    for row, col in player2:
+        engine.push_move(row, col, Player.PLAYER2)
+    for row, col in player1[:-1]:
+        engine.push_move(row, col, Player.PLAYER1)
+    
+    row, col = player1[-1]
+    start = time.perf_counter()
+    engine.push_move(row, col, Player.PLAYER1)
+    elapsed = (time.perf_counter() - start) * 1000
+    
+    if engine.game_state != GameState.PLAYER1_WON or not engine._check_win(Player.PLAYER1):
+        raise AssertionError(f"Nie wykryto wygranej na wężu {board_size}x{board_size} ({backend})")
+    return elapsed
+
+
+def measure_move_latency(board_size: int, backend: str = 'standard',
+                         games: int = 5, seed: int = 0) -> Dict[str, float]:
+    """
+    Mierzy opóźnienie make_move w losowych partiach
+    
+    Returns:
+        Słownik z mean/p99/max w milisekundach
+    """
+    rng = random.Random(seed)
+    samples = []
+    for _ in range(games):
+        engine = create_engine(board_size, backend)
+        while engine.game_state == GameState.IN_PROGRESS:
+            row, col = engine.random_empty_cell(rng)
+            start = time.perf_counter()
+            engine.make_move(row, col)
+            samples.append(time.perf_counter() - start)
+    
+    samples.sort()
+    return {
+        'mean': sum(samples) / len(samples) * 1000,
+        'p99': samples[int(len(samples) * 0.99)] * 1000,
+        'max': samples[-1] * 1000,
+    }
+
+
+def run_large_board_benchmark(sizes: Tuple[int, ...] = (26, 32, 38, 44, 50),
+                              games: int = 3) -> List[Dict[str, object]]:
+    """
+    Mierzy tryb dużych plansz dla wszystkich backendów
+    
+    Returns:
+        Lista wyników z informacją czy cel opóźnienia został spełniony
+    """
+    results = []
+    for size in sizes:
+        target = latency_target(size)
+        for backend in ENGINE_BACKENDS:
+            latency = measure_move_latency(size, backend, games)
+            worst = measure_worst_chain(size, backend)
+            results.append({
+                'board_size': size,
+                'backend': backend,
+                'mean_ms': latency['mean'],
+                'p99_ms': latency['p99'],
+                'worst_chain_ms': worst,
+                'meets_target': latency['p99'] <= target['p99'] and worst <= target['worst_chain'],
+            })
+    return results
+
+
+def measure_game_memory(board_size: int, games: int = 500, fill: float = 0.5,
+                        backend: str = 'standard', seed: int = 0) -> Dict[str, float]:
+    """
+    Mierzy pamięć zajmowaną przez jedną grę (silnik + GameSession) w bajtach
+    
+    Gry wypełniane są losowymi ruchami do ułamka `fill` planszy (lub do
+    końca partii), co odpowiada bezczynnej grze w połowie rozgrywki.
+    
+    Returns:
+        Słownik z liczbą bajtów na grę: 'engine' i 'session' (łącznie z silnikiem)
+    """
+    from .api.game_manager import GameSession
+    
+    rng = random.Random(seed)
+    player1 = {'type': 'human', 'name': 'Gracz 1'}
+    player2 = {'type': 'human', 'name': 'Gracz 2'}
+    target_moves = int(board_size * board_size * fill)
+    
+    def build_engine():
+        engine = create_engine(board_size, backend)
+        while (engine.get_empty_count() > board_size * board_size - target_moves
+               and engine.game_state == GameState.IN_PROGRESS):
+            engine.make_move(*engine.random_empty_cell(rng))
+        return engine
+    
+    # Rozgrzewka: współdzielone tablice (topologia, Zobrist) nie wliczają się do gry
+    build_engine()
+    
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    engines = [build_engine() for _ in range(games)]
+    engine_bytes = (tracemalloc.get_traced_memory()[0] - before) / games
+    
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = [GameSession(str(i), engine, player1, player2) for i, engine in enumerate(engines)]
+    session_bytes = (tracemalloc.get_traced_memory()[0] - before) / games
+    tracemalloc.stop()
+    
+    del sessions, engines
+    return {'engine': engine_bytes, 'session': engine_bytes + session_bytes}
+
+
+def measure_ai_memory(board_size: int, difficulty: str, games: int = 2, fill: float = 0.5,
+                      time_limit: float = 0.1, seed: int = 0) -> float:
+    """
+    Mierzy stan przeszukiwania AI zachowany przez jedną grę w bajtach
+    
+    Komputer (poziom `difficulty`) gra z losowymi ruchami do ułamka `fill`
+    planszy. Wynikiem jest pamięć zwolniona przez GameSession.release_ai_memory
+    (drzewo MCTS, tablice transpozycji i rozwiązywania końcówek) - tyle
+    kosztuje gra, dopóki nie stanie się bezczynna.
+    
+    Returns:
+        Liczba bajtów na grę
+    """
+    from .api.game_manager import GameSession
+    
+    rng = random.Random(seed)
+    player1 = {'type': 'computer', 'name': 'Komputer', 'difficulty': difficulty,
+               'time_limit': time_limit}
+    player2 = {'type': 'human', 'name': 'Gracz 2'}
+    target_moves = int(board_size * board_size * fill)
+    
+    tracemalloc.start()
+    sessions = []
+    for i in range(games):
+        session = GameSession(str(i), create_engine(board_size), player1, player2)
+        engine = session.engine
+        computer = session.computer_players[1]
+        while (engine.get_empty_count() > board_size * board_size - target_moves
+               and engine.game_state == GameState.IN_PROGRESS):
+            if engine.current_player == Player.PLAYER1:
+                engine.make_move(*computer.get_move(engine))
+            else:
+                engine.make_move(*engine.random_empty_cell(rng))
+        sessions.append(session)
+    
+    kept = tracemalloc.get_traced_memory()[0]
+    for session in sessions:
+        session.release_ai_memory()
+    released = kept - tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    del sessions
+    return released / games
+
+
+def measure_playout_rate(board_size: int, backend: str = 'standard',
+                         seconds: float = 0.5, seed: int = 0) -> float:
+    """
+    Mierzy liczbę rozgrywek MCTS na sekundę (poziom 'expert') z pustej planszy
+    
+    Wynik pozwala dobrać budżet time_limit/playouts do docelowego opóźnienia
+    ruchu AI dla danego rozmiaru planszy.
+    
+    Returns:
+        Rozgrywki na sekundę
+    """
+    search = MCTSSearch(time_limit=seconds, seed=seed)
+    search.search(create_engine(board_size, backend))
+    return search.last_playouts / search.last_elapsed
+
+
+def measure_batch_playouts(board_size: int, batch_size: int = DEFAULT_BATCH_SIZE,
+                           seconds: float = 0.5, seed: int = 0) -> Dict[str, float]:
+    """
+    Porównuje rozgrywki losowe w czystym Pythonie i wsadowe (NumPy) z pustej planszy
+    
+    Returns:
+        Słownik z liczbą rozgrywek na sekundę ('python' i 'numpy')
+    """
+    rng = random.Random(seed)
+    engine = create_engine(board_size)
+    rates = {}
+    for name in ('python', 'numpy'):
+        count = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < seconds:
+            if name == 'python':
+                random_playout(engine, rng)
+                count += 1
+            else:
+                batch_win_count(engine, batch_size, rng)
+                count += batch_size
+        rates[name] = count / (time.perf_counter() - start)
+    return rates
+
+
+def measure_parallel_scaling(board_size: int = 11, seconds: float = 1.0,
+                             max_workers: int = None, seed: int = 0) -> List[Dict[str, float]]:
+    """
+    Mierzy skalowanie MCTS ze zrównolegleniem korzenia od 1 do N procesów
+    
+    Dla 1 procesu mierzone jest przeszukiwanie w bieżącym procesie, dla
+    większej liczby - ParallelMCTSSearch na wspólnej puli (rozgrzanej przed
+    pomiarem, tak jak w serwerze obsługującym kolejne żądania).
+    
+    Returns:
+        Lista wyników: liczba procesów, rozgrywki/s i przyspieszenie względem 1 procesu
+    """
+    if max_workers is None:
+        max_workers = available_cpus()
+    engine = create_engine(board_size)
+    results = []
+    base_rate = None
+    for workers in range(1, max_workers + 1):
+        if workers == 1:
+            search = MCTSSearch(time_limit=seconds, seed=seed)
+        else:
+            search = ParallelMCTSSearch(workers, time_limit=seconds, seed=seed)
+            search.search(engine, time.perf_counter() + 0.1)  # Rozgrzewka puli
+        search.search(engine)
+        rate = search.last_playouts / search.last_elapsed
+        if base_rate is None:
+            base_rate = rate
+        results.append({'workers': workers, 'rate': rate, 'speedup': rate / base_rate})
+    return results
+
+
+def measure_alphabeta(board_size: int = 11, max_depth: int = 4, evaluator: str = 'two_distance',
+                      opening_moves: int = 6, seed: int = 0) -> List[Dict[str, float]]:
+    """
+    Mierzy czas i liczbę węzłów alfa-beta (poziom 'advanced') na kolejnych głębokościach
+    
+    Pozycja startowa to `opening_moves` losowych ruchów; każda głębokość
+    mierzona jest nowym przeszukiwaniem (pusta tablica transpozycji).
+    
+    Returns:
+        Lista wyników: głębokość, węzły, czas [ms] i węzły na sekundę
+    """
+    rng = random.Random(seed)
+    engine = create_engine(board_size)
+    for _ in range(opening_moves):
+        engine.make_move(*engine.random_empty_cell(rng))
+    
+    results = []
+    for depth in range(1, max_depth + 1):
+        search = AlphaBetaSearch(max_depth=depth, evaluator=evaluator)
+        search.search(engine)
+        results.append({
+            'depth': depth,
+            'nodes': search.last_nodes,
+            'ms': search.last_elapsed * 1000,
+            'nodes_per_second': search.last_nodes / search.last_elapsed,
+        })
+    return results
+
+
+def measure_heuristic_moves(board_size: int, fill: float = 0.3, repeats: int = 20,
+                            seed: int = 0) -> Dict[str, float]:
+    """
+    Mierzy średni czas ruchu poziomów 'medium' i 'hard' (ocena wszystkich pól naraz,
+    bez wspólnej pamięci wyników)
+    
+    Returns:
+        Słownik {poziom: czas ruchu w milisekundach}
+    """
+    rng = random.Random(seed)
+    engine = create_engine(board_size)
+    while (engine.get_empty_count() > board_size * board_size * (1 - fill)
+           and engine.game_state == GameState.IN_PROGRESS):
+        engine.make_move(*engine.random_empty_cell(rng))
+    
+    results = {}
+    for difficulty in ('medium', 'hard'):
+        player = ComputerPlayer(difficulty, difficulty)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            player._choose_cell(engine)
+        results[difficulty] = (time.perf_counter() - start) / repeats * 1000
+    return results
+
+
+def measure_inferior_cells(board_size: int = 13, fill: float = 0.3, positions: int = 20,
+                           seed: int = 0) -> Dict[str, float]:
+    """
+    Mierzy udział pól odrzucanych analizą pól gorszych w losowych pozycjach
+    
+    Returns:
+        Słownik z udziałami (w procentach pustych pól) i czasem analizy [ms]
+    """
+    rng = random.Random(seed)
+    counts = {'dead': 0, 'captured': 0, 'dominated': 0, 'empty': 0}
+    elapsed = 0.0
+    for _ in range(positions):
+        engine = create_engine(board_size)
+        while (engine.get_empty_count() > board_size * board_size * (1 - fill)
+               and engine.game_state == GameState.IN_PROGRESS):
+            engine.make_move(*engine.random_empty_cell(rng))
+        start = time.perf_counter()
+        inferior = analyse_cells(engine)
+        elapsed += time.perf_counter() - start
+        counts['dead'] += len(inferior.dead)
+        counts['captured'] += sum(len(cells) for cells in inferior.captured.values())
+        counts['dominated'] += len(inferior.dominated)
+        counts['empty'] += engine.get_empty_count()
+    
+    empty = counts.pop('empty')
+    results = {kind: count / empty * 100 for kind, count in counts.items()}
+    results['total'] = sum(results.values())
+    results['ms'] = elapsed / positions * 1000
+    return results
+
+
+def measure_endgame_solver(board_size: int = 7, empty: int = 25, positions: int = 10,
+                           seed: int = 0) -> Dict[str, float]:
+    """
+    Mierzy rozwiązywanie końcówek (DFPN) w losowych pozycjach w toku gry
+    
+    Returns:
+        Słownik z udziałem rozwiązanych pozycji [%], średnią liczbą węzłów
+        i średnim czasem [ms] (z domyślnymi limitami solvera)
+    """
+    rng = random.Random(seed)
+    solved = nodes = 0
+    elapsed = 0.0
+    measured = 0
+    while measured < positions:
+        engine = create_engine(board_size)
+        while engine.get_empty_count() > empty and engine.game_state == GameState.IN_PROGRESS:
+            engine.make_move(*engine.random_empty_cell(rng))
+        if engine.game_state != GameState.IN_PROGRESS:
+            continue
+        solver = ProofNumberSolver(max_empty=empty)
+        solved += solver.solve(engine) is not None
+        nodes += solver.last_nodes
+        elapsed += solver.last_elapsed
+        measured += 1
+    return {'solved': solved / positions * 100, 'nodes': nodes / positions,
+            'ms': elapsed / positions * 1000}
+
+
+def measure_ai_cache(board_size: int = 11, difficulty: str = 'advanced', positions: int = 10,
+                     fill: float = 0.2, time_limit: float = 0.2, seed: int = 0) -> Dict[str, float]:
+    """
+    Mierzy czas ruchu AI bez wpisu w pamięci wyników i z wpisem (hex_game.ai.cache)
+    
+    Returns:
+        Słownik ze średnimi czasami ruchu [ms] przy chybieniu i trafieniu
+        oraz rozmiarem pamięci [bajty]
+    """
+    rng = random.Random(seed)
+    cache = AIResultCache(positions)
+    player = ComputerPlayer(difficulty, difficulty, time_limit=time_limit)
+    miss = hit = 0.0
+    for _ in range(positions):
+        engine = create_engine(board_size)
+        while (engine.get_empty_count() > board_size * board_size * (1 - fill)
+               and engine.game_state == GameState.IN_PROGRESS):
+            engine.make_move(*engine.random_empty_cell(rng))
+        start = time.perf_counter()
+        cache.lookup(engine, difficulty, player.budget)
+        cell = player._choose_cell(engine)
+        cache.store(engine, difficulty, player.budget, cell, player.last_score)
+        middle = time.perf_counter()
+        cache.lookup(engine, difficulty, player.budget)
+        hit += time.perf_counter() - middle
+        miss += middle - start
+    return {'miss_ms': miss / positions * 1000, 'hit_ms': hit / positions * 1000,
+            'memory_bytes': cache.stats()['memory_bytes']}
+
+
+def measure_winning_cells(board_size: int = 25, backend: str = 'standard',
+                          fill: float = 0.4, seed: int = 0) -> Dict[str, float]:
+    """
+    Porównuje wykrywanie ruchów wygrywających/blokujących (dla obu graczy)
+    
+    'detector' to jedno przejście get_winning_indices, 'scan' - postawienie
+    i cofnięcie kamienia na każdym pustym polu (push_cell/pop_move).
+    
+    Returns:
+        Słownik z czasami w milisekundach
+    """
+    rng = random.Random(seed)
+    engine = create_engine(board_size, backend)
+    while (engine.get_empty_count() > board_size * board_size * (1 - fill)
+           and engine.game_state == GameState.IN_PROGRESS):
+        engine.make_move(*engine.random_empty_cell(rng))
+    
+    start = time.perf_counter()
+    for player in (Player.PLAYER1, Player.PLAYER2):
+        engine.get_winning_indices(player)
+    detector = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for player in (Player.PLAYER1, Player.PLAYER2):
+        for cell in engine.get_empty_indices():
+            engine.push_cell(cell, player)
+            engine.pop_move()
+    scan = time.perf_counter() - start
+    
+    return {'detector': detector * 1000, 'scan': scan * 1000}
+
+
+def main():
+    """Wypisuje raport wydajności"""
+    print("Pamięć na grę w połowie partii [bajty]")
+    print(f"{'rozmiar':>8} {'backend':>9} {'silnik':>9} {'z sesją':>9}")
+    for size in (11, 19):
+        for backend in ENGINE_BACKENDS:
+            memory = measure_game_memory(size, backend=backend)
+            print(f"{size:>8} {backend:>9} {memory['engine']:9.0f} {memory['session']:9.0f}")
+    print()
+    
+    print("Stan AI zachowany przez grę do czasu bezczynności (AI_IDLE_SECONDS) [bajty]")
+    print(f"{'rozmiar':>8} {'advanced':>9} {'expert':>9}")
+    for size in (11, 19):
+        retained = [measure_ai_memory(size, difficulty) for difficulty in ('advanced', 'expert')]
+        print(f"{size:>8} " + " ".join(f"{value:9.0f}" for value in retained))
+    print()
+    
+    print("MCTS (expert) - rozgrywki na sekundę")
+    print(f"{'rozmiar':>8} " + " ".join(f"{backend:>9}" for backend in ENGINE_BACKENDS))
+    for size in (7, 11, 13, 19, 25):
+        rates = [measure_playout_rate(size, backend) for backend in ENGINE_BACKENDS]
+        print(f"{size:>8} " + " ".join(f"{rate:9.0f}" for rate in rates))
+    print()
+    
+    if NUMPY_AVAILABLE:
+        print(f"Rozgrywki losowe na sekundę - Python i NumPy (wsad {DEFAULT_BATCH_SIZE})")
+        print(f"{'rozmiar':>8} {'python':>9} {'numpy':>9} {'przysp.':>8}")
+        for size in (7, 11, 19, 25):
+            rates = measure_batch_playouts(size)
+            print(f"{size:>8} {rates['python']:9.0f} {rates['numpy']:9.0f} "
+                  f"{rates['numpy'] / rates['python']:8.1f}")
+        print()
+    
+    print(f"MCTS - zrównoleglenie korzenia, 11x11 (dostępne rdzenie: {available_cpus()})")
+    print(f"{'procesy':>8} {'rozgr./s':>9} {'przysp.':>8}")
+    for result in measure_parallel_scaling():
+        print(f"{result['workers']:>8} {result['rate']:9.0f} {result['speedup']:8.2f}")
+    print()
+    
+    print("Alfa-beta (advanced) - 11x11")
+    print(f"{'ocena':>13} {'głęb.':>6} {'węzły':>9} {'czas ms':>9} {'węzły/s':>9}")
+    for evaluator in EVALUATORS:
+        for result in measure_alphabeta(evaluator=evaluator):
+            print(f"{evaluator:>13} {result['depth']:>6} {result['nodes']:>9} {result['ms']:9.1f} "
+                  f"{result['nodes_per_second']:9.0f}")
+    print()
+    
+    print("Poziomy medium/hard - czas ruchu [ms]")
+    print(f"{'rozmiar':>8} {'medium':>9} {'hard':>9}")
+    for size in (11, 25, 50):
+        result = measure_heuristic_moves(size)
+        print(f"{size:>8} {result['medium']:9.3f} {result['hard']:9.3f}")
+    print()
+    
+    print("Pola gorsze (martwe/przechwycone/zdominowane) - % pustych pól")
+    print(f"{'rozmiar':>8} {'martwe':>8} {'przechw.':>8} {'zdomin.':>8} {'razem':>8} {'czas ms':>8}")
+    for size in (11, 13, 19):
+        result = measure_inferior_cells(size)
+        print(f"{size:>8} {result['dead']:8.1f} {result['captured']:8.1f} "
+              f"{result['dominated']:8.1f} {result['total']:8.1f} {result['ms']:8.2f}")
+    print()
+    
+    print("Rozwiązywanie końcówek (DFPN) - losowe pozycje 7x7")
+    print(f"{'puste':>8} {'rozw. %':>8} {'węzły':>9} {'czas ms':>9}")
+    for empty in (15, 20, 25, 30):
+        result = measure_endgame_solver(7, empty)
+        print(f"{empty:>8} {result['solved']:8.0f} {result['nodes']:9.0f} {result['ms']:9.1f}")
+    print()
+    
+    print("Wspólna pamięć wyników AI - czas ruchu 11x11 [ms]")
+    print(f"{'poziom':>8} {'chybienie':>10} {'trafienie':>10} {'pamięć B':>9}")
+    for difficulty in ('hard', 'advanced', 'expert'):
+        result = measure_ai_cache(difficulty=difficulty)
+        print(f"{difficulty:>8} {result['miss_ms']:10.2f} {result['hit_ms']:10.3f} "
+              f"{result['memory_bytes']:9.0f}")
+    print()
+    
+    print("Wykrywanie ruchów wygrywających/blokujących, 25x25 [ms]")
+    print(f"{'backend':>9} {'detektor':>9} {'skan':>9}")
+    for backend in ENGINE_BACKENDS:
+        result = measure_winning_cells(backend=backend)
+        print(f"{backend:>9} {result['detector']:9.2f} {result['scan']:9.2f}")
+    print()
+    
+    print("Tryb dużych plansz - opóźnienie make_move [ms]")
+    print(f"{'rozmiar':>8} {'backend':>9} {'mean':>8} {'p99':>8} {'cel p99':>8} "
+          f"{'wąż':>8} {'cel wąż':>8}  wynik")
+    for result in run_large_board_benchmark():
+        target = latency_target(result['board_size'])
+        print(f"{result['board_size']:>8} {result['backend']:>9} "
+              f"{result['mean_ms']:8.3f} {result['p99_ms']:8.3f} {target['p99']:8.2f} "
+              f"{result['worst_chain_ms']:8.3f} {target['worst_chain']:8.2f}  "
+              f"{'OK' if result['meets_target'] else 'PRZEKROCZONO'}")
+
+
+if __name__ == '__main__':
+    main()
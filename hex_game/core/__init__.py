@@ -3,5 +3,15 @@ Moduł podstawowej logiki gry
 """
 
 from .engine import HexEngine, Player, GameState
+from .bitboard import BitboardEngine
+from .zobrist import ZobristTable, get_zobrist_table
+from .topology import HexTopology, get_topology
+from .backends import ENGINE_BACKENDS, create_engine, engine_from_dict
 
-__all__ = ['HexEngine', 'Player', 'GameState']
\ No newline at end of file
+__all__ = [
+    'HexEngine', 'Player', 'GameState',
+    'BitboardEngine',
+    'ZobristTable', 'get_zobrist_table',
+    'HexTopology', 'get_topology',
+    'ENGINE_BACKENDS', 'create_engine', 'engine_from_dict'
+]
@@ -0,0 +1,48 @@
+"""
+Rejestr backendów silnika gry HEX
+"""
+
+from typing import Dict, Any, Type
+
+from .engine import HexEngine
+from .bitboard import BitboardEngine
+
+
+ENGINE_BACKENDS: Dict[str, Type[HexEngine]] = {
+    HexEngine.BACKEND: HexEngine,
+    BitboardEngine.BACKEND: BitboardEngine,
+}
+
+DEFAULT_BACKEND = HexEngine.BACKEND
+
+
+def create_engine(board_size: int = 11, backend: str = DEFAULT_BACKEND) -> HexEngine:
+    """
+    Tworzy silnik gry z wybranym backendem
+    
+    Args:
+        board_size: Rozmiar planszy
+        backend: Nazwa backendu ('standard' lub 'bitboard')
+    
+    Returns:
+        Nowy silnik gry
+    """
+    if backend not in ENGINE_BACKENDS:
+        raise ValueError(f"Nieznany backend silnika: {backend}. "
+                         f"Dostępne: {', '.join(ENGINE_BACKENDS)}")
+    return ENGINE_BACKENDS[backend](board_size)
+
+
+def engine_from_dict(data: Dict[str, Any]) -> HexEngine:
+    """
+    Odtwarza silnik ze słownika (to_dict) zachowując zapisany backend
+    
+    Args:
+        data: Słownik ze stanem gry
+    
+    Returns:
+        Silnik gry z wczytanym stanem
+    """
+    engine = create_engine(data['board_size'], data.get('backend', DEFAULT_BACKEND))
+    engine.from_dict(data)
+    return engine
@@ -0,0 +1,76 @@
+"""
+Indeksowany zbiór pustych pól planszy
+"""
+
+import random
+from array import array
+from typing import Iterator, List
+
+
+class EmptyCellSet:
+    """
+    Zbiór indeksów pól z usuwaniem przez zamianę z ostatnim elementem
+    
+    Liczność, przynależność, losowanie i usuwanie działają w O(1), a iteracja
+    nie wymaga skanowania planszy. restore() jest dokładną odwrotnością
+    remove() przy cofaniu w kolejności LIFO, więc po pop_move kolejność
+    elementów jest taka sama jak przed push_move.
+    """
+    
+    __slots__ = ('_items', '_position')
+    
+    def __init__(self, cells: int):
+        """
+        Tworzy zbiór wszystkich pól 0..cells-1
+        
+        Args:
+            cells: Liczba pól planszy
+        """
+        self._items = array('H', range(cells))
+        self._position = array('H', range(cells))
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def __contains__(self, cell: int) -> bool:
+        position = self._position[cell]
+        return position < len(self._items) and self._items[position] == cell
+    
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._items)
+    
+    def remove(self, cell: int) -> None:
+        """Usuwa pole ze zbioru (zamiana z ostatnim elementem)"""
+        items = self._items
+        position = self._position[cell]
+        last = items.pop()
+        if last != cell:
+            items[position] = last
+            self._position[last] = position
+    
+    def restore(self, cell: int) -> None:
+        """Przywraca ostatnio usunięte pole na jego poprzednią pozycję"""
+        items = self._items
+        position = self._position[cell]
+        if position == len(items):
+            items.append(cell)
+        else:
+            moved = items[position]
+            self._position[moved] = len(items)
+            items.append(moved)
+            items[position] = cell
+    
+    def sample(self, rng: random.Random = None) -> int:
+        """Zwraca losowe pole ze zbioru"""
+        return (rng or random).choice(self._items)
+    
+    def copy(self) -> 'EmptyCellSet':
+        """Zwraca niezależną kopię zbioru (kopiowanie dwóch tablic)"""
+        clone = EmptyCellSet.__new__(EmptyCellSet)
+        clone._items = self._items[:]
+        clone._position = self._position[:]
+        return clone
+    
+    def to_list(self) -> List[int]:
+        """Zwraca kopię elementów jako listę"""
+        return self._items.tolist()
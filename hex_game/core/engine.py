@@ -4,7 +4,14 @@ Silnik gry HEX - niezależny od interfejsu użytkownika
 
 from typing import List, Tuple, Optional, Dict, Any
 from enum import Enum
+from array import array
+from collections import deque
 import json
+import random
+
+from .zobrist import get_zobrist_table
+from .cell_set import EmptyCellSet
+from .topology import get_topology, EDGE_TOP, EDGE_BOTTOM, EDGE_LEFT, EDGE_RIGHT
 
 
 class Player(Enum):
@@ -22,11 +29,42 @@ class GameState(Enum):
     DRAW = "draw"
 
 
+_GAME_STATES = tuple(GameState)  # Indeksy stanów w spakowanej historii cofania
+
+MIN_BOARD_SIZE = 3
+MAX_BOARD_SIZE = 50  # Plansze 26x26-50x50 to tryb dużych plansz (patrz hex_game.benchmarks)
+
+# Pola współdzielone przez silniki jednego rozmiaru (nie kopiowane przy fork)
+_SHARED_SLOTS = frozenset(('topology', '_zobrist'))
+_STATE_SLOTS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _copy_state(value: Any) -> Any:
+    """Kopiuje modyfikowalne pole stanu silnika (tablice, maski, zbiór pól)"""
+    if isinstance(value, (array, bytearray)):
+        return value[:]
+    if isinstance(value, (dict, EmptyCellSet)):
+        return value.copy()
+    return value
+
+
 class HexEngine:
     """
     Silnik gry HEX - zawiera całą logikę gry, niezależny od interfejsu
     """
     
+    BACKEND = "standard"
+    
+    # Kompaktowa reprezentacja: brak __dict__, plansza w bytearray, historia
+    # i union-find w tablicach array zamiast list obiektów
+    __slots__ = (
+        'board_size', 'current_player', 'game_state', 'winner', 'topology',
+        '_zobrist', '_cells', '_moves', '_undo_info', '_undo_marks',
+        '_stones_hash', '_rotated_hash', '_empty_set',
+        '_top', '_bottom', '_left', '_right', '_parent', '_set_size', '_union_log',
+        '_next_member',
+    )
+    
     def __init__(self, board_size: int = 11):
         """
         Inicjalizuje nową grę HEX
@@ -34,16 +72,79 @@ class HexEngine:
         Args:
             board_size: Rozmiar planszy (domyślnie 11x11)
         """
-        if board_size < 3:
-            raise ValueError("Rozmiar planszy musi być co najmniej 3")
+        if board_size < MIN_BOARD_SIZE:
+            raise ValueError(f"Rozmiar planszy musi być co najmniej {MIN_BOARD_SIZE}")
+        if board_size > MAX_BOARD_SIZE:
+            raise ValueError(f"Rozmiar planszy może wynosić co najwyżej {MAX_BOARD_SIZE}")
         
         self.board_size = board_size
-        self.board = [[Player.NONE for _ in range(board_size)] for _ in range(board_size)]
         self.current_player = Player.PLAYER1
-        self.moves = []  # Historia ruchów: [(row, col, player), ...]
         self.game_state = GameState.IN_PROGRESS
         self.winner = None
+        self.topology = get_topology(board_size)  # Współdzielona przez silniki tego rozmiaru
+        self._zobrist = get_zobrist_table(board_size)
+        self._reset_board()
+    
+    def _reset_board(self) -> None:
+        """Tworzy pustą planszę i struktury pomocnicze"""
+        self._cells = bytearray(self.topology.cells)  # Plansza płaska: indeks row * n + col
+        self._moves = array('H')  # Historia ruchów: cell << 1 | (player - 1)
+        self._undo_info = array('B')  # Spakowany gracz, stan gry i zwycięzca sprzed ruchu
+        self._stones_hash = 0  # Hasz Zobrista kamieni
+        self._rotated_hash = 0  # Hasz Zobrista kamieni po obrocie o 180°
+        self._empty_set = EmptyCellSet(self.topology.cells)
+        self._reset_storage()
+    
+    def _reset_storage(self) -> None:
+        """
+        Tworzy puste struktury spójności backendu
+        
+        Plansza, historia, hasze i zbiór pustych pól są wspólne dla wszystkich
+        backendów; backend dostarcza tylko strukturę spójności (tu union-find)
+        przez _reset_storage, _place_stone, _remove_stone, _is_connected,
+        _winning_cells i _winning_group.
+        """
+        self._reset_connectivity()
+    
+    def _place_stone(self, cell: int, player: Player) -> None:
+        """
+        Aktualizuje struktury backendu po postawieniu kamienia
         
+        Args:
+            cell: Płaski indeks pola
+            player: Właściciel kamienia
+        """
+        self._undo_marks.append(len(self._union_log))
+        self._connect_stone(cell, player)
+    
+    def _remove_stone(self, cell: int, player: Player) -> None:
+        """
+        Cofa zmiany struktur backendu po zdjęciu ostatniego kamienia
+        
+        Args:
+            cell: Płaski indeks pola
+            player: Właściciel kamienia
+        """
+        self._rollback_unions(self._undo_marks.pop())
+    
+    @property
+    def board(self) -> List[List[Player]]:
+        """Plansza jako lista list Player (kopia - tylko do odczytu)"""
+        size = self.board_size
+        cells = [Player(value) for value in self._cells]
+        return [cells[row * size:(row + 1) * size] for row in range(size)]
+    
+    @property
+    def cells(self) -> bytearray:
+        """Płaska plansza (wartości Player, indeks row * n + col) - nie modyfikować"""
+        return self._cells
+    
+    @property
+    def moves(self) -> List[Tuple[int, int, int]]:
+        """Historia ruchów jako lista krotek (row, col, player)"""
+        coords = self.topology.coords
+        return [coords[code >> 1] + ((code & 1) + 1,) for code in self._moves]
+    
     def get_board_state(self) -> List[List[int]]:
         """
         Zwraca aktualny stan planszy jako listę list intów
@@ -51,7 +152,9 @@ class HexEngine:
         Returns:
             Plansza gdzie 0=puste pole, 1=gracz1, 2=gracz2
         """
-        return [[cell.value for cell in row] for row in self.board]
+        size = self.board_size
+        cells = self._cells
+        return [list(cells[row * size:(row + 1) * size]) for row in range(size)]
     
     def is_valid_move(self, row: int, col: int) -> bool:
         """
@@ -69,7 +172,7 @@ class HexEngine:
         if not (0 <= row < self.board_size and 0 <= col < self.board_size):
             return False
             
-        return self.board[row][col] == Player.NONE
+        return self._cells[row * self.board_size + col] == Player.NONE.value
     
     def make_move(self, row: int, col: int) -> bool:
         """
@@ -84,132 +187,482 @@ class HexEngine:
         if not self.is_valid_move(row, col):
             return False
         
+        self.push_move(row, col)
+        return True
+    
+    def push_move(self, row: int, col: int, player: Optional[Player] = None) -> None:
+        """
+        Wykonuje ruch, który można cofnąć przez pop_move
+        
+        Nie sprawdza poprawności ruchu - wywołujący odpowiada za is_valid_move.
+        Przeznaczone dla przeszukiwania AI (make/unmake bez kopiowania silnika).
+        
+        Args:
+            row, col: Współrzędne ruchu
+            player: Gracz stawiający kamień (domyślnie gracz na ruchu)
+        """
+        self.push_cell(row * self.board_size + col, player)
+    
+    def push_cell(self, cell: int, player: Optional[Player] = None) -> None:
+        """
+        Wariant push_move przyjmujący płaski indeks pola (row * n + col)
+        
+        Args:
+            cell: Płaski indeks pola
+            player: Gracz stawiający kamień (domyślnie gracz na ruchu)
+        """
+        mover = player or self.current_player
+        self._undo_info.append(self.current_player.value
+                               | _GAME_STATES.index(self.game_state) << 2
+                               | (self.winner or 0) << 4)
+        
         # Wykonaj ruch
-        self.board[row][col] = self.current_player
-        self.moves.append((row, col, self.current_player.value))
+        self._cells[cell] = mover.value
+        self._place_stone(cell, mover)
+        self._moves.append(cell << 1 | (mover.value - 1))
+        self._toggle_hash(cell, mover.value)
+        self._empty_set.remove(cell)
         
         # Sprawdź czy gra się skończyła
-        if self._check_win(self.current_player):
-            self.game_state = GameState.PLAYER1_WON if self.current_player == Player.PLAYER1 else GameState.PLAYER2_WON
-            self.winner = self.current_player.value
+        if self._is_connected(mover):
+            self.game_state = GameState.PLAYER1_WON if mover == Player.PLAYER1 else GameState.PLAYER2_WON
+            self.winner = mover.value
+            self.current_player = mover
         elif self._is_board_full():
             self.game_state = GameState.DRAW
+            self.current_player = mover
+        else:
+            # Zmień gracza
+            self.current_player = Player.PLAYER2 if mover == Player.PLAYER1 else Player.PLAYER1
+        
+    def pop_move(self) -> Tuple[int, int, int]:
+        """
+        Cofa ostatni ruch przywracając dokładnie poprzedni stan silnika
+        
+        Returns:
+            Cofnięty ruch jako krotka (row, col, player)
+        """
+        if not self._moves:
+            raise ValueError("Brak ruchów do cofnięcia")
         
-        # Zmień gracza
-        if self.game_state == GameState.IN_PROGRESS:
-            self.current_player = Player.PLAYER2 if self.current_player == Player.PLAYER1 else Player.PLAYER1
+        code = self._moves.pop()
+        cell, player_value = code >> 1, (code & 1) + 1
+        info = self._undo_info.pop()
         
-        return True
+        self._cells[cell] = Player.NONE.value
+        self._remove_stone(cell, Player(player_value))
+        self._toggle_hash(cell, player_value)
+        self._empty_set.restore(cell)
+        self.current_player = Player(info & 3)
+        self.game_state = _GAME_STATES[info >> 2 & 3]
+        self.winner = (info >> 4) or None
+        
+        return self.topology.coords[cell] + (player_value,)
     
-    def _check_win(self, player: Player) -> bool:
+    def _toggle_hash(self, cell: int, player_value: int) -> None:
+        """Dodaje/usuwa kamień z haszy Zobrista (XOR jest samoodwracalny)"""
+        self._stones_hash ^= self._zobrist.key(player_value, cell)
+        self._rotated_hash ^= self._zobrist.rotated_key(player_value, cell)
+    
+    def get_position_hash(self) -> int:
+        """
+        Zwraca 64-bitowy hasz Zobrista pozycji (kamienie + gracz na ruchu)
+        
+        Returns:
+            Hasz aktualizowany przyrostowo w O(1) na ruch
         """
-        Sprawdza czy dany gracz wygrał
+        if self.current_player == Player.PLAYER2:
+            return self._stones_hash ^ self._zobrist.side_key
+        return self._stones_hash
+    
+    def get_canonical_hash(self) -> int:
+        """
+        Zwraca hasz kanoniczny - jednakowy dla pozycji i jej obrotu o 180°
+        
+        Returns:
+            Mniejszy z haszy pozycji oryginalnej i obróconej
+        """
+        stones_hash = min(self._stones_hash, self._rotated_hash)
+        if self.current_player == Player.PLAYER2:
+            return stones_hash ^ self._zobrist.side_key
+        return stones_hash
+    
+    def to_canonical_cell(self, cell: int) -> int:
+        """
+        Zamienia pole pomiędzy orientacją pozycji a orientacją haszu kanonicznego
+        
+        Pozycja, której obrót o 180° ma mniejszy hasz, jest zapisywana (np.
+        w książkach otwarć i tablicach końcówek) po obrocie - ruchy zapisane
+        pod haszem kanonicznym trzeba obrócić tak samo. Operacja jest
+        odwrotna do samej siebie (służy też do odczytu zapisanych ruchów).
         
         Args:
-            player: Gracz do sprawdzenia
+            cell: Płaski indeks pola
+        
+        Returns:
+            Płaski indeks pola w drugiej orientacji
+        """
+        if self._rotated_hash < self._stones_hash:
+            return self.topology.rotate(cell)
+        return cell
+    
+    def _reset_connectivity(self) -> None:
+        """
+        Tworzy pustą strukturę zbiorów rozłącznych (union-find)
+        
+        Węzły 0..n²-1 odpowiadają polom planszy (indeks row * n + col),
+        a cztery ostatnie to wirtualne węzły krawędzi: góra, dół, lewo, prawo.
+        Struktura nie kompresuje ścieżek, dzięki czemu każde połączenie
+        można cofnąć w O(1) na podstawie logu. Członkowie każdego zbioru
+        tworzą cykliczną listę (_next_member), więc grupę można wyliczyć
+        w czasie proporcjonalnym do jej rozmiaru.
+        """
+        cells = self.topology.cells
+        self._top = cells
+        self._bottom = cells + 1
+        self._left = cells + 2
+        self._right = cells + 3
+        self._parent = array('H', range(cells + 4))
+        self._set_size = array('H', [1]) * (cells + 4)
+        self._union_log = array('H')  # Pary: dołączony korzeń, nowy korzeń
+        self._undo_marks = array('I')  # Długość logu union-find sprzed każdego ruchu
+        self._next_member = array('H', range(cells + 4))
+    
+    def _find(self, node: int) -> int:
+        """Zwraca reprezentanta zbioru (głębokość O(log n) dzięki łączeniu według rozmiaru)"""
+        parent = self._parent
+        while parent[node] != node:
+            node = parent[node]
+        return node
+    
+    def _union(self, a: int, b: int) -> None:
+        """Łączy zbiory zawierające węzły a i b (łączenie według rozmiaru)"""
+        root_a = self._find(a)
+        root_b = self._find(b)
+        if root_a == root_b:
+            return
+        if self._set_size[root_a] < self._set_size[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._set_size[root_a] += self._set_size[root_b]
+        self._union_log.append(root_b)
+        self._union_log.append(root_a)
+        # Zamiana następników scala dwie listy cykliczne w jedną
+        next_member = self._next_member
+        next_member[root_a], next_member[root_b] = next_member[root_b], next_member[root_a]
+    
+    def _rollback_unions(self, log_mark: int) -> None:
+        """Cofa połączenia union-find wykonane po znaczniku logu"""
+        log = self._union_log
+        while len(log) > log_mark:
+            root = log.pop()
+            child = log.pop()
+            self._parent[child] = child
+            self._set_size[root] -= self._set_size[child]
+            # Ponowna zamiana rozdziela listy cykliczne
+            next_member = self._next_member
+            next_member[root], next_member[child] = next_member[child], next_member[root]
+    
+    def _connect_stone(self, cell: int, player: Player) -> None:
+        """
+        Dołącza nowo postawiony kamień do struktury union-find
+        
+        Args:
+            cell: Płaski indeks kamienia
+            player: Właściciel kamienia
+        """
+        cells = self._cells
+        value = player.value
+        
+        # Połączenie z sąsiednimi kamieniami tego samego gracza
+        for neighbor in self.topology.neighbors[cell]:
+            if cells[neighbor] == value:
+                self._union(cell, neighbor)
+        
+        # Połączenie z wirtualnymi węzłami krawędzi gracza
+        flags = self.topology.edge_flags[cell]
+        if player == Player.PLAYER1:
+            if flags & EDGE_TOP:
+                self._union(cell, self._top)
+            if flags & EDGE_BOTTOM:
+                self._union(cell, self._bottom)
+        else:
+            if flags & EDGE_LEFT:
+                self._union(cell, self._left)
+            if flags & EDGE_RIGHT:
+                self._union(cell, self._right)
+    
+    def _is_connected(self, player: Player) -> bool:
+        """
+        Sprawdza w O(log n) czy gracz połączył swoje krawędzie
+        
+        Korzysta ze struktury union-find aktualizowanej w push_move.
+        """
+        if player == Player.PLAYER1:
+            return self._find(self._top) == self._find(self._bottom)
+        return self._find(self._left) == self._find(self._right)
+    
+    def get_winning_indices(self, player: Optional[Player] = None) -> List[int]:
+        """
+        Zwraca wszystkie pola, na których kamień gracza natychmiast wygrywa
+        
+        Jedno przejście po pustych polach zamiast stawiania kamienia i pełnego
+        sprawdzenia wygranej dla każdego pola: pole wygrywa, jeśli dotyka
+        (bezpośrednio lub przez sąsiednią grupę) obu krawędzi gracza.
+        
+        Args:
+            player: Gracz (domyślnie gracz na ruchu); dla przeciwnika wynik
+                to pola, które trzeba zablokować
             
         Returns:
-            True jeśli gracz wygrał
+            Płaskie indeksy pól w kolejności zbioru pustych pól (pusta lista
+            po zakończeniu gry)
+        """
+        if self.game_state != GameState.IN_PROGRESS:
+            return []
+        return self._winning_cells(player or self.current_player)
+    
+    def _winning_cells(self, player: Player) -> List[int]:
+        """
+        Wyznacza pola wygrywające z list członków grup krawędzi
+        
+        Puste pola przy krawędzi startowej lub grupie z nią połączonej
+        oznaczane są bitem 1, a przy krawędzi końcowej - bitem 2; koszt jest
+        proporcjonalny do rozmiaru tych dwóch grup, a nie całej planszy.
         """
         if player == Player.PLAYER1:
-            # Gracz 1 wygrywa łącząc górę z dołem
-            return self._has_path_top_to_bottom(player)
+            edges = ((self._top, self.topology.top_cells, 1),
+                     (self._bottom, self.topology.bottom_cells, 2))
         else:
-            # Gracz 2 wygrywa łącząc lewo z prawem
-            return self._has_path_left_to_right(player)
-    
-    def _has_path_top_to_bottom(self, player: Player) -> bool:
-        """Sprawdza czy istnieje ścieżka od góry do dołu dla gracza"""
-        visited = [[False for _ in range(self.board_size)] for _ in range(self.board_size)]
-        
-        # Rozpocznij od górnego rzędu
-        for col in range(self.board_size):
-            if self.board[0][col] == player:
-                if self._dfs_vertical(0, col, player, visited):
-                    return True
-        return False
+            edges = ((self._left, self.topology.left_cells, 1),
+                     (self._right, self.topology.right_cells, 2))
+        
+        cells = self._cells
+        total = self.topology.cells
+        neighbors = self.topology.neighbors
+        next_member = self._next_member
+        marks = bytearray(total)
+        for virtual, edge_cells, bit in edges:
+            for cell in edge_cells:
+                if not cells[cell]:
+                    marks[cell] |= bit
+            node = next_member[virtual]
+            while node != virtual:
+                if node < total:
+                    for neighbor in neighbors[node]:
+                        if not cells[neighbor]:
+                            marks[neighbor] |= bit
+                node = next_member[node]
+        return [cell for cell in self._empty_set if marks[cell] == 3]
     
-    def _has_path_left_to_right(self, player: Player) -> bool:
-        """Sprawdza czy istnieje ścieżka od lewej do prawej dla gracza"""
-        visited = [[False for _ in range(self.board_size)] for _ in range(self.board_size)]
+    def _winning_group(self, player: Player) -> List[int]:
+        """
+        Zwraca pola grupy łączącej krawędzie gracza (z listy członków union-find)
         
-        # Rozpocznij od lewej kolumny
-        for row in range(self.board_size):
-            if self.board[row][0] == player:
-                if self._dfs_horizontal(row, 0, player, visited):
-                    return True
-        return False
+        Args:
+            player: Gracz, który połączył swoje krawędzie
+            
+        Returns:
+            Płaskie indeksy kamieni grupy
+        """
+        start = self._top if player == Player.PLAYER1 else self._left
+        cells = self.topology.cells
+        next_member = self._next_member
+        group = []
+        node = next_member[start]
+        while node != start:
+            if node < cells:
+                group.append(node)
+            node = next_member[node]
+        return group
     
-    def _dfs_vertical(self, row: int, col: int, player: Player, visited: List[List[bool]]) -> bool:
-        """DFS dla ścieżki pionowej (góra-dół)"""
-        if row == self.board_size - 1:  # Dotarliśmy do dołu
-            return True
+    def get_winning_chain(self) -> Optional[List[Tuple[int, int]]]:
+        """
+        Zwraca najkrótszy łańcuch zwycięzcy łączący jego krawędzie
         
-        visited[row][col] = True
+        Przeszukiwanie (BFS) ograniczone jest do zwycięskiej grupy wskazanej
+        przez strukturę spójności, więc koszt jest proporcjonalny do jej
+        rozmiaru, a nie do rozmiaru planszy.
         
-        # Sprawdź wszystkich sąsiadów hex
-        for dr, dc in self._get_hex_neighbors():
-            new_row, new_col = row + dr, col + dc
-            if (0 <= new_row < self.board_size and 
-                0 <= new_col < self.board_size and
-                not visited[new_row][new_col] and
-                self.board[new_row][new_col] == player):
-                
-                if self._dfs_vertical(new_row, new_col, player, visited):
-                    return True
+        Returns:
+            Lista (row, col) od krawędzi startowej do końcowej lub None
+            jeśli gra nie ma zwycięzcy
+        """
+        if self.winner is None:
+            return None
         
-        return False
+        player = Player(self.winner)
+        group = set(self._winning_group(player))
+        topology = self.topology
+        if player == Player.PLAYER1:
+            start_edge, end_edge = EDGE_TOP, EDGE_BOTTOM
+        else:
+            start_edge, end_edge = EDGE_LEFT, EDGE_RIGHT
+        
+        previous = {cell: None for cell in group if topology.edge_flags[cell] & start_edge}
+        queue = list(previous)
+        for cell in queue:
+            if topology.edge_flags[cell] & end_edge:
+                chain = []
+                while cell is not None:
+                    chain.append(topology.coords[cell])
+                    cell = previous[cell]
+                chain.reverse()
+                return chain
+            for neighbor in topology.neighbors[cell]:
+                if neighbor in group and neighbor not in previous:
+                    previous[neighbor] = cell
+                    queue.append(neighbor)
+        return None
     
-    def _dfs_horizontal(self, row: int, col: int, player: Player, visited: List[List[bool]]) -> bool:
-        """DFS dla ścieżki poziomej (lewo-prawo)"""
-        if col == self.board_size - 1:  # Dotarliśmy do prawej
-            return True
+    def get_shortest_connection(self, player: Player) -> Optional[List[Tuple[int, int]]]:
+        """
+        Zwraca najkrótsze (w liczbie brakujących kamieni) połączenie krawędzi gracza
         
-        visited[row][col] = True
+        0-1 BFS po planszy: własne kamienie kosztują 0, puste pola 1, pola
+        przeciwnika są zablokowane.
         
-        # Sprawdź wszystkich sąsiadów hex
-        for dr, dc in self._get_hex_neighbors():
-            new_row, new_col = row + dr, col + dc
-            if (0 <= new_row < self.board_size and 
-                0 <= new_col < self.board_size and
-                not visited[new_row][new_col] and
-                self.board[new_row][new_col] == player):
-                
-                if self._dfs_horizontal(new_row, new_col, player, visited):
-                    return True
+        Args:
+            player: Gracz
+            
+        Returns:
+            Lista (row, col) pól ścieżki (kamienie gracza i puste pola do
+            zajęcia) lub None jeśli połączenie jest już niemożliwe
+        """
+        topology = self.topology
+        cells = self._cells
+        value = player.value
+        if player == Player.PLAYER1:
+            starts, end_edge = topology.top_cells, EDGE_BOTTOM
+        else:
+            starts, end_edge = topology.left_cells, EDGE_RIGHT
         
-        return False
+        infinity = topology.cells + 1
+        distance = [infinity] * topology.cells
+        previous = [-1] * topology.cells
+        queue = deque()
+        for cell in starts:
+            if cells[cell] == value:
+                distance[cell] = 0
+                queue.appendleft(cell)
+            elif cells[cell] == Player.NONE.value:
+                distance[cell] = 1
+                queue.append(cell)
+        
+        best = -1
+        while queue:
+            cell = queue.popleft()
+            if topology.edge_flags[cell] & end_edge:
+                best = cell
+                break
+            for neighbor in topology.neighbors[cell]:
+                owner = cells[neighbor]
+                if owner == value:
+                    cost = distance[cell]
+                elif owner == Player.NONE.value:
+                    cost = distance[cell] + 1
+                else:
+                    continue
+                if cost < distance[neighbor]:
+                    distance[neighbor] = cost
+                    previous[neighbor] = cell
+                    if cost == distance[cell]:
+                        queue.appendleft(neighbor)
+                    else:
+                        queue.append(neighbor)
+        
+        if best < 0:
+            return None
+        path = []
+        while best >= 0:
+            path.append(topology.coords[best])
+            best = previous[best]
+        path.reverse()
+        return path
     
-    def _get_hex_neighbors(self) -> List[Tuple[int, int]]:
+    def _check_win(self, player: Player) -> bool:
         """
-        Zwraca listę przesunięć dla sąsiadów w siatce hex
+        Sprawdza czy dany gracz wygrał pełnym przeszukaniem planszy
         
+        Nie korzysta ze struktury union-find, więc działa także dla planszy
+        zmodyfikowanej z pominięciem push_move. Przeszukiwanie jest iteracyjne,
+        więc długie łańcuchy na dużych planszach nie zbliżają się do limitu
+        rekursji Pythona.
+        
+        Args:
+            player: Gracz do sprawdzenia
+            
         Returns:
-            Lista krotek (delta_row, delta_col) dla 6 kierunków
+            True jeśli gracz wygrał
         """
-        return [(-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0)]
+        topology = self.topology
+        cells = self._cells
+        value = player.value
+        neighbors = topology.neighbors
+        edge_flags = topology.edge_flags
+        visited = bytearray(topology.cells)
+        
+        # Punkty startowe: własne kamienie na pierwszej krawędzi gracza
+        if player == Player.PLAYER1:
+            starts, target = topology.top_cells, EDGE_BOTTOM
+        else:
+            starts, target = topology.left_cells, EDGE_RIGHT
+        stack = [cell for cell in starts if cells[cell] == value]
+        for cell in stack:
+            visited[cell] = 1
+        
+        # Iteracyjny DFS z jawnym stosem po tablicach sąsiedztwa
+        while stack:
+            cell = stack.pop()
+            if edge_flags[cell] & target:
+                return True
+            for neighbor in neighbors[cell]:
+                if not visited[neighbor] and cells[neighbor] == value:
+                    visited[neighbor] = 1
+                    stack.append(neighbor)
+        
+        return False
     
     def _is_board_full(self) -> bool:
         """Sprawdza czy plansza jest pełna"""
-        for row in self.board:
-            for cell in row:
-                if cell == Player.NONE:
-                    return False
-        return True
+        return len(self._empty_set) == 0
     
     def get_empty_cells(self) -> List[Tuple[int, int]]:
         """
-        Zwraca listę pustych pól
+        Zwraca listę pustych pól (bez skanowania planszy)
+        
+        Kolejność wynika z indeksowanego zbioru pustych pól i nie jest
+        wierszowa, ale jest deterministyczna dla danej historii ruchów.
         
         Returns:
             Lista krotek (row, col) z pustymi polami
         """
-        empty_cells = []
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                if self.board[row][col] == Player.NONE:
-                    empty_cells.append((row, col))
-        return empty_cells
+        coords = self.topology.coords
+        return [coords[cell] for cell in self._empty_set]
+    
+    def get_empty_indices(self) -> List[int]:
+        """Zwraca listę płaskich indeksów pustych pól (kopia, bez skanowania)"""
+        return self._empty_set.to_list()
+    
+    def get_empty_count(self) -> int:
+        """Zwraca liczbę pustych pól w O(1)"""
+        return len(self._empty_set)
+    
+    def is_empty_cell(self, row: int, col: int) -> bool:
+        """Sprawdza w O(1) czy pole (w granicach planszy) jest puste"""
+        return (row * self.board_size + col) in self._empty_set
+    
+    def random_empty_cell(self, rng: Optional[random.Random] = None) -> Tuple[int, int]:
+        """
+        Zwraca losowe puste pole w O(1)
+        
+        Args:
+            rng: Generator liczb losowych (domyślnie moduł random)
+            
+        Returns:
+            Krotka (row, col)
+        """
+        return self.topology.coords[self._empty_set.sample(rng)]
     
     def get_game_info(self) -> Dict[str, Any]:
         """
@@ -223,8 +676,8 @@ class HexEngine:
             'current_player': self.current_player.value,
             'game_state': self.game_state.value,
             'winner': self.winner,
-            'moves_count': len(self.moves),
-            'empty_cells_count': len(self.get_empty_cells())
+            'moves_count': len(self._moves),
+            'empty_cells_count': len(self._empty_set)
         }
     
     def to_dict(self) -> Dict[str, Any]:
@@ -236,9 +689,10 @@ class HexEngine:
         """
         return {
             'board_size': self.board_size,
+            'backend': self.BACKEND,
             'board': self.get_board_state(),
             'current_player': self.current_player.value,
-            'moves': self.moves.copy(),
+            'moves': self.moves,
             'game_state': self.game_state.value,
             'winner': self.winner
         }
@@ -251,15 +705,92 @@ class HexEngine:
             data: Słownik ze stanem gry
         """
         self.board_size = data['board_size']
+        self.topology = get_topology(self.board_size)
+        self._zobrist = get_zobrist_table(self.board_size)
+        self.current_player = Player.PLAYER1
+        self.game_state = GameState.IN_PROGRESS
+        self.winner = None
+        
+        # Odtwórz planszę na podstawie ruchów (razem z historią cofania)
+        self._reset_board()
+        for row, col, player_value in data['moves']:
+            self.push_move(row, col, Player(player_value))
+        
         self.current_player = Player(data['current_player'])
-        self.moves = data['moves'].copy()
         self.game_state = GameState(data['game_state'])
         self.winner = data['winner']
+    
+    def _state_slots(self) -> Tuple[str, ...]:
+        """Zwraca nazwy ustawionych pól stanu (bez współdzielonych tablic rozmiaru)"""
+        cls = type(self)
+        names = _STATE_SLOTS.get(cls)
+        if names is None:
+            names = tuple(
+                name
+                for klass in reversed(cls.__mro__)
+                for name in klass.__dict__.get('__slots__', ())
+                if name not in _SHARED_SLOTS
+            )
+            _STATE_SLOTS[cls] = names
+        return tuple(name for name in names if hasattr(self, name))
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Zwraca niezależną, kompaktową kopię stanu silnika
+        
+        Kopiowane są tylko tablice planszy, historii i spójności (bez
+        odtwarzania ruchów); topologia i klucze Zobrista są współdzielone
+        i odtwarzane po rozmiarze planszy. Migawka nadaje się do pickle.
+        
+        Returns:
+            Słownik pól stanu
+        """
+        state = {}
+        for name in self._state_slots():
+            value = getattr(self, name)
+            state[name] = _copy_state(value)
+        return state
+    
+    def restore(self, state: Dict[str, Any]) -> None:
+        """
+        Przywraca stan silnika z migawki (migawka pozostaje niezmieniona)
         
-        # Odtwórz planszę na podstawie ruchów
-        self.board = [[Player.NONE for _ in range(self.board_size)] for _ in range(self.board_size)]
-        for row, col, player_value in self.moves:
-            self.board[row][col] = Player(player_value)
+        Args:
+            state: Słownik zwrócony przez snapshot()
+        """
+        for name, value in state.items():
+            setattr(self, name, _copy_state(value))
+        self.topology = get_topology(self.board_size)
+        self._zobrist = get_zobrist_table(self.board_size)
+    
+    def fork(self) -> 'HexEngine':
+        """
+        Tworzy niezależną kopię silnika (tego samego backendu)
+        
+        Kopiowanie jest liniowe względem rozmiaru tablic i nie odtwarza
+        historii ruchów - w przeciwieństwie do to_dict() + from_dict().
+        Kopia zachowuje historię cofania (pop_move).
+        
+        Returns:
+            Nowy silnik w tym samym stanie
+        """
+        clone = object.__new__(type(self))
+        for name, value in self.snapshot().items():
+            setattr(clone, name, value)
+        clone.topology = self.topology
+        clone._zobrist = self._zobrist
+        return clone
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickle przesyła tylko tablice stanu - tablice rozmiaru planszy
+        # pobierane są z cache po stronie odbiorcy (np. w procesie roboczym)
+        return {name: getattr(self, name) for name in self._state_slots()}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.topology = get_topology(self.board_size)
+        self._zobrist = get_zobrist_table(self.board_size)
     
     def save_to_file(self, filename: str) -> None:
         """
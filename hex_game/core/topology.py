@@ -0,0 +1,160 @@
+"""
+Topologia planszy HEX - tablice sąsiedztwa budowane raz na rozmiar planszy
+
+Wszystkie silniki danego rozmiaru współdzielą jeden obiekt HexTopology, a
+kod silnika i AI posługuje się płaskimi indeksami pól (row * n + col), bez
+alokowania krotek i ręcznego sprawdzania granic w pętlach wewnętrznych.
+"""
+
+from typing import Dict, List, Tuple
+
+
+# Flagi krawędzi (maski bitowe w edge_flags)
+EDGE_TOP = 1
+EDGE_BOTTOM = 2
+EDGE_LEFT = 4
+EDGE_RIGHT = 8
+
+# Przesunięcia sąsiadów w kolejności obwodowej (kolejne pozycje sąsiadują ze sobą)
+RING_OFFSETS: Tuple[Tuple[int, int], ...] = ((-1, 0), (-1, 1), (0, 1), (1, 0), (1, -1), (0, -1))
+
+# Mostki: (przesunięcie celu, przesunięcia dwóch wspólnych sąsiadów - nośników)
+BRIDGE_OFFSETS: Tuple[Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]], ...] = (
+    ((-2, 1), (-1, 0), (-1, 1)),
+    ((-1, 2), (-1, 1), (0, 1)),
+    ((1, 1), (0, 1), (1, 0)),
+    ((2, -1), (1, 0), (1, -1)),
+    ((1, -2), (1, -1), (0, -1)),
+    ((-1, -1), (0, -1), (-1, 0)),
+)
+
+
+class HexTopology:
+    """
+    Niezmienne tablice sąsiedztwa dla planszy board_size x board_size
+    
+    Atrybuty:
+        neighbors: Dla każdego pola krotka indeksów sąsiadów na planszy
+        ring: Dla każdego pola 6 pozycji obwodu; poza planszą wartość
+            ujemna -EDGE_* oznacza krawędź, do której należy pozycja
+        edge_flags: Flagi EDGE_* krawędzi, których dotyka pole
+        bridges: Dla każdego pola krotki (cel, nośnik_a, nośnik_b)
+        edge_templates: Dla każdego pola krotki (EDGE_*, nośnik_a, nośnik_b)
+            - mostek do krawędzi z drugiego rzędu
+        coords: Dla każdego pola krotka (row, col)
+    """
+    
+    def __init__(self, board_size: int):
+        """
+        Buduje tablice dla danego rozmiaru planszy
+        
+        Args:
+            board_size: Rozmiar planszy
+        """
+        size = board_size
+        cells = size * size
+        
+        self.board_size = size
+        self.cells = cells
+        self.coords: Tuple[Tuple[int, int], ...] = tuple(divmod(cell, size) for cell in range(cells))
+        
+        def on_board(row: int, col: int) -> bool:
+            return 0 <= row < size and 0 <= col < size
+        
+        ring: List[Tuple[int, ...]] = []
+        neighbors: List[Tuple[int, ...]] = []
+        bridges: List[Tuple[Tuple[int, int, int], ...]] = []
+        edge_flags = bytearray(cells)
+        
+        for cell, (row, col) in enumerate(self.coords):
+            positions = []
+            for dr, dc in RING_OFFSETS:
+                new_row, new_col = row + dr, col + dc
+                if on_board(new_row, new_col):
+                    positions.append(new_row * size + new_col)
+                elif not 0 <= new_row < size:
+                    positions.append(-(EDGE_TOP if new_row < 0 else EDGE_BOTTOM))
+                else:
+                    positions.append(-(EDGE_LEFT if new_col < 0 else EDGE_RIGHT))
+            ring.append(tuple(positions))
+            neighbors.append(tuple(p for p in positions if p >= 0))
+            
+            flags = 0
+            for p in positions:
+                if p < 0:
+                    flags |= -p
+            edge_flags[cell] = flags
+            
+            cell_bridges = []
+            for (tr, tc), (ar, ac), (br, bc) in BRIDGE_OFFSETS:
+                if on_board(row + tr, col + tc):
+                    cell_bridges.append(((row + tr) * size + col + tc,
+                                         (row + ar) * size + col + ac,
+                                         (row + br) * size + col + bc))
+            bridges.append(tuple(cell_bridges))
+        
+        self.ring: Tuple[Tuple[int, ...], ...] = tuple(ring)
+        self.neighbors: Tuple[Tuple[int, ...], ...] = tuple(neighbors)
+        self.edge_flags = bytes(edge_flags)
+        self.bridges: Tuple[Tuple[Tuple[int, int, int], ...], ...] = tuple(bridges)
+        
+        # Mostki do krawędzi: pole w drugim rzędzie/kolumnie i dwa pola krawędzi
+        templates: List[List[Tuple[int, int, int]]] = [[] for _ in range(cells)]
+        if size >= 3:
+            for i in range(size - 1):
+                # Góra: (1, c) przez (0, c) i (0, c+1)
+                templates[size + i].append((EDGE_TOP, i, i + 1))
+                # Dół: (n-2, c) przez (n-1, c-1) i (n-1, c)
+                bottom = (size - 2) * size + i + 1
+                templates[bottom].append((EDGE_BOTTOM, bottom + size - 1, bottom + size))
+                # Lewo: (r, 1) przez (r, 0) i (r+1, 0)
+                templates[i * size + 1].append((EDGE_LEFT, i * size, (i + 1) * size))
+                # Prawo: (r, n-2) przez (r, n-1) i (r-1, n-1)
+                right = (i + 1) * size + size - 2
+                templates[right].append((EDGE_RIGHT, right + 1, right + 1 - size))
+        self.edge_templates: Tuple[Tuple[Tuple[int, int, int], ...], ...] = tuple(
+            tuple(t) for t in templates)
+        
+        # Listy i maski bitowe pól przy krawędziach
+        self.top_cells = tuple(range(size))
+        self.bottom_cells = tuple(range(cells - size, cells))
+        self.left_cells = tuple(range(0, cells, size))
+        self.right_cells = tuple(range(size - 1, cells, size))
+        self.full_mask = (1 << cells) - 1
+        self.top_mask = sum(1 << cell for cell in self.top_cells)
+        self.bottom_mask = sum(1 << cell for cell in self.bottom_cells)
+        self.left_mask = sum(1 << cell for cell in self.left_cells)
+        self.right_mask = sum(1 << cell for cell in self.right_cells)
+    
+    def index(self, row: int, col: int) -> int:
+        """Zwraca płaski indeks pola"""
+        return row * self.board_size + col
+    
+    def rotate(self, cell: int) -> int:
+        """Zwraca indeks pola po obrocie planszy o 180°"""
+        return self.cells - 1 - cell
+    
+    def __reduce__(self):
+        # Przy serializacji przesyłany jest tylko rozmiar - tablice są
+        # odtwarzane (lub pobierane z cache) po stronie odbiorcy
+        return (get_topology, (self.board_size,))
+
+
+_TOPOLOGIES: Dict[int, HexTopology] = {}
+
+
+def get_topology(board_size: int) -> HexTopology:
+    """
+    Zwraca wspólną topologię dla danego rozmiaru planszy (budowaną raz)
+    
+    Args:
+        board_size: Rozmiar planszy
+    
+    Returns:
+        Obiekt HexTopology
+    """
+    topology = _TOPOLOGIES.get(board_size)
+    if topology is None:
+        topology = HexTopology(board_size)
+        _TOPOLOGIES[board_size] = topology
+    return topology
@@ -0,0 +1,68 @@
+"""
+Haszowanie Zobrista pozycji HEX
+
+Tablice losowych kluczy 64-bitowych generowane są raz dla każdego rozmiaru
+planszy z deterministycznego ziarna, więc hasze są identyczne pomiędzy
+procesami i uruchomieniami (można je zapisywać na dysku).
+"""
+
+import random
+from typing import Dict, List
+
+
+class ZobristTable:
+    """Klucze Zobrista dla jednego rozmiaru planszy"""
+    
+    def __init__(self, board_size: int):
+        """
+        Generuje klucze dla planszy board_size x board_size
+        
+        Args:
+            board_size: Rozmiar planszy
+        """
+        rng = random.Random(f"hex-zobrist-{board_size}")
+        cells = board_size * board_size
+        
+        self.board_size = board_size
+        # keys[player_value][cell] - indeks 0 (puste pole) nie jest używany
+        self.keys: List[List[int]] = [
+            [0] * cells,
+            [rng.getrandbits(64) for _ in range(cells)],
+            [rng.getrandbits(64) for _ in range(cells)],
+        ]
+        # Klucz strony na ruchu (XOR gdy ruch ma gracz 2)
+        self.side_key = rng.getrandbits(64)
+    
+    def key(self, player_value: int, cell: int) -> int:
+        """Zwraca klucz kamienia gracza na polu o indeksie cell"""
+        return self.keys[player_value][cell]
+    
+    def rotated_key(self, player_value: int, cell: int) -> int:
+        """
+        Zwraca klucz kamienia po obrocie planszy o 180°
+        
+        Obrót (row, col) -> (n-1-row, n-1-col) to w indeksach płaskich
+        cell -> n²-1-cell; zachowuje krawędzie obu graczy.
+        """
+        keys = self.keys[player_value]
+        return keys[len(keys) - 1 - cell]
+
+
+_TABLES: Dict[int, ZobristTable] = {}
+
+
+def get_zobrist_table(board_size: int) -> ZobristTable:
+    """
+    Zwraca (wspólną) tablicę kluczy dla danego rozmiaru planszy
+    
+    Args:
+        board_size: Rozmiar planszy
+    
+    Returns:
+        Tablica kluczy Zobrista
+    """
+    table = _TABLES.get(board_size)
+    if table is None:
+        table = ZobristTable(board_size)
+        _TABLES[board_size] = table
+    return table
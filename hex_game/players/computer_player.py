@@ -3,183 +3,286 @@
 Gracz komputer - wykonuje ruchy automatycznie
 """
 
-import random
-from typing import Tuple, List
+import time
+from typing import Tuple, List, Optional
 from .base_player import BasePlayer
 from ..core.engine import HexEngine, Player
+from ..ai.parallel import create_search
+from ..ai.alphabeta import AlphaBetaSearch
+from ..ai.solver import ProofNumberSolver
+from ..ai.tablebase import get_tablebase
+from ..ai.book import get_opening_book
+from ..ai.cache import get_ai_cache
+from ..ai.scoring import best_cell, center_map, score_cells
+from ..ai.ponder import PonderTask, start_pondering
+
+
+DIFFICULTIES = ('easy', 'medium', 'hard', 'advanced', 'expert')
+
+# Poziomy rozgrywające pozycje rozstrzygnięte dokładnie (hex_game.ai.tablebase
+# dla plansz 3x3-5x5, hex_game.ai.solver dla końcówek) i limity rozwiązywania:
+# (maks. liczba pustych pól na planszach do 7x7, czas jednej próby [s]).
+# 'hard' próbuje tylko końcówek rozwiązywanych w milisekundach.
+SOLVER_DIFFICULTIES = ('hard', 'advanced', 'expert')
+SOLVER_LIMITS = {
+    'hard': (16, 0.02),
+    'advanced': (20, 0.25),
+    'expert': (25, 0.5),
+}
+
+# Poziomy korzystające z książek otwarć (hex_game.ai.book) zamiast przeszukiwania
+BOOK_DIFFICULTIES = ('advanced', 'expert')
+
+
+def _expired(deadline: Optional[float]) -> bool:
+    """Sprawdza czy minął termin (czas time.perf_counter(); None = bez limitu)"""
+    return deadline is not None and time.perf_counter() >= deadline
 
 
 class ComputerPlayer(BasePlayer):
     """Gracz komputer z różnymi poziomami trudności"""
     
-    def __init__(self, name: str, difficulty: str = "easy"):
+    def __init__(self, name: str, difficulty: str = "easy",
+                 time_limit: Optional[float] = None, playouts: Optional[int] = None,
+                 workers: Optional[int] = None):
         """
         Inicjalizuje gracza komputerowego
         
         Args:
             name: Nazwa gracza
-            difficulty: Poziom trudności ('easy', 'medium', 'hard')
+            difficulty: Poziom trudności ('easy', 'medium', 'hard', 'advanced', 'expert')
+            time_limit: Budżet czasu na ruch w sekundach (poziomy 'advanced' i 'expert')
+            playouts: Budżet rozgrywek losowych na ruch (poziom 'expert')
+            workers: Liczba procesów przeszukiwania (poziom 'expert'; domyślnie
+                z hex_game.ai.parallel.configure_workers)
         """
         super().__init__(name)
         self.difficulty = difficulty.lower()
         
-        if self.difficulty not in ['easy', 'medium', 'hard']:
-            raise ValueError("Dostępne poziomy trudności: easy, medium, hard")
+        if self.difficulty not in DIFFICULTIES:
+            raise ValueError(f"Dostępne poziomy trudności: {', '.join(DIFFICULTIES)}")
+        
+        # Przeszukiwanie: alfa-beta ('advanced') lub MCTS ('expert', równoległe przy workers > 1)
+        self._search = None
+        if self.difficulty == "advanced":
+            self._search = AlphaBetaSearch(time_limit=time_limit)
+        elif self.difficulty == "expert":
+            self._search = create_search(workers, playouts=playouts, time_limit=time_limit)
+        self._ponder_task: Optional[PonderTask] = None
+        
+        # Rozwiązywanie końcówek (tablica rozwiązanych pozycji na całą partię)
+        self._solver: Optional[ProofNumberSolver] = None
+        if self.difficulty in SOLVER_DIFFICULTIES:
+            max_empty, solver_seconds = SOLVER_LIMITS[self.difficulty]
+            self._solver = ProofNumberSolver(max_empty, time_limit=solver_seconds,
+                                             scale_with_board=True)
+        
+        # Ocena ostatniego ruchu (skala zależna od poziomu; None = brak oceny)
+        # i czy pochodził ze wspólnej pamięci wyników (hex_game.ai.cache)
+        self.last_score: Optional[float] = None
+        self.last_cached = False
+    
+    @property
+    def budget(self) -> Optional[Tuple]:
+        """Budżet przeszukiwania na ruch (część klucza pamięci wyników)"""
+        if self._search is None:
+            return None
+        return (self._search.time_limit, getattr(self._search, 'playouts', None),
+                getattr(self._search, 'workers', 1))
     
-    def get_move(self, engine: HexEngine) -> Tuple[int, int]:
+    @property
+    def can_ponder(self) -> bool:
+        """Czy poziom zachowuje drzewo przeszukiwania i może myśleć w tle"""
+        return hasattr(self._search, 'ponder')
+    
+    def start_pondering(self, engine: HexEngine) -> bool:
+        """
+        Rozpoczyna przeszukiwanie w czasie ruchu przeciwnika
+        
+        Args:
+            engine: Silnik w pozycji po ruchu komputera (kopiowany)
+        
+        Returns:
+            True jeśli przeszukiwanie w tle zostało uruchomione
+        """
+        self.stop_pondering()
+        if not self.can_ponder or engine.get_empty_count() == 0 or engine.winner is not None:
+            return False
+        self._ponder_task = start_pondering(self._search, engine.fork())
+        return self._ponder_task is not None
+    
+    def stop_pondering(self) -> None:
+        """Zatrzymuje przeszukiwanie w tle (drzewo zostaje zachowane)"""
+        if self._ponder_task is not None:
+            self._ponder_task.stop()
+            self._ponder_task = None
+    
+    def release_memory(self) -> None:
+        """
+        Zatrzymuje przeszukiwanie w tle i zwalnia stan zachowany pomiędzy ruchami
+        
+        Porzucane są drzewo MCTS, tablica transpozycji alfa-beta i tablica
+        rozwiązywania końcówek - kolejny ruch liczony jest od zera.
+        """
+        self.stop_pondering()
+        if self.can_ponder:
+            self._search.reset_tree()
+        elif isinstance(self._search, AlphaBetaSearch):
+            self._search.reset_tables()
+        if self._solver is not None:
+            self._solver.reset_table()
+    
+    def get_move(self, engine: HexEngine, deadline: Optional[float] = None) -> Tuple[int, int]:
         """
         Zwraca ruch komputera
         
+        Wszystkie poziomy działają w trybie anytime: najpierw wyznaczają tani
+        ruch zapasowy, a następnie go poprawiają aż do upływu terminu.
+        Wyniki poziomów innych niż 'easy' są współdzielone przez wszystkie
+        sesje procesu (hex_game.ai.cache) - ruch wyznaczony po upływie
+        terminu nie jest zapamiętywany.
+        
         Args:
             engine: Silnik gry
+            deadline: Termin zwrócenia ruchu jako czas time.perf_counter()
+                (None = bez limitu)
             
         Returns:
             Krotka (row, col) z ruchem
         """
-        empty_cells = engine.get_empty_cells()
-        
-        if not empty_cells:
+        if engine.get_empty_count() == 0:
             raise ValueError("Brak dostępnych ruchów")
+        self.stop_pondering()
         
+        self.last_score = None
+        self.last_cached = False
         if self.difficulty == "easy":
-            return self._get_random_move(empty_cells)
-        elif self.difficulty == "medium":
-            return self._get_medium_move(engine, empty_cells)
-        else:  # hard
-            return self._get_hard_move(engine, empty_cells)
+            return self._get_random_move(engine)
+        
+        cache = get_ai_cache()
+        budget = self.budget
+        cached = cache.lookup(engine, self.difficulty, budget)
+        if cached is not None:
+            cell, self.last_score = cached
+            self.last_cached = True
+            return engine.topology.coords[cell]
+        
+        cell = self._choose_cell(engine, deadline)
+        if not _expired(deadline):
+            cache.store(engine, self.difficulty, budget, cell, self.last_score)
+        return engine.topology.coords[cell]
     
-    def _get_random_move(self, empty_cells: List[Tuple[int, int]]) -> Tuple[int, int]:
+    def _choose_cell(self, engine: HexEngine, deadline: Optional[float] = None) -> int:
+        """Wyznacza ruch poziomu (bez pamięci wyników) jako płaski indeks pola"""
+        # Pozycja z tablicy końcówek - ruch optymalny bez przeszukiwania
+        tablebase = get_tablebase(engine.board_size) if self._solver is not None else None
+        if tablebase is not None:
+            entry = tablebase.probe(engine)
+            if entry is not None and entry[1] is not None:
+                return entry[1]
+        
+        # Pozycja z książki otwarć - ruch bez przeszukiwania
+        book = get_opening_book(engine.board_size) if self.difficulty in BOOK_DIFFICULTIES else None
+        if book is not None:
+            cell = book.lookup(engine)
+            if cell is not None:
+                return cell
+        
+        # Końcówka udowodniona jako wygrana - ruch wygrywający bez heurystyk;
+        # przegrana lub nierozstrzygnięta pozycja - zwykły ruch poziomu
+        if self._solver is not None and self._solver.can_solve(engine) and not _expired(deadline):
+            cell = self._solver.best_move(engine, deadline)
+            if cell is not None:
+                return cell
+        
+        # Poziomy heurystyczne oceniają wszystkie puste pola (analiza pól gorszych
+        # kosztowałaby więcej niż sama ocena); przeszukiwania filtrują ruchy same
+        empty_cells = engine.get_empty_indices()
+        
+        if self.difficulty == "medium":
+            cell = self._get_medium_move(engine, empty_cells, deadline)
+        elif self.difficulty == "hard":
+            cell = self._get_hard_move(engine, empty_cells, deadline)
+        else:  # advanced, expert
+            cell = self._get_search_move(engine, empty_cells, deadline)
+        
+        return cell
+    
+    def _get_random_move(self, engine: HexEngine) -> Tuple[int, int]:
         """Losowy ruch"""
-        return random.choice(empty_cells)
+        return engine.random_empty_cell()
     
-    def _get_medium_move(self, engine: HexEngine, empty_cells: List[Tuple[int, int]]) -> Tuple[int, int]:
+    def _get_center_move(self, engine: HexEngine, empty_cells: List[int]) -> int:
+        """Zwraca wolne pole najbliższe środka planszy (tani ruch zapasowy)"""
+        return best_cell(empty_cells, center_map(engine.board_size))
+    
+    def _get_medium_move(self, engine: HexEngine, empty_cells: List[int],
+                         deadline: Optional[float] = None) -> int:
         """
         Ruch średnio zaawansowany - preferuje środek planszy i blokuje przeciwnika
         """
+        # Ruch zapasowy: pole bliżej środka
+        best_move = self._get_center_move(engine, empty_cells)
+        
         # Sprawdź czy można wygrać w tym ruchu
-        winning_move = self._find_winning_move(engine, empty_cells)
-        if winning_move:
+        winning_move = self._find_winning_move(engine)
+        if winning_move is not None:
             return winning_move
         
         # Sprawdź czy trzeba zablokować przeciwnika
-        blocking_move = self._find_blocking_move(engine, empty_cells)
-        if blocking_move:
+        blocking_move = self._find_blocking_move(engine)
+        if blocking_move is not None:
             return blocking_move
         
-        # W przeciwnym razie wybierz ruch bliżej środka
-        center = engine.board_size // 2
-        empty_cells.sort(key=lambda pos: abs(pos[0] - center) + abs(pos[1] - center))
-        
-        return empty_cells[0]
+        return best_move
     
-    def _get_hard_move(self, engine: HexEngine, empty_cells: List[Tuple[int, int]]) -> Tuple[int, int]:
+    def _get_hard_move(self, engine: HexEngine, empty_cells: List[int],
+                       deadline: Optional[float] = None) -> int:
         """
         Ruch zaawansowany - używa prostej oceny pozycji
         """
+        # Ruch zapasowy na wypadek upływu terminu przed oceną ruchów
+        fallback = self._get_center_move(engine, empty_cells)
+        
         # Sprawdź czy można wygrać
-        winning_move = self._find_winning_move(engine, empty_cells)
-        if winning_move:
+        winning_move = self._find_winning_move(engine)
+        if winning_move is not None:
             return winning_move
         
         # Sprawdź czy trzeba zablokować
-        blocking_move = self._find_blocking_move(engine, empty_cells)
-        if blocking_move:
+        blocking_move = self._find_blocking_move(engine)
+        if blocking_move is not None:
             return blocking_move
         
-        # Oceń wszystkie możliwe ruchy
-        best_move = None
-        best_score = -float('inf')
-        
-        for move in empty_cells:
-            score = self._evaluate_move(engine, move)
-            if score > best_score:
-                best_score = score
-                best_move = move
-        
-        return best_move if best_move else random.choice(empty_cells)
+        # Oceń wszystkie możliwe ruchy naraz (hex_game.ai.scoring)
+        if _expired(deadline):
+            return fallback
+        scores = score_cells(engine, engine.current_player)
+        cell = best_cell(empty_cells, scores)
+        self.last_score = float(scores[cell])
+        return cell
     
-    def _find_winning_move(self, engine: HexEngine, empty_cells: List[Tuple[int, int]]) -> Tuple[int, int]:
-        """Znajduje ruch wygrywający jeśli istnieje"""
-        current_player = engine.current_player
-        
-        for move in empty_cells:
-            # Symuluj ruch
-            engine.board[move[0]][move[1]] = current_player
-            
-            # Sprawdź czy wygrywa
-            if engine._check_win(current_player):
-                # Cofnij ruch
-                engine.board[move[0]][move[1]] = Player.NONE
-                return move
-            
-            # Cofnij ruch
-            engine.board[move[0]][move[1]] = Player.NONE
+    def _get_search_move(self, engine: HexEngine, empty_cells: List[int],
+                         deadline: Optional[float] = None) -> int:
+        """
+        Ruch z przeszukiwania - alfa-beta ('advanced') lub drzewa Monte Carlo ('expert')
+        """
+        # Ruch wygrywający nie wymaga przeszukiwania
+        winning_move = self._find_winning_move(engine)
+        if winning_move is not None:
+            return winning_move
         
-        return None
+        cell = self._search.search(engine, deadline)
+        self.last_score = float(self._search.last_score)
+        return cell
     
-    def _find_blocking_move(self, engine: HexEngine, empty_cells: List[Tuple[int, int]]) -> Tuple[int, int]:
-        """Znajduje ruch blokujący przeciwnika"""
-        opponent = Player.PLAYER2 if engine.current_player == Player.PLAYER1 else Player.PLAYER1
-        
-        for move in empty_cells:
-            # Symuluj ruch przeciwnika
-            engine.board[move[0]][move[1]] = opponent
-            
-            # Sprawdź czy przeciwnik by wygrał
-            would_win = engine._check_win(opponent)
-            
-            # Cofnij ruch
-            engine.board[move[0]][move[1]] = Player.NONE
-            
-            if would_win:
-                return move
-        
-        return None
+    def _find_winning_move(self, engine: HexEngine) -> Optional[int]:
+        """Znajduje ruch wygrywający jeśli istnieje (jedno przejście detektora silnika)"""
+        winning = engine.get_winning_indices(engine.current_player)
+        return winning[0] if winning else None
     
-    def _evaluate_move(self, engine: HexEngine, move: Tuple[int, int]) -> float:
-        """
-        Ocenia jakość ruchu
-        
-        Args:
-            engine: Silnik gry
-            move: Ruch do oceny
-            
-        Returns:
-            Ocena ruchu (wyższa = lepsza)
-        """
-        row, col = move
-        score = 0.0
-        
-        # Bonus za bliskość do celu
-        if engine.current_player == Player.PLAYER1:
-            # Gracz 1 chce łączyć góra-dół
-            # Bonus za bycie w środkowych kolumnach
-            center_col = engine.board_size // 2
-            score += 10 - abs(col - center_col)
-            
-            # Bonus za połączenie z góra lub dołem
-            if row == 0 or row == engine.board_size - 1:
-                score += 15
-        else:
-            # Gracz 2 chce łączyć lewo-prawo
-            # Bonus za bycie w środkowych rzędach
-            center_row = engine.board_size // 2
-            score += 10 - abs(row - center_row)
-            
-            # Bonus za połączenie z lewą lub prawą
-            if col == 0 or col == engine.board_size - 1:
-                score += 15
-        
-        # Bonus za sąsiedztwo z własnymi pionami
-        current_player = engine.current_player
-        neighbors = 0
-        for dr, dc in engine._get_hex_neighbors():
-            new_row, new_col = row + dr, col + dc
-            if (0 <= new_row < engine.board_size and 
-                0 <= new_col < engine.board_size and
-                engine.board[new_row][new_col] == current_player):
-                neighbors += 1
-        
-        score += neighbors * 5
-        
-        return score
\ No newline at end of file
+    def _find_blocking_move(self, engine: HexEngine) -> Optional[int]:
+        """Znajduje ruch blokujący natychmiastową wygraną przeciwnika"""
+        opponent = Player.PLAYER2 if engine.current_player == Player.PLAYER1 else Player.PLAYER1
+        threats = engine.get_winning_indices(opponent)
+        return threats[0] if threats else None
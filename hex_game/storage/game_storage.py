@@ -8,6 +8,7 @@ import json
 import os
 from datetime import datetime
 from ..core.engine import HexEngine
+from ..core.backends import engine_from_dict
 
 
 class GameStorage(ABC):
@@ -57,9 +58,7 @@ class MemoryStorage(GameStorage):
             return None
         
         try:
-            engine = HexEngine()
-            engine.from_dict(self._games[game_id]['data'])
-            return engine
+            return engine_from_dict(self._games[game_id]['data'])
         except Exception:
             return None
     
@@ -111,9 +110,7 @@ class FileStorage(GameStorage):
             with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
-            engine = HexEngine()
-            engine.from_dict(data['game_data'])
-            return engine
+            return engine_from_dict(data['game_data'])
         except Exception:
             return None
     